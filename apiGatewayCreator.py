@@ -6,19 +6,52 @@ Este módulo proporciona herramientas para crear recursos, métodos HTTP y
 configurar integración con VPC Link y autenticación Cognito en AWS API Gateway.
 """
 
+import argparse
+import base64
 import configparser
+import importlib.util
 import json
 import os
 import re
 import subprocess
 import sys
-import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    # orjson es opcional: parsea y serializa JSON bastante más rápido
+    from orjson import dumps as json_dumps_bytes, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+_CAMEL_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+_METHOD_CHOICES_RE = re.compile(r'^\s*\d+\s*(?:,\s*\d+\s*)*$')
+_HTTP_METHODS = ('GET', 'POST', 'PUT', 'DELETE', 'PATCH')
+_HTTP_METHOD_EMOJIS = {'GET': '📥', 'POST': '📤', 'PUT': '✏️', 'DELETE': '🗑️', 'PATCH': '🔧'}
+_HTTP_METHOD_INDICES = frozenset(range(len(_HTTP_METHODS)))
+_REST_API_SUMMARY_QUERY = "items[].{id: id, name: name}"
+_ENV_SUFFIXES = frozenset(('CI', 'DEV', 'PROD'))
+# Máximo permitido por API Gateway (por defecto 25): menos páginas por listado
+_PAGE_SIZES = {"get_rest_apis": 500, "get_resources": 500}
+_REST_APIS_CACHE_FILE = "rest-apis.json"
+_VALIDATED_PROFILES_FILE = "validated-profiles.json"
+_COMPILED_CONFIG_FILE = "config.json"
+_THROTTLING_ERROR_CODES = frozenset(("TooManyRequestsException", "ThrottlingException"))
+_CLI_ERROR_CODE_RE = re.compile(r'An error occurred \((\w+)\)')
 
 # Importar módulos de integración con Lambda
-from endpoint_creator_lambda import create_endpoint_via_lambda
+from endpoint_creator_lambda import create_endpoint_via_lambda, create_endpoints_batch
 from lambda_client import get_lambda_client
 
 # Importar módulos de soporte refactorizados
@@ -32,10 +65,21 @@ from common import (
     CONFIG_CONNECTION_TYPE,
     CONFIG_RESPONSE_STATUS_CODE,
     CONFIG_RESPONSE_MODEL,
+    DEFAULT_STAGE_CACHE_SIZE,
+    DEFAULT_CACHE_TTL_SECONDS,
+    PROFILE_VALIDATION_TTL_SECONDS,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_PROFILES_DIR,
+    NO_CACHE_ENV_VAR,
+    BATCH_RESOURCES_ENV_VAR,
+    USE_AWS_CLI_ENV_VAR,
+    DEFAULT_MAX_RETRIES,
+    PARAMETER_PLACEHOLDER_RE,
     ERROR_INVALID_CHOICE,
     ERROR_INVALID_INPUT,
     ERROR_NO_PROFILES,
     SUCCESS_CONFIG_LOADED,
+    CONFIG_FILES,
     AuthType,
     # exceptions
     APIGatewayException,
@@ -55,6 +99,16 @@ from common import (
     EndpointConfig,
     MethodSpec,
     AWSResource,
+    api_gateway_path_for,
+)
+
+# boto3 es opcional: sin él (o con APIGW_USE_AWS_CLI=1) las consultas se hacen
+# con AWS CLI v2. Aquí solo se comprueba que esté instalado; importar
+# boto3/botocore cuesta cientos de ms y se difiere hasta la primera llamada a
+# AWS (--help y los errores de configuración no lo necesitan)
+_USE_BOTO3 = (
+    importlib.util.find_spec("boto3") is not None
+    and os.environ.get(USE_AWS_CLI_ENV_VAR) != "1"
 )
 
 # Inicializar logger global
@@ -66,6 +120,46 @@ logger = initialize_logger(
     error_dump_dir=reports_dir
 )
 
+profiles_dir = Path(__file__).resolve().parent / DEFAULT_PROFILES_DIR
+profiles_dir.mkdir(exist_ok=True)
+
+# Prefijos de los prompts, formateados una sola vez
+_ARROW = f"{ANSIColors.YELLOW}→{ANSIColors.RESET} "
+_ARROW_NL = "\n" + _ARROW
+
+# Caché local de consultas a AWS (se crea al escribir la primera entrada)
+cache_dir = Path(__file__).parent / DEFAULT_CACHE_DIR
+
+# Fragmentos de UI con colores, formateados una sola vez al importar
+_MENU_HEADER_TOP = f"\n{ANSIColors.CYAN}┌{'─' * MENU_BORDER_WIDTH}┐{ANSIColors.RESET}"
+_MENU_HEADER_BOTTOM = f"{ANSIColors.CYAN}└{'─' * MENU_BORDER_WIDTH}┘{ANSIColors.RESET}"
+_MENU_HEADER_ROW_START = f"{ANSIColors.CYAN}│ "
+_MENU_HEADER_ROW_END = f"│{ANSIColors.RESET}"
+_MENU_OPTION_START = f"  {ANSIColors.GREEN}"
+_MENU_OPTION_END = f"{ANSIColors.RESET} - "
+_SUMMARY_BULLET = f"  {ANSIColors.CYAN}▸{ANSIColors.RESET} "
+_SUMMARY_LABEL_HIGHLIGHT = ANSIColors.YELLOW
+_SUMMARY_VALUE_HIGHLIGHT = ANSIColors.GREEN
+_SUMMARY_VALUE = ANSIColors.GRAY
+_BOX_COLORS = {
+    "info": ANSIColors.CYAN,
+    "success": ANSIColors.GREEN,
+    "warning": ANSIColors.YELLOW,
+    "error": ANSIColors.RED,
+}
+
+
+# Cursor al inicio, borrar pantalla y scrollback (lo mismo que emite `clear`)
+_CLEAR_SCREEN_SEQUENCE = "\033[H\033[2J\033[3J"
+
+
+@lru_cache(maxsize=None)
+def _box_borders(color: str, width: int) -> Tuple[str, str]:
+    """Bordes superior e inferior de una caja de print_box_message para un ancho dado."""
+    edge = '═' * (width + 2)
+    return f"\n{color}╔{edge}╗{ANSIColors.RESET}", f"{color}╚{edge}╝{ANSIColors.RESET}"
+
+
 def print_menu_header(title: str) -> None:
     """
     Print a styled menu header with borders.
@@ -73,13 +167,26 @@ def print_menu_header(title: str) -> None:
     Args:
         title: The menu title to display.
     """
-    color = ANSIColors.CYAN
-    reset = ANSIColors.RESET
     print(
-        f"\n{color}┌{'─' * MENU_BORDER_WIDTH}┐{reset}"
+        f"{_MENU_HEADER_TOP}\n"
+        f"{_MENU_HEADER_ROW_START}{title:<{MENU_BORDER_WIDTH - 1}}{_MENU_HEADER_ROW_END}\n"
+        f"{_MENU_HEADER_BOTTOM}"
     )
-    print(f"{color}│ {title:<{MENU_BORDER_WIDTH - 1}}│{reset}")
-    print(f"{color}└{'─' * MENU_BORDER_WIDTH}┘{reset}")
+
+
+def format_menu_option(number: int, text: str, emoji: str = "▸") -> str:
+    """
+    Format a styled menu option line.
+
+    Args:
+        number: Option number (1-based).
+        text: Option text to display.
+        emoji: Emoji prefix (default: "▸").
+
+    Returns:
+        The option line without trailing newline.
+    """
+    return f"{_MENU_OPTION_START}{emoji} {number}{_MENU_OPTION_END}{text}"
 
 
 def print_menu_option(number: int, text: str, emoji: str = "▸") -> None:
@@ -91,9 +198,62 @@ def print_menu_option(number: int, text: str, emoji: str = "▸") -> None:
         text: Option text to display.
         emoji: Emoji prefix (default: "▸").
     """
-    color = ANSIColors.GREEN
-    reset = ANSIColors.RESET
-    print(f"  {color}{emoji} {number}{reset} - {text}")
+    print(format_menu_option(number, text, emoji))
+
+
+def format_menu_options(options: Iterable[Tuple[str, str]]) -> str:
+    """
+    Format a numbered list of menu options as one block.
+
+    Args:
+        options: (text, emoji) pairs, numbered from 1.
+
+    Returns:
+        The option lines, each ending in a newline.
+    """
+    return "".join(
+        format_menu_option(i, text, emoji) + "\n" for i, (text, emoji) in enumerate(options, 1)
+    )
+
+
+def print_menu_options(options: Iterable[Tuple[str, str]]) -> None:
+    """
+    Print a numbered list of menu options in a single write.
+
+    Args:
+        options: (text, emoji) pairs, numbered from 1.
+    """
+    sys.stdout.write(format_menu_options(options))
+
+
+# Menús con opciones fijas: se formatean una sola vez y se reimprimen tal cual
+_AUTH_TYPES = ('COGNITO_ADMIN', 'COGNITO_CUSTOMER', 'NO_AUTH')
+_HTTP_METHODS_MENU = format_menu_options(
+    (method, _HTTP_METHOD_EMOJIS.get(method, '▸')) for method in _HTTP_METHODS
+)
+_AUTH_METHOD_MENU = format_menu_options((
+    ("Authorizer (Cognito, Lambda, AWS IAM)", "🔐"),
+    ("API Key", "🔑"),
+))
+_AUTH_TYPE_MENU = format_menu_options((
+    (f"COGNITO_ADMIN: {ANSIColors.GRAY}Para el admin{ANSIColors.RESET}", "👤"),
+    (f"COGNITO_CUSTOMER: {ANSIColors.GRAY}Para la app o la web{ANSIColors.RESET}", "👥"),
+    (f"NO_AUTH: {ANSIColors.GRAY}Sin autorización (APIs públicas){ANSIColors.RESET}", "🔓"),
+))
+_CONFIG_SOURCE_MENU = format_menu_options((
+    ("Cargar perfil de configuración existente", "📂"),
+    ("Crear nueva configuración", "⚙️"),
+))
+_PROFILE_ACTIONS_MENU = format_menu_options((
+    ("Continuar con esta configuración", "✅"),
+    ("Seleccionar otro perfil", "🔄"),
+    ("Crear nueva configuración manualmente", "⚙️"),
+))
+_HEADERS_MENU = format_menu_options((
+    ("Agregar nuevo header", "➕"),
+    ("Remover header", "➖"),
+    ("Continuar con estos headers", "✅"),
+))
 
 
 def print_summary_item(
@@ -109,23 +269,15 @@ def print_summary_item(
         value: The value to display.
         highlight: Whether to highlight the value (default: False).
     """
-    info_color = ANSIColors.CYAN
-    highlight_color = ANSIColors.YELLOW
-    value_color = ANSIColors.GREEN
-    debug_color = ANSIColors.GRAY
     reset = ANSIColors.RESET
 
     if highlight:
         print(
-            f"  {info_color}▸{reset} "
-            f"{highlight_color}{label}:{reset} "
-            f"{value_color}{value}{reset}"
+            f"{_SUMMARY_BULLET}{_SUMMARY_LABEL_HIGHLIGHT}{label}:{reset} "
+            f"{_SUMMARY_VALUE_HIGHLIGHT}{value}{reset}"
         )
     else:
-        print(
-            f"  {info_color}▸{reset} "
-            f"{label}: {debug_color}{value}{reset}"
-        )
+        print(f"{_SUMMARY_BULLET}{label}: {_SUMMARY_VALUE}{value}{reset}")
 
 
 def print_box_message(message: str, style: str = "info") -> None:
@@ -136,27 +288,25 @@ def print_box_message(message: str, style: str = "info") -> None:
         message: The message to display.
         style: Box style - "info", "success", "warning", or "error".
     """
-    color_map = {
-        "info": ANSIColors.CYAN,
-        "success": ANSIColors.GREEN,
-        "warning": ANSIColors.YELLOW,
-        "error": ANSIColors.RED,
-    }
-    color = color_map.get(style, ANSIColors.CYAN)
+    color = _BOX_COLORS.get(style, ANSIColors.CYAN)
     reset = ANSIColors.RESET
 
     lines = message.split('\n')
-    max_len = max(len(line) for line in lines) if lines else 0
+    max_len = max(map(len, lines), default=0)
+    top, bottom = _box_borders(color, max_len)
 
-    print(f"\n{color}╔{'═' * (max_len + 2)}╗{reset}")
-    for line in lines:
-        print(f"{color}║ {line:<{max_len}} ║{reset}")
-    print(f"{color}╚{'═' * (max_len + 2)}╝{reset}")
+    body = "".join(f"{color}║ {line:<{max_len}} ║{reset}\n" for line in lines)
+    print(f"{top}\n{body}{bottom}")
 
 
 def clear_screen() -> None:
     """Limpiar la pantalla de forma segura en Windows y Unix."""
-    import os
+    # En terminales ANSI basta la secuencia de escape (sin lanzar un proceso);
+    # va por el mismo buffer de stdout, así que respeta el orden de la salida
+    if os.name != 'nt' and sys.stdout.isatty():
+        sys.stdout.write(_CLEAR_SCREEN_SEQUENCE)
+        return
+    sys.stdout.flush()
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
@@ -164,17 +314,79 @@ def clear_screen() -> None:
 # SECCIÓN 1: GESTOR DE CONFIGURACIÓN
 # ===================================================================
 
+# Configuraciones ya parseadas por carpeta, junto con los mtimes de sus archivos:
+# los ConfigManager posteriores las reutilizan mientras los mtimes coincidan y
+# un cambio reemplaza la entrada (no se acumulan versiones viejas)
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, ...], Dict[str, Dict[str, Dict[str, str]]]]] = {}
+
+
+def _config_mtimes(config_dir: Path) -> Tuple[int, ...]:
+    """Retorna el mtime de cada archivo de CONFIG_FILES (-1 si no existe)."""
+    mtimes = []
+    for filename in CONFIG_FILES.values():
+        try:
+            mtimes.append((config_dir / filename).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(-1)
+    return tuple(mtimes)
+
+
+def _parse_configs(config_dir: Path) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Parsea los INI de CONFIG_FILES y materializa sus secciones como dicts."""
+    # Un parser por archivo: varios usan [DEFAULT] y al fusionarlos
+    # sus valores se heredarían en todas las secciones
+    parsers = {attr: configparser.ConfigParser() for attr in CONFIG_FILES}
+    missing = [
+        filename
+        for attr, filename in CONFIG_FILES.items()
+        if not parsers[attr].read(config_dir / filename, encoding="utf-8")
+    ]
+    if missing:
+        logger.warning(f"Archivos de configuración no encontrados: {', '.join(missing)}")
+    return {
+        attr: {name: dict(section) for name, section in parser.items()}
+        for attr, parser in parsers.items()
+    }
+
+
+def _load_compiled_configs(config_dir: Path, mtimes: Tuple[int, ...]) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """
+    Retorna las secciones de configuración desde cache/config.json o parseando los INI.
+
+    El JSON guarda las secciones ya materializadas junto a los mtimes de los INI
+    de los que salió: mientras coincidan se evita configparser en el arranque.
+    """
+    compiled_path = cache_dir / _COMPILED_CONFIG_FILE
+    if not _cache_disabled():
+        try:
+            compiled = json_loads(compiled_path.read_bytes())
+            if compiled["config_dir"] == str(config_dir) and tuple(compiled["mtimes"]) == mtimes:
+                return compiled["sections"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    sections = _parse_configs(config_dir)
+    _write_json_cache(compiled_path, {"config_dir": str(config_dir), "mtimes": mtimes, "sections": sections})
+    return sections
+
+
 class ConfigManager:
     def __init__(self, config_dir: str = "config"):
+        # La configuración se carga en el primer acceso (ver _sections)
         self.config_dir = Path(__file__).parent / config_dir
-        self.method_configs = configparser.ConfigParser()
-        self.auth_headers = configparser.ConfigParser()
-        self.cors_headers = configparser.ConfigParser()
-        self.response_templates = configparser.ConfigParser()
-        
-        self._load_configs()
-    
-    def _load_configs(self) -> None:
+
+    @cached_property
+    def _sections(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """Secciones de cada archivo como dicts: {archivo: {sección: {clave: valor}}}."""
+        return self._load_configs()
+
+    # Secciones por archivo, resueltas en el primer acceso a cualquiera de ellas
+    method_configs = property(lambda self: self._sections["method_configs"])
+    auth_headers = property(lambda self: self._sections["auth_headers"])
+    cors_headers = property(lambda self: self._sections["cors_headers"])
+    response_templates = property(lambda self: self._sections["response_templates"])
+
+    def _load_configs(self) -> Dict[str, Dict[str, Dict[str, str]]]:
         """
         Load all configuration INI files.
 
@@ -182,15 +394,14 @@ class ConfigManager:
             ConfigurationException: If configuration files cannot be loaded.
         """
         try:
-            self.method_configs.read(
-                self.config_dir / "method_configs.ini"
-            )
-            self.auth_headers.read(self.config_dir / "auth_headers.ini")
-            self.cors_headers.read(self.config_dir / "cors_headers.ini")
-            self.response_templates.read(
-                self.config_dir / "response_templates.ini"
-            )
+            # Los archivos solo se vuelven a parsear si cambió alguno (mtime)
+            mtimes = _config_mtimes(self.config_dir)
+            cached_mtimes, sections = _CONFIG_CACHE.get(self.config_dir, (None, None))
+            if cached_mtimes != mtimes:
+                sections = _load_compiled_configs(self.config_dir, mtimes)
+                _CONFIG_CACHE[self.config_dir] = (mtimes, sections)
             logger.debug(SUCCESS_CONFIG_LOADED)
+            return sections
         except Exception as e:
             error_msg = (
                 f"Error cargando configuraciones desde {self.config_dir}"
@@ -198,24 +409,26 @@ class ConfigManager:
             logger.dump_error(error_msg, e)
             logger.error(f"{error_msg}: {e}")
             sys.exit(1)
+
+    # Los getters retornan los dicts precalculados (compartidos): no mutarlos
     
     def get_method_config(self, http_method: str) -> Dict[str, Any]:
         """Obtiene la configuración para un método HTTP específico"""
-        return dict(self.method_configs['DEFAULT'])
+        return self.method_configs['DEFAULT']
     
     def get_auth_headers(self, auth_type: str) -> Dict[str, str]:
         """Obtiene los headers de autorización según el tipo"""
         if auth_type not in self.auth_headers:
-            return dict(self.auth_headers['NO_AUTH'])
-        return dict(self.auth_headers[auth_type])
+            return self.auth_headers['NO_AUTH']
+        return self.auth_headers[auth_type]
     
     def get_cors_headers(self, cors_type: str = "DEFAULT") -> Dict[str, str]:
         """Obtiene los headers CORS"""
-        return dict(self.cors_headers[cors_type])
+        return self.cors_headers[cors_type]
     
     def get_response_template(self, template_type: str = "DEFAULT") -> Dict[str, str]:
         """Obtiene los templates de respuesta"""
-        return dict(self.response_templates[template_type])
+        return self.response_templates[template_type]
 
 
 class ProfileConfigManager:
@@ -229,18 +442,18 @@ class ProfileConfigManager:
             profile_config: ConfigParser con la configuración del perfil.
         """
         self.profile_config = profile_config
-        self.method_configs = configparser.ConfigParser()
-        self.auth_headers = configparser.ConfigParser()
-        self.cors_headers = configparser.ConfigParser()
+        self.method_configs: Dict[str, Dict[str, str]] = {}
+        self.auth_headers: Dict[str, Dict[str, str]] = {}
+        self.cors_headers: Dict[str, Dict[str, str]] = {}
 
         self._load_from_profile()
 
     def _load_from_profile(self) -> None:
-        """Cargar configuraciones desde el perfil INI"""
+        """Cargar configuraciones desde el perfil INI (una sola pasada a dicts)"""
         try:
             # Cargar configuración de métodos si existe
             if 'METHOD_CONFIG' in self.profile_config:
-                self.method_configs['DEFAULT'] = self.profile_config['METHOD_CONFIG']
+                self.method_configs['DEFAULT'] = dict(self.profile_config['METHOD_CONFIG'])
             else:
                 # Valores por defecto
                 self.method_configs['DEFAULT'] = {
@@ -250,17 +463,12 @@ class ProfileConfigManager:
                     'connection_type': 'VPC_LINK'
                 }
 
-            # Cargar headers de autorización
+            # Cargar headers de autorización y CORS
             for section in self.profile_config.sections():
                 if section.startswith('AUTH_HEADERS_'):
-                    auth_type = section.replace('AUTH_HEADERS_', '')
-                    self.auth_headers[auth_type] = self.profile_config[section]
-
-            # Cargar headers CORS
-            for section in self.profile_config.sections():
-                if section.startswith('CORS_HEADERS_'):
-                    cors_type = section.replace('CORS_HEADERS_', '')
-                    self.cors_headers[cors_type] = self.profile_config[section]
+                    self.auth_headers[section[len('AUTH_HEADERS_'):]] = dict(self.profile_config[section])
+                elif section.startswith('CORS_HEADERS_'):
+                    self.cors_headers[section[len('CORS_HEADERS_'):]] = dict(self.profile_config[section])
 
             logger.debug("Configuración cargada desde perfil")
         except Exception as e:
@@ -268,51 +476,311 @@ class ProfileConfigManager:
             logger.dump_error(error_msg, e)
             logger.error(f"{error_msg}: {e}")
 
+    # Como en ConfigManager, los getters retornan los dicts cargados (compartidos): no mutarlos
+
     def get_method_config(self, http_method: str) -> Dict[str, Any]:
         """Obtiene la configuración para un método HTTP específico"""
-        return dict(self.method_configs.get('DEFAULT', {}))
+        return self.method_configs['DEFAULT']
 
     def get_auth_headers(self, auth_type: str) -> Dict[str, str]:
         """Obtiene los headers de autorización según el tipo"""
-        if auth_type not in self.auth_headers:
-            return dict(self.auth_headers.get('NO_AUTH', {}))
-        return dict(self.auth_headers[auth_type])
+        auth_headers = self.auth_headers.get(auth_type)
+        if auth_headers is None:
+            return self.auth_headers.get('NO_AUTH', {})
+        return auth_headers
 
     def get_cors_headers(self, cors_type: str = "DEFAULT") -> Dict[str, str]:
         """Obtiene los headers CORS"""
-        return dict(self.cors_headers.get(cors_type, {}))
+        return self.cors_headers.get(cors_type, {})
 
 # ===================================================================
 # SECCIÓN 2: LÓGICA INTERACTIVA PARA SELECCIÓN DE RECURSOS
 # ===================================================================
 
-def run_aws_command(command: str) -> Optional[Dict[str, Any]]:
-    """Ejecuta un comando de AWS y retorna el resultado en JSON."""
+_aws_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_aws_client(service: str) -> Any:
+    """
+    Retorna el cliente boto3 compartido de un servicio.
+
+    Un único cliente por servicio reutiliza credenciales y conexiones HTTPS
+    durante toda la sesión. La creación se serializa porque la sesión por
+    defecto de boto3 no es thread-safe (los clientes sí lo son). El pool de
+    conexiones admite las escrituras en paralelo de varios métodos y el modo
+    de reintentos adaptativo absorbe el throttling de API Gateway.
+    """
+    import boto3
+    from botocore.config import Config
+
+    with _aws_client_lock:
+        return boto3.client(
+            service,
+            config=Config(
+                max_pool_connections=32,
+                retries={"mode": "adaptive", "max_attempts": 10},
+                tcp_keepalive=True,
+            ),
+        )
+
+
+def _to_cli_option(param: str) -> str:
+    """Convierte un parámetro de la API (restApiId, MaxResults) a opción de CLI (--rest-api-id)."""
+    return "--" + _CAMEL_BOUNDARY_RE.sub('-', param).lower()
+
+
+def _is_concurrent_modification(error_code: Optional[str], error: Optional[str]) -> bool:
+    """ConflictException por escrituras solapadas en la misma API (reintentable, no "ya existe")."""
+    return error_code == "ConflictException" and "concurrent modification" in (error or "")
+
+
+def _cli_argv(service: str, operation: str, params: Dict[str, Any]) -> List[str]:
+    """
+    Traduce una llamada de boto3 a argv de AWS CLI v2.
+
+    Los booleanos se convierten en --flag/--no-flag, las listas de strings en
+    valores separados y los dicts o listas de dicts en JSON.
+    """
+    command = ["aws", service, operation.replace('_', '-')]
+    for key, value in params.items():
+        option = _to_cli_option(key)
+        if isinstance(value, bool):
+            command.append(option if value else "--no-" + option[2:])
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            command += [option, *value]
+        elif isinstance(value, (dict, list)):
+            command += [option, json_dumps_bytes(value).decode("utf-8")]
+        elif isinstance(value, bytes):
+            # AWS CLI v2 recibe los parámetros blob en base64
+            command += [option, base64.b64encode(value).decode("ascii")]
+        else:
+            command += [option, str(value)]
+    return command
+
+
+def _run_aws_cli(service: str, operation: str, params: Dict[str, Any], query: Optional[str] = None) -> Optional[Any]:
+    """Ejecuta la operación con AWS CLI v2 (fallback cuando boto3 no está instalado)."""
+    command = _cli_argv(service, operation, params)
+    if operation in _PAGE_SIZES:
+        command += ["--page-size", str(_PAGE_SIZES[operation])]
+    if query:
+        command += ["--query", query]
     try:
         result = subprocess.run(
             command,
-            shell=True,
             capture_output=True,
-            text=True,
             check=False
         )
         if result.returncode != 0:
-            error_msg = f"Error ejecutando comando AWS: {command}"
-            logger.dump_error(f"{error_msg}\nSTDERR: {result.stderr}\nSTDOUT: {result.stdout}")
-            logger.error(f"Error al ejecutar comando:\n{result.stderr}")
+            stderr = result.stderr.decode(errors="replace")
+            error_msg = f"Error ejecutando comando AWS: {' '.join(command)}"
+            logger.dump_error(f"{error_msg}\nSTDERR: {stderr}\nSTDOUT: {result.stdout.decode(errors='replace')}")
+            logger.error(f"Error al ejecutar comando:\n{stderr}")
             return None
-        return json.loads(result.stdout) if result.stdout.strip() else {}
+        return json_loads(result.stdout) if result.stdout.strip() else {}
     except json.JSONDecodeError as e:
-        error_msg = f"Error parseando JSON del comando: {command}"
+        error_msg = f"Error parseando JSON del comando: {' '.join(command)}"
         logger.dump_error(error_msg, e)
         logger.error(f"Error parseando JSON: {e}")
         return None
     except Exception as e:
-        error_msg = f"Excepción inesperada ejecutando comando: {command}"
+        error_msg = f"Excepción inesperada ejecutando comando: {' '.join(command)}"
         logger.dump_error(error_msg, e)
         logger.error(f"Excepción inesperada: {e}")
         return None
 
+
+def run_aws_command(service: str, operation: str, *, query: Optional[str] = None, **params: Any) -> Optional[Any]:
+    """
+    Ejecuta una operación de lectura de AWS y retorna la respuesta.
+
+    Usa un cliente boto3 en proceso si está instalado y AWS CLI v2 en caso
+    contrario. Las operaciones paginables se leen completas, como hace la CLI.
+
+    Args:
+        service: Servicio de AWS ('apigateway', 'cognito-idp').
+        operation: Operación en snake_case (ej: 'get_stages').
+        query: Expresión JMESPath opcional (como --query de la CLI). En las
+            operaciones paginables se aplica página a página, sin acumular
+            la respuesta completa.
+        **params: Parámetros de la API (ej: restApiId='abc123').
+
+    Returns:
+        Respuesta con la misma forma que el JSON de AWS CLI ('items', 'item',
+        'UserPools', ...), el resultado de `query` si se indicó, o None si
+        hubo error.
+    """
+    sys.stdout.flush()  # la consola va por líneas; con stdout redirigido, vuelca el progreso antes de esperar a AWS
+    if not _USE_BOTO3:
+        return _run_aws_cli(service, operation, params, query)
+
+    import jmespath
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    try:
+        client = get_aws_client(service)
+        if client.can_paginate(operation):
+            pagination = {"PageSize": _PAGE_SIZES[operation]} if operation in _PAGE_SIZES else {}
+            pages = client.get_paginator(operation).paginate(PaginationConfig=pagination, **params)
+            if query:
+                # Una página sin elementos produce None en lugar de una lista vacía
+                return [item for item in pages.search(query) if item is not None]
+            response = pages.build_full_result()
+        else:
+            response = getattr(client, operation)(**params)
+            if query:
+                return jmespath.search(query, response)
+        response.pop("ResponseMetadata", None)
+        return response
+    except (BotoCoreError, ClientError) as e:
+        error_msg = f"Error ejecutando {service} {operation} {params}"
+        logger.dump_error(error_msg, e)
+        logger.error(f"Error al ejecutar comando:\n{e}")
+        return None
+
+class SessionCache:
+    """
+    Caché en memoria de respuestas de AWS compartida por todos los selectores.
+
+    Las claves son tuplas (servicio, operación, parámetros...). Solo hay una
+    consulta en vuelo por clave: si la validación y los menús piden el mismo
+    listado a la vez, el segundo espera y reutiliza el resultado. Los fallos
+    (None) no se cachean.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            ttl_seconds: Vigencia de cada entrada; None para toda la sesión.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """Retorna el valor cacheado de `key` o lo obtiene con `fetch()`."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and (
+                self.ttl_seconds is None or time.monotonic() - entry[0] < self.ttl_seconds
+            )
+            with self._lock:
+                if fresh:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if fresh:
+                return entry[1]
+
+            value = fetch()
+            if value is not None:
+                self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def invalidate(self, prefix: Tuple = ()) -> None:
+        """Descarta las entradas cuya clave empieza por `prefix` (todas por defecto)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+                del self._entries[key]
+
+
+session_cache = SessionCache(ttl_seconds=DEFAULT_CACHE_TTL_SECONDS)
+
+
+def _cached_items(service: str, operation: str, result_key: str, **params: Any) -> Optional[Tuple[Dict[str, Any], ...]]:
+    """Devuelve los elementos de una consulta de listado desde la caché de sesión, o None si falla."""
+    def fetch() -> Optional[Tuple[Dict[str, Any], ...]]:
+        response = run_aws_command(service, operation, **params)
+        return None if response is None else tuple(response.get(result_key, []))
+
+    return session_cache.get_or_fetch((service, operation, *sorted(params.items())), fetch)
+
+
+def _get_authorizers(api_id: str) -> Optional[Tuple[Dict[str, Any], ...]]:
+    return _cached_items("apigateway", "get_authorizers", "items", restApiId=api_id)
+
+
+def _get_stages(api_id: str) -> Optional[Tuple[Dict[str, Any], ...]]:
+    return _cached_items("apigateway", "get_stages", "item", restApiId=api_id)
+
+
+def _list_user_pools() -> Optional[Tuple[Dict[str, Any], ...]]:
+    return _cached_items("cognito-idp", "list_user_pools", "UserPools", MaxResults=60)
+
+
+def _cache_disabled() -> bool:
+    return os.environ.get(NO_CACHE_ENV_VAR) == "1"
+
+
+def _read_json_cache(path: Path, ttl: int = DEFAULT_CACHE_TTL_SECONDS) -> Optional[Any]:
+    """Retorna el JSON cacheado en disco si existe y no ha expirado."""
+    if _cache_disabled():
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_cache(path: Path, data: Any) -> None:
+    """Escribe un JSON en la caché de forma atómica (tmp + replace) con permisos 0o600."""
+    if _cache_disabled():
+        return
+    try:
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps_bytes(data))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"No se pudo escribir la caché {path.name}: {e}")
+
+
+def _get_rest_apis() -> Optional[List[Dict[str, Any]]]:
+    """Lista las APIs (id y nombre) desde la caché en disco o con un único get-rest-apis."""
+    cache_path = cache_dir / _REST_APIS_CACHE_FILE
+    apis = _read_json_cache(cache_path)
+    if apis is not None:
+        return apis
+
+    # Solo id y nombre, proyectados página a página (o con --query en la CLI)
+    apis = run_aws_command("apigateway", "get_rest_apis", query=_REST_API_SUMMARY_QUERY)
+    if apis is None:
+        return None
+    _write_json_cache(cache_path, apis)
+    return apis
+
+
+def _api_exists(api_id: str) -> bool:
+    """Comprueba si la API existe; un listado fresco en caché evita la consulta a AWS."""
+    cached_apis = _read_json_cache(cache_dir / _REST_APIS_CACHE_FILE)
+    if cached_apis and any(api["id"] == api_id for api in cached_apis):
+        return True
+    api = session_cache.get_or_fetch(
+        ("apigateway", "get_rest_api", api_id),
+        lambda: run_aws_command("apigateway", "get_rest_api", restApiId=api_id),
+    )
+    return api is not None
+
+
+def clear_aws_cache() -> None:
+    """Descarta las consultas memoizadas y la caché local en disco para forzar datos frescos."""
+    logger.debug(f"Caché de sesión: {session_cache.hits} aciertos, {session_cache.misses} consultas a AWS")
+    session_cache.invalidate()
+    for cache_file in cache_dir.glob("*.json"):
+        cache_file.unlink(missing_ok=True)
+
+
 def select_from_menu(prompt: str, items: List[Any], name_key: str = 'name', return_key: str = 'id') -> Optional[Any]:
     """
     Muestra un menú de opciones y retorna el valor de la clave especificada (o el objeto completo).
@@ -322,15 +790,22 @@ def select_from_menu(prompt: str, items: List[Any], name_key: str = 'name', retu
         logger.warning(f"No se encontraron elementos para '{prompt}'")
         return None
 
+    if len(items) == 1:
+        item = items[0]
+        display_name = item.get(name_key, str(item)) if isinstance(item, dict) else str(item)
+        logger.success(f"Único elemento disponible, seleccionado automáticamente: {display_name}")
+        return item if not return_key else item.get(return_key)
+
     clear_screen()
     print_menu_header(prompt)
-    for i, item in enumerate(items):
-        display_name = item.get(name_key, str(item)) if isinstance(item, dict) else str(item)
-        print_menu_option(i + 1, display_name)
+    print_menu_options(
+        (item.get(name_key, str(item)) if isinstance(item, dict) else str(item), "▸")
+        for item in items
+    )
 
     while True:
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona una opción: "))
+            choice = int(input(_ARROW_NL + "Selecciona una opción: "))
             if 1 <= choice <= len(items):
                 selected_item = items[choice - 1]
                 selected_display = selected_item.get(name_key, str(selected_item)) if isinstance(selected_item, dict) else str(selected_item)
@@ -344,35 +819,27 @@ def select_from_menu(prompt: str, items: List[Any], name_key: str = 'name', retu
 def select_api_grouped() -> Optional[str]:
     """Muestra un menú de APIs agrupadas por nombre base."""
     logger.info("Obteniendo listado de APIs...")
-    apis_data = run_aws_command("aws apigateway get-rest-apis")
-    if not apis_data or 'items' not in apis_data: return None
+    apis = _get_rest_apis()
+    if not apis: return None
 
-    groups = {}
+    groups = defaultdict(list)
 
-    for api in apis_data['items']:
+    for api in apis:
         name = api.get('name', '')
         if not name: continue
 
-        parts = name.rsplit('-', 1)
-        if len(parts) == 2 and parts[1].upper() in ['CI', 'DEV', 'PROD']:
-            env = parts[1].upper()
-            base_name = parts[0]
-        else:
-            base_name = name
-
-        if base_name not in groups: groups[base_name] = []
-        groups[base_name].append(api)
+        base_name, sep, suffix = name.rpartition('-')
+        groups[base_name if sep and suffix.upper() in _ENV_SUFFIXES else name].append(api)
 
-    sorted_group_names = sorted(groups.keys())
+    sorted_group_names = sorted(groups)
     clear_screen()
     print_menu_header("Selecciona el grupo de API")
-    for i, name in enumerate(sorted_group_names):
-        print_menu_option(i + 1, name, emoji="📦")
+    print_menu_options((name, "📦") for name in sorted_group_names)
 
     selected_group_name = None
     while True:
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona un grupo: "))
+            choice = int(input(_ARROW_NL + "Selecciona un grupo: "))
             if 1 <= choice <= len(sorted_group_names):
                 selected_group_name = sorted_group_names[choice - 1]
                 logger.success(f"Grupo seleccionado: {selected_group_name}")
@@ -382,7 +849,8 @@ def select_api_grouped() -> Optional[str]:
         except ValueError:
             logger.error("Por favor, introduce un número.")
 
-    apis_in_group = sorted(groups[selected_group_name], key=lambda x: x.get('name', ''))
+    # Todas las APIs agrupadas tienen nombre (las vacías se descartan al agrupar)
+    apis_in_group = sorted(groups[selected_group_name], key=itemgetter('name'))
 
     if len(apis_in_group) == 1:
         logger.success(f"Grupo con un solo miembro, seleccionando automáticamente '{apis_in_group[0]['name']}'")
@@ -392,39 +860,35 @@ def select_api_grouped() -> Optional[str]:
 
 def select_http_methods() -> List[str]:
     """Permite seleccionar múltiples métodos HTTP"""
-    available_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH']
-    method_emojis = {'GET': '📥', 'POST': '📤', 'PUT': '✏️', 'DELETE': '🗑️', 'PATCH': '🔧'}
-
     clear_screen()
     print_menu_header("Selecciona los métodos HTTP a crear (separados por comas)")
-    for i, method in enumerate(available_methods):
-        emoji = method_emojis.get(method, '▸')
-        print_menu_option(i + 1, method, emoji=emoji)
+    sys.stdout.write(_HTTP_METHODS_MENU)
 
     while True:
-        try:
-            choices = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Ingresa los números (ej: 1,2,3): ")
-            indices = [int(x.strip()) - 1 for x in choices.split(',')]
-
-            if all(0 <= idx < len(available_methods) for idx in indices):
-                selected_methods = [available_methods[idx] for idx in indices]
-                logger.success(f"Métodos seleccionados: {', '.join(selected_methods)}")
-                return selected_methods
-            else:
-                logger.error("Algunas opciones son inválidas. Inténtalo de nuevo.")
-        except ValueError:
+        choices = input(_ARROW_NL + "Ingresa los números (ej: 1,2,3): ")
+        if not _METHOD_CHOICES_RE.match(choices):
             logger.error("Por favor, introduce números separados por comas.")
+            continue
+
+        # dict.fromkeys descarta repetidos ("1,1") conservando el orden
+        indices = list(dict.fromkeys(int(x) - 1 for x in choices.split(',')))
+        if set(indices) - _HTTP_METHOD_INDICES:
+            logger.error("Algunas opciones son inválidas. Inténtalo de nuevo.")
+            continue
+
+        selected_methods = [_HTTP_METHODS[idx] for idx in indices]
+        logger.success(f"Métodos seleccionados: {', '.join(selected_methods)}")
+        return selected_methods
 
 def select_auth_method() -> str:
     """Selecciona el método de autenticación: API Key o Authorizer"""
     clear_screen()
     print_menu_header("Selecciona el método de autenticación")
-    print_menu_option(1, "Authorizer (Cognito, Lambda, AWS IAM)", emoji="🔐")
-    print_menu_option(2, "API Key", emoji="🔑")
+    sys.stdout.write(_AUTH_METHOD_MENU)
 
     while True:
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona el método de autenticación: "))
+            choice = int(input(_ARROW_NL + "Selecciona el método de autenticación: "))
             if choice == 1:
                 logger.success("Método de autenticación: Authorizer")
                 return "AUTHORIZER"
@@ -438,30 +902,15 @@ def select_auth_method() -> str:
 
 def select_auth_type() -> str:
     """Selecciona el tipo de autorización"""
-    auth_types = ['COGNITO_ADMIN', 'COGNITO_CUSTOMER', 'NO_AUTH']
-    descriptions = {
-        'COGNITO_ADMIN': 'Para el admin',
-        'COGNITO_CUSTOMER': 'Para la app o la web',
-        'NO_AUTH': 'Sin autorización (APIs públicas)'
-    }
-    auth_emojis = {
-        'COGNITO_ADMIN': '👤',
-        'COGNITO_CUSTOMER': '👥',
-        'NO_AUTH': '🔓'
-    }
-
     clear_screen()
     print_menu_header("Selecciona el tipo de autorización")
-    for i, auth_type in enumerate(auth_types):
-        emoji = auth_emojis.get(auth_type, '▸')
-        text = f"{auth_type}: {ANSIColors.GRAY}{descriptions[auth_type]}{ANSIColors.RESET}"
-        print_menu_option(i + 1, text, emoji=emoji)
+    sys.stdout.write(_AUTH_TYPE_MENU)
 
     while True:
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona el tipo de autorización: "))
-            if 1 <= choice <= len(auth_types):
-                selected = auth_types[choice - 1]
+            choice = int(input(_ARROW_NL + "Selecciona el tipo de autorización: "))
+            if 1 <= choice <= len(_AUTH_TYPES):
+                selected = _AUTH_TYPES[choice - 1]
                 logger.success(f"Tipo de autorización: {selected}")
                 return selected
             else:
@@ -504,21 +953,21 @@ def edit_headers_interactive(headers: Dict[str, str], title: str) -> Dict[str, s
             print(f"  {ANSIColors.GREEN}2{ANSIColors.RESET} - Quitar header")
         print(f"  {ANSIColors.GREEN}3{ANSIColors.RESET} - Guardar y continuar")
 
-        choice = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona (1-3): ").strip()
+        choice = input(_ARROW_NL + "Selecciona (1-3): ").strip()
 
         if choice == '1':
             # Agregar header
             clear_screen()
-            header_name = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Nombre del header: ").strip()
+            header_name = input(_ARROW + "Nombre del header: ").strip()
             if not header_name:
                 logger.error("Nombre de header no válido")
-                input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Presiona Enter para continuar...")
+                input(_ARROW + "Presiona Enter para continuar...")
                 continue
 
-            header_value = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Valor del header: ").strip()
+            header_value = input(_ARROW + "Valor del header: ").strip()
             if not header_value:
                 logger.error("Valor de header no válido")
-                input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Presiona Enter para continuar...")
+                input(_ARROW + "Presiona Enter para continuar...")
                 continue
 
             edited_headers[header_name] = header_value
@@ -533,7 +982,7 @@ def edit_headers_interactive(headers: Dict[str, str], title: str) -> Dict[str, s
                 print(f"  {i}. {key}")
 
             try:
-                remove_choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona (1-{len(header_keys)}): ").strip())
+                remove_choice = int(input(_ARROW_NL + f"Selecciona (1-{len(header_keys)}): ").strip())
                 if 1 <= remove_choice <= len(header_keys):
                     removed_key = header_keys[remove_choice - 1]
                     del edited_headers[removed_key]
@@ -543,14 +992,14 @@ def edit_headers_interactive(headers: Dict[str, str], title: str) -> Dict[str, s
             except ValueError:
                 logger.error("Opción inválida")
 
-            input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Presiona Enter para continuar...")
+            input(_ARROW + "Presiona Enter para continuar...")
 
         elif choice == '3':
             # Guardar y continuar
             break
         else:
             logger.error("Opción inválida")
-            input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Presiona Enter para continuar...")
+            input(_ARROW + "Presiona Enter para continuar...")
 
     return edited_headers
 
@@ -581,7 +1030,7 @@ def edit_method_config_interactive(method_config: Dict[str, str], title: str) ->
         print(f"  {ANSIColors.GREEN}1{ANSIColors.RESET} - Modificar un valor")
         print(f"  {ANSIColors.GREEN}2{ANSIColors.RESET} - Guardar y continuar")
 
-        choice = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona (1-2): ").strip()
+        choice = input(_ARROW_NL + "Selecciona (1-2): ").strip()
 
         if choice == '1':
             # Modificar valor
@@ -592,10 +1041,10 @@ def edit_method_config_interactive(method_config: Dict[str, str], title: str) ->
                 print(f"  {i}. {key} = {edited_config[key]}")
 
             try:
-                modify_choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona (1-{len(config_keys)}): ").strip())
+                modify_choice = int(input(_ARROW_NL + f"Selecciona (1-{len(config_keys)}): ").strip())
                 if 1 <= modify_choice <= len(config_keys):
                     key_to_modify = config_keys[modify_choice - 1]
-                    new_value = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Nuevo valor para '{key_to_modify}': ").strip()
+                    new_value = input(_ARROW + f"Nuevo valor para '{key_to_modify}': ").strip()
                     if new_value:
                         edited_config[key_to_modify] = new_value
                         logger.success(f"'{key_to_modify}' actualizado")
@@ -606,33 +1055,24 @@ def edit_method_config_interactive(method_config: Dict[str, str], title: str) ->
             except ValueError:
                 logger.error("Opción inválida")
 
-            input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Presiona Enter para continuar...")
+            input(_ARROW + "Presiona Enter para continuar...")
 
         elif choice == '2':
             # Guardar y continuar
             break
         else:
             logger.error("Opción inválida")
-            input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Presiona Enter para continuar...")
+            input(_ARROW + "Presiona Enter para continuar...")
 
     return edited_config
 
-def list_configuration_profiles() -> List[str]:
-    """Lista los archivos de configuración de perfiles disponibles"""
-    profiles_dir = Path(__file__).parent / "profiles"
-    if not profiles_dir.exists():
-        return []
-    
-    profiles = []
-    for file in profiles_dir.glob("*.ini"):
-        profiles.append(file.stem)
-    return profiles
+@lru_cache(maxsize=1)
+def list_configuration_profiles() -> Tuple[str, ...]:
+    """Lista los perfiles disponibles (cacheado; se invalida al guardar un perfil)"""
+    return tuple(file.stem for file in profiles_dir.glob("*.ini"))
 
 def save_configuration_profile(config: Dict[str, Any], config_manager: ConfigManager) -> bool:
     """Guarda un perfil de configuración en un archivo INI, replicando headers de config"""
-    profiles_dir = Path(__file__).parent / "profiles"
-    profiles_dir.mkdir(exist_ok=True)
-
     clear_screen()
     logger.section("GUARDAR PERFIL DE CONFIGURACIÓN")
 
@@ -641,7 +1081,7 @@ def save_configuration_profile(config: Dict[str, Any], config_manager: ConfigMan
 
     # Pregunta si desea modificar la configuración por defecto
     print(f"\n{ANSIColors.CYAN}¿Deseas modificar la configuración por defecto antes de guardar? (s/n):{ANSIColors.RESET}")
-    edit_config = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} ").lower()
+    edit_config = input(_ARROW).lower()
 
     # Copiar configuración por defecto
     final_auth_headers = dict(config_manager.auth_headers[auth_type]) if auth_type in config_manager.auth_headers else {}
@@ -658,27 +1098,27 @@ def save_configuration_profile(config: Dict[str, Any], config_manager: ConfigMan
             for key, value in final_auth_headers.items():
                 print(f"  {ANSIColors.GREEN}{key}{ANSIColors.RESET} = {ANSIColors.GRAY}{value}{ANSIColors.RESET}")
             print(f"\n{ANSIColors.CYAN}¿Deseas modificar los headers de autorización? (s/n):{ANSIColors.RESET}")
-            if input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} ").lower() == 's':
+            if input(_ARROW).lower() == 's':
                 final_auth_headers = edit_headers_interactive(final_auth_headers, f"HEADERS DE AUTORIZACIÓN ({auth_type})")
 
         # Editar headers CORS
         if final_cors_headers:
             clear_screen()
             print(f"\n{ANSIColors.CYAN}¿Deseas modificar los headers CORS? (s/n):{ANSIColors.RESET}")
-            if input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} ").lower() == 's':
+            if input(_ARROW).lower() == 's':
                 final_cors_headers = edit_headers_interactive(final_cors_headers, f"HEADERS CORS ({cors_type})")
 
         # Editar configuración de métodos
         if final_method_config:
             clear_screen()
             print(f"\n{ANSIColors.CYAN}¿Deseas modificar la configuración de métodos HTTP? (s/n):{ANSIColors.RESET}")
-            if input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} ").lower() == 's':
+            if input(_ARROW).lower() == 's':
                 final_method_config = edit_method_config_interactive(final_method_config, "CONFIGURACIÓN DE MÉTODOS HTTP")
 
     # Pedir nombre del perfil
     clear_screen()
     logger.section("GUARDAR PERFIL")
-    profile_name = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Introduce el nombre del perfil (sin extensión): ").strip()
+    profile_name = input(_ARROW_NL + "Introduce el nombre del perfil (sin extensión): ").strip()
     if not profile_name:
         logger.error("Nombre de perfil inválido")
         return False
@@ -721,6 +1161,7 @@ def save_configuration_profile(config: Dict[str, Any], config_manager: ConfigMan
 
         with open(profile_file, 'w') as f:
             profile_config.write(f)
+        list_configuration_profiles.cache_clear()
 
         clear_screen()
         logger.success(f"Perfil '{profile_name}' guardado exitosamente")
@@ -741,7 +1182,6 @@ def save_configuration_profile(config: Dict[str, Any], config_manager: ConfigMan
 
 def load_configuration_profile(profile_name: str) -> Optional[Dict[str, Any]]:
     """Carga un perfil de configuración desde archivo INI"""
-    profiles_dir = Path(__file__).parent / "profiles"
     profile_file = profiles_dir / f"{profile_name}.ini"
 
     if not profile_file.exists():
@@ -803,61 +1243,70 @@ def validate_configuration_profile(config: Dict[str, Any]) -> Dict[str, bool]:
     """Valida que los recursos de un perfil aún existan"""
     logger.info("Validando configuración cargada...")
     validation_results = {}
-
-    # Validar API
-    logger.debug("Verificando API...")
-    api_data = run_aws_command(f"aws apigateway get-rest-api --rest-api-id {config['API_ID']}")
-    validation_results['API'] = api_data is not None
-    if validation_results['API']:
-        logger.debug("  ✓ API encontrada")
-    else:
-        logger.debug("  ✗ API no encontrada")
-
-    # Validar que la stage variable existe
-    logger.debug("Verificando variable de stage...")
-    stages_data = run_aws_command(f"aws apigateway get-stages --rest-api-id {config['API_ID']}")
-    validation_results['CONFIG_CONNECTION_TYPE_VARIABLE'] = False
-    if stages_data and 'item' in stages_data:
-        for stage in stages_data['item']:
-            stage_vars = stage.get('variables', {})
-            if config['CONNECTION_VARIABLE'] in stage_vars:
-                validation_results['CONFIG_CONNECTION_TYPE_VARIABLE'] = True
-                break
-    if validation_results['CONFIG_CONNECTION_TYPE_VARIABLE']:
-        logger.debug("  ✓ Variable VPC Link encontrada")
-    else:
-        logger.debug("  ✗ Variable VPC Link no encontrada")
+    api_id = config['API_ID']
 
     # Validar Authorizer y Cognito Pool solo si el método de autenticación es AUTHORIZER
     auth_method = config.get('AUTH_METHOD', 'AUTHORIZER')
 
-    if auth_method == 'AUTHORIZER':
-        # Validar Authorizer
-        logger.debug("Verificando Authorizer...")
-        authorizers = run_aws_command(f"aws apigateway get-authorizers --rest-api-id {config['API_ID']}")
-        validation_results['AUTHORIZER'] = False
-        if authorizers and 'items' in authorizers:
-            validation_results['AUTHORIZER'] = any(auth['id'] == config['AUTHORIZER_ID'] for auth in authorizers['items'])
-        if validation_results['AUTHORIZER']:
-            logger.debug("  ✓ Authorizer encontrado")
+    # Las consultas son independientes: se lanzan todas a la vez y los
+    # resultados se evalúan en orden para mantener la salida estable
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        api_future = executor.submit(_api_exists, api_id)
+        stages_future = executor.submit(_get_stages, api_id)
+        if auth_method == 'AUTHORIZER':
+            authorizers_future = executor.submit(_get_authorizers, api_id)
+            pools_future = executor.submit(_list_user_pools)
+
+        # Validar API
+        logger.debug("Verificando API...")
+        validation_results['API'] = api_future.result()
+        if validation_results['API']:
+            logger.debug("  ✓ API encontrada")
         else:
-            logger.debug("  ✗ Authorizer no encontrado")
-
-        # Validar Cognito Pool
-        logger.debug("Verificando Cognito Pool...")
-        pools = run_aws_command("aws cognito-idp list-user-pools --max-results 60")
-        validation_results['COGNITO_POOL'] = False
-        if pools and 'UserPools' in pools:
-            validation_results['COGNITO_POOL'] = any(pool['Name'] == config['COGNITO_POOL'] for pool in pools['UserPools'])
-        if validation_results['COGNITO_POOL']:
-            logger.debug("  ✓ Cognito Pool encontrado")
+            logger.debug("  ✗ API no encontrada")
+
+        # Validar que la stage variable existe
+        logger.debug("Verificando variable de stage...")
+        stages = stages_future.result()
+        validation_results['CONFIG_CONNECTION_TYPE_VARIABLE'] = False
+        if stages:
+            for stage in stages:
+                stage_vars = stage.get('variables', {})
+                if config['CONNECTION_VARIABLE'] in stage_vars:
+                    validation_results['CONFIG_CONNECTION_TYPE_VARIABLE'] = True
+                    break
+        if validation_results['CONFIG_CONNECTION_TYPE_VARIABLE']:
+            logger.debug("  ✓ Variable VPC Link encontrada")
         else:
-            logger.debug("  ✗ Cognito Pool no encontrado")
-    else:
-        # Si es API_KEY, no necesita validar Authorizer ni Cognito Pool
-        logger.debug("Validación de Authorizer y Cognito Pool omitida (método: API_KEY)")
-        validation_results['AUTHORIZER'] = True
-        validation_results['COGNITO_POOL'] = True
+            logger.debug("  ✗ Variable VPC Link no encontrada")
+
+        if auth_method == 'AUTHORIZER':
+            # Validar Authorizer
+            logger.debug("Verificando Authorizer...")
+            authorizers = authorizers_future.result()
+            validation_results['AUTHORIZER'] = False
+            if authorizers:
+                validation_results['AUTHORIZER'] = any(auth['id'] == config['AUTHORIZER_ID'] for auth in authorizers)
+            if validation_results['AUTHORIZER']:
+                logger.debug("  ✓ Authorizer encontrado")
+            else:
+                logger.debug("  ✗ Authorizer no encontrado")
+
+            # Validar Cognito Pool
+            logger.debug("Verificando Cognito Pool...")
+            pools = pools_future.result()
+            validation_results['COGNITO_POOL'] = False
+            if pools:
+                validation_results['COGNITO_POOL'] = any(pool['Name'] == config['COGNITO_POOL'] for pool in pools)
+            if validation_results['COGNITO_POOL']:
+                logger.debug("  ✓ Cognito Pool encontrado")
+            else:
+                logger.debug("  ✗ Cognito Pool no encontrado")
+        else:
+            # Si es API_KEY, no necesita validar Authorizer ni Cognito Pool
+            logger.debug("Validación de Authorizer y Cognito Pool omitida (método: API_KEY)")
+            validation_results['AUTHORIZER'] = True
+            validation_results['COGNITO_POOL'] = True
 
     return validation_results
 
@@ -867,12 +1316,11 @@ def select_configuration_source() -> Optional[Dict[str, Any]]:
 
     if profiles:
         print_menu_header("¿Cómo deseas configurar la API?")
-        print_menu_option(1, "Cargar perfil de configuración existente", emoji="📂")
-        print_menu_option(2, "Crear nueva configuración", emoji="⚙️")
+        sys.stdout.write(_CONFIG_SOURCE_MENU)
 
         while True:
             try:
-                choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona una opción: "))
+                choice = int(input(_ARROW_NL + "Selecciona una opción: "))
                 if choice == 1:
                     return select_existing_profile(profiles)
                 elif choice == 2:
@@ -910,6 +1358,7 @@ class MenuManager:
     MAIN_MENU_OPTIONS = [
         MenuOption("load_profile", "Cargar perfil existente y crear recursos", emoji="📂"),
         MenuOption("create_profile_and_resources", "Crear nuevo perfil y recurso", emoji="⚙️"),
+        MenuOption("refresh_aws_cache", "Refrescar datos de AWS (limpiar caché)", emoji="🔄"),
     ]
 
     @staticmethod
@@ -928,12 +1377,11 @@ class MenuManager:
             ValueError: Si el usuario introduce entrada inválida
         """
         print_menu_header(title)
-        for i, option in enumerate(options, 1):
-            print_menu_option(i, option.text, emoji=option.emoji)
+        print_menu_options((option.text, option.emoji) for option in options)
 
         while True:
             try:
-                choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona una opción: "))
+                choice = int(input(_ARROW_NL + "Selecciona una opción: "))
                 if 1 <= choice <= len(options):
                     selected = options[choice - 1]
                     logger.debug(f"Opción seleccionada: {selected.key}")
@@ -992,7 +1440,7 @@ def create_profile_workflow(config_manager: ConfigManager) -> Optional[Dict[str,
         return None
 
     # Preguntar si desea guardar como perfil (OPCIONAL, no bloquea la creación)
-    save_profile = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿Deseas guardar esta configuración como perfil? (s/n): ").lower()
+    save_profile = input(_ARROW_NL + "¿Deseas guardar esta configuración como perfil? (s/n): ").lower()
     if save_profile == 's':
         if save_configuration_profile(config, config_manager):
             logger.success("✓ Perfil guardado exitosamente. Puedes reutilizarlo en el futuro.")
@@ -1004,16 +1452,15 @@ def create_profile_workflow(config_manager: ConfigManager) -> Optional[Dict[str,
     # IMPORTANTE: Retornar la config SIEMPRE, independiente de si se guardó o no
     return config
 
-def select_existing_profile(profiles: List[str]) -> Optional[Dict[str, Any]]:
+def select_existing_profile(profiles: Sequence[str]) -> Optional[Dict[str, Any]]:
     """Permite seleccionar un perfil existente de la lista"""
     clear_screen()
     print_menu_header("📋 Perfiles de configuración disponibles")
-    for i, profile in enumerate(profiles):
-        print_menu_option(i + 1, profile, emoji="📄")
+    print_menu_options((profile, "📄") for profile in profiles)
 
     while True:
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona un perfil: "))
+            choice = int(input(_ARROW_NL + "Selecciona un perfil: "))
             if 1 <= choice <= len(profiles):
                 selected_profile = profiles[choice - 1]
                 config = load_configuration_profile(selected_profile)
@@ -1026,29 +1473,59 @@ def select_existing_profile(profiles: List[str]) -> Optional[Dict[str, Any]]:
         except ValueError:
             logger.error("Por favor, introduce un número.")
 
+def _is_profile_validated(profile_name: str) -> bool:
+    """Indica si el perfil pasó la validación recientemente y su archivo no ha cambiado."""
+    validated = _read_json_cache(cache_dir / _VALIDATED_PROFILES_FILE, ttl=PROFILE_VALIDATION_TTL_SECONDS) or {}
+    entry = validated.get(profile_name)
+    if not entry:
+        return False
+    try:
+        mtime_ns = (profiles_dir / f"{profile_name}.ini").stat().st_mtime_ns
+    except OSError:
+        return False
+    return entry["mtime_ns"] == mtime_ns and time.time() - entry["ts"] < PROFILE_VALIDATION_TTL_SECONDS
+
+
+def _mark_profile_validated(profile_name: str) -> None:
+    """Registra la validación correcta del perfil junto a la huella (mtime) de su archivo."""
+    cache_path = cache_dir / _VALIDATED_PROFILES_FILE
+    try:
+        mtime_ns = (profiles_dir / f"{profile_name}.ini").stat().st_mtime_ns
+    except OSError:
+        return
+    validated = _read_json_cache(cache_path, ttl=PROFILE_VALIDATION_TTL_SECONDS) or {}
+    validated[profile_name] = {"mtime_ns": mtime_ns, "ts": time.time()}
+    _write_json_cache(cache_path, validated)
+
+
 def validate_and_confirm_profile(config: Dict[str, Any], profile_name: str) -> Optional[Dict[str, Any]]:
     """Valida un perfil cargado y permite al usuario confirmarlo o modificarlo"""
-    # Validar recursos
-    validation_results = validate_configuration_profile(config)
-
-    # Mostrar resumen de validación
-    print(f"\n{ANSIColors.CYAN}📊 Resultados de Validación para '{profile_name}':{ANSIColors.RESET}")
-    for resource, is_valid in validation_results.items():
-        if is_valid:
-            print(f"  {ANSIColors.GREEN}✓{ANSIColors.RESET} {resource}")
-        else:
-            print(f"  {ANSIColors.RED}✗{ANSIColors.RESET} {resource}")
+    # Validar recursos (se omite si el perfil no cambió desde la última validación correcta)
+    if _is_profile_validated(profile_name):
+        logger.info(f"Perfil '{profile_name}' validado recientemente, se omite la validación en AWS")
+    else:
+        validation_results = validate_configuration_profile(config)
 
-    # Si hay errores, avisar
-    invalid_resources = [k for k, v in validation_results.items() if not v]
-    if invalid_resources:
-        print_box_message(f"Recursos inválidos: {', '.join(invalid_resources)}\nNecesitas reconfigurar estos elementos.", style="warning")
+        # Mostrar resumen de validación
+        print(f"\n{ANSIColors.CYAN}📊 Resultados de Validación para '{profile_name}':{ANSIColors.RESET}")
+        for resource, is_valid in validation_results.items():
+            if is_valid:
+                print(f"  {ANSIColors.GREEN}✓{ANSIColors.RESET} {resource}")
+            else:
+                print(f"  {ANSIColors.RED}✗{ANSIColors.RESET} {resource}")
 
-        retry = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿Deseas intentar reconfigurar manualmente? (s/n): ").lower()
-        if retry == 's':
-            return None
-        else:
-            return None
+        # Si hay errores, avisar
+        invalid_resources = [k for k, v in validation_results.items() if not v]
+        if invalid_resources:
+            print_box_message(f"Recursos inválidos: {', '.join(invalid_resources)}\nNecesitas reconfigurar estos elementos.", style="warning")
+
+            retry = input(_ARROW_NL + "¿Deseas intentar reconfigurar manualmente? (s/n): ").lower()
+            if retry == 's':
+                return None
+            else:
+                return None
+
+        _mark_profile_validated(profile_name)
 
     # Mostrar resumen de la configuración
     logger.section(f"RESUMEN DEL PERFIL: {profile_name}")
@@ -1061,13 +1538,11 @@ def validate_and_confirm_profile(config: Dict[str, Any], profile_name: str) -> O
     print_summary_item("Tipo de CORS", config['CORS_TYPE'])
 
     print_menu_header("¿Qué deseas hacer?")
-    print_menu_option(1, "Continuar con esta configuración", emoji="✅")
-    print_menu_option(2, "Seleccionar otro perfil", emoji="🔄")
-    print_menu_option(3, "Crear nueva configuración manualmente", emoji="⚙️")
+    sys.stdout.write(_PROFILE_ACTIONS_MENU)
 
     while True:
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona una opción: "))
+            choice = int(input(_ARROW_NL + "Selecciona una opción: "))
             if choice == 1:
                 logger.success("Continuando con esta configuración")
                 return config
@@ -1106,21 +1581,19 @@ def manage_headers(config_manager: ConfigManager, auth_type: str) -> Dict[str, s
         print_headers_summary(all_headers, "Headers Actuales")
 
         print_menu_header("Gestión de Headers")
-        print_menu_option(1, "Agregar nuevo header", emoji="➕")
-        print_menu_option(2, "Remover header", emoji="➖")
-        print_menu_option(3, "Continuar con estos headers", emoji="✅")
+        sys.stdout.write(_HEADERS_MENU)
 
         try:
-            choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona una opción: "))
+            choice = int(input(_ARROW_NL + "Selecciona una opción: "))
 
             if choice == 1:
                 # Agregar nuevo header
-                header_name = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Nombre del header: ").strip()
+                header_name = input(_ARROW + "Nombre del header: ").strip()
                 if not header_name:
                     logger.error("El nombre del header no puede estar vacío")
                     continue
 
-                header_value = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Valor del header: ").strip()
+                header_value = input(_ARROW + "Valor del header: ").strip()
                 if not header_value:
                     logger.error("El valor del header no puede estar vacío")
                     continue
@@ -1136,11 +1609,10 @@ def manage_headers(config_manager: ConfigManager, auth_type: str) -> Dict[str, s
 
                 print_menu_header("Selecciona el header a remover")
                 items = list(all_headers.items())
-                for i, (key, value) in enumerate(items):
-                    print_menu_option(i + 1, f"{key}", emoji="🗑️")
+                print_menu_options((key, "🗑️") for key, _ in items)
 
                 try:
-                    remove_choice = int(input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} Selecciona el header a remover: "))
+                    remove_choice = int(input(_ARROW_NL + "Selecciona el header a remover: "))
                     if 1 <= remove_choice <= len(items):
                         key_to_remove = items[remove_choice - 1][0]
 
@@ -1174,20 +1646,20 @@ def get_endpoint_and_methods(reuse_methods: List[str] = None, config_manager: Co
         http_methods = select_http_methods()
     else:
         logger.info(f"📋 Reutilizando métodos base: {', '.join(reuse_methods)}")
-        change_methods = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿Deseas cambiar los métodos para este endpoint? (s/n): ").lower()
+        change_methods = input(_ARROW + "¿Deseas cambiar los métodos para este endpoint? (s/n): ").lower()
         if change_methods == 's':
             http_methods = select_http_methods()
         else:
             http_methods = reuse_methods
 
     print(f"\n{ANSIColors.CYAN}Por favor, introduce el siguiente valor:{ANSIColors.RESET}")
-    full_backend_path = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Path COMPLETO del backend (ej: /discounts/b2c/campaigns/{{id}}): ")
+    full_backend_path = input(_ARROW + "Path COMPLETO del backend (ej: /discounts/b2c/campaigns/{id}): ")
 
     # Gestión de headers si se proporciona config_manager y auth_type
     custom_headers = {}
     if config_manager and auth_type:
         print()
-        manage_headers_choice = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿Deseas gestionar headers para este endpoint? (s/n): ").lower()
+        manage_headers_choice = input(_ARROW + "¿Deseas gestionar headers para este endpoint? (s/n): ").lower()
         if manage_headers_choice == 's':
             custom_headers = manage_headers(config_manager, auth_type)
 
@@ -1202,33 +1674,46 @@ def get_interactive_config(config_manager: ConfigManager) -> Optional[Dict[str,
     api_id = select_api_grouped()
     if not api_id: return None
 
+    # Precargar las etapas (siempre se usan) mientras el usuario responde los menús
+    executor = ThreadPoolExecutor(max_workers=2)
+    stages_future = executor.submit(_get_stages, api_id)
+
     # Seleccionar método de autenticación
     auth_method = select_auth_method()
-    if not auth_method: return None
+    if not auth_method:
+        executor.shutdown(wait=False)
+        return None
 
     authorizer_id = None
     cognito_pool = None
 
     if auth_method == "AUTHORIZER":
+        # Authorizers y user pools solo se consultan en este flujo (API Key no
+        # requiere permisos de cognito-idp). Ambas consultas van en paralelo y
+        # terminan antes del primer menú, así sus errores no se imprimen encima
+        pools_future = executor.submit(_list_user_pools)
+        executor.shutdown(wait=False)
+        authorizers = _get_authorizers(api_id)
+        user_pools = pools_future.result()
+
         # Si es Authorizer, pedir que seleccione uno
-        authorizers_data = run_aws_command(f"aws apigateway get-authorizers --rest-api-id {api_id}")
-        if not authorizers_data or 'items' not in authorizers_data: return None
-        authorizer_id = select_from_menu("Selecciona el Authorizer:", authorizers_data['items'], return_key='id')
+        if not authorizers: return None
+        authorizer_id = select_from_menu("Selecciona el Authorizer:", list(authorizers), return_key='id')
         if not authorizer_id: return None
 
-        user_pools_data = run_aws_command("aws cognito-idp list-user-pools --max-results 60")
-        if not user_pools_data or 'UserPools' not in user_pools_data: return None
-        cognito_pool = select_from_menu("Selecciona el Cognito User Pool:", user_pools_data['UserPools'], name_key='Name', return_key='Name')
+        if not user_pools: return None
+        cognito_pool = select_from_menu("Selecciona el Cognito User Pool:", list(user_pools), name_key='Name', return_key='Name')
         if not cognito_pool: return None
     else:
+        executor.shutdown(wait=False)
         # Si es API Key, no necesita authorizer ni cognito pool
         logger.info("API Key seleccionada - no requiere Authorizer ni Cognito Pool")
 
     # Seleccionar Stage
-    stages_data = run_aws_command(f"aws apigateway get-stages --rest-api-id {api_id}")
-    if not stages_data or 'item' not in stages_data: return None
+    stages = stages_future.result()
+    if not stages: return None
 
-    selected_stage = select_from_menu("Selecciona la Etapa (Stage) de la API:", stages_data['item'], name_key='stageName', return_key=None)
+    selected_stage = select_from_menu("Selecciona la Etapa (Stage) de la API:", list(stages), name_key='stageName', return_key=None)
     if not selected_stage: return None
 
     # Extraer variables de etapa
@@ -1236,12 +1721,12 @@ def get_interactive_config(config_manager: ConfigManager) -> Optional[Dict[str,
     if not stage_variables:
         print(f"{ANSIColors.WARNING}⚠️  La etapa '{selected_stage['stageName']}' no tiene variables definidas.{ANSIColors.RESET}")
         print(f"\n{ANSIColors.CYAN}Por favor, introduce los siguientes valores:{ANSIColors.RESET}")
-        connection_variable = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Nombre de la variable de etapa para VPC Link (ej: vpcLinkId): ").strip()
+        connection_variable = input(_ARROW + "Nombre de la variable de etapa para VPC Link (ej: vpcLinkId): ").strip()
         if not connection_variable:
             logger.error("La variable de conexión es requerida")
             return None
 
-        backend_host = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Host del backend (ej: https://${{stageVariables.urlBackend}}): ").strip()
+        backend_host = input(_ARROW + "Host del backend (ej: https://${stageVariables.urlBackend}): ").strip()
         if not backend_host:
             logger.error("El host del backend es requerido")
             return None
@@ -1290,7 +1775,7 @@ def get_interactive_config(config_manager: ConfigManager) -> Optional[Dict[str,
     print_summary_item("Tipo de Autorización", config["AUTH_TYPE"])
     print_summary_item("Tipo de CORS", config["CORS_TYPE"])
 
-    confirm = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿La configuración es correcta? (s/n): ").lower()
+    confirm = input(_ARROW_NL + "¿La configuración es correcta? (s/n): ").lower()
     if confirm == 's':
         logger.success("Configuración confirmada")
         return config
@@ -1308,63 +1793,188 @@ class APIGatewayManager:
         self.connection_variable = connection_variable
         self.authorizer_id = authorizer_id
         self.config = config_manager
-        
-    def run_command(self, command: str, description: str, ignore_conflict: bool = False) -> Dict:
+        # Cambios sin desplegar: se hace un único create-deployment al final del lote
+        self.pending_changes = False
+        # Métodos (ruta, método) que admiten caché de etapa: GET sin autorización
+        self.cacheable_methods: Set[Tuple[str, str]] = set()
+        # Índice de recursos persistido entre ejecuciones (TTL corto)
+        self._cache_path = cache_dir / f"{api_id}_resources.json"
+        # Índice path -> id en memoria: un único get-resources por instancia
+        self._resources_by_path: Optional[Dict[str, str]] = None
+        # Invariantes de todos los métodos: se resuelven una sola vez
+        self._connection_id_ref = f"${{stageVariables.{connection_variable}}}"
+        self._response_templates = config_manager.get_response_template()
+        # Cliente boto3 compartido (None => fallback a AWS CLI)
+        self.client = get_aws_client("apigateway") if _USE_BOTO3 else None
+
+    def run_command(self, operation: str, params: Dict[str, Any], description: str, ignore_conflict: bool = False) -> Dict:
+        """
+        Ejecuta una operación de API Gateway.
+
+        Args:
+            operation: Operación de boto3 en snake_case (ej: 'put_method').
+            params: Parámetros de la operación (ej: {'restApiId': ...}).
+            description: Texto de progreso para el log.
+            ignore_conflict: Si True, un ConflictException se trata como "ya existe".
+
+        Returns:
+            {'success': bool, 'data': respuesta} o {'success': False, 'error': mensaje}.
+        """
         logger.info(f"{description}...")
+        sys.stdout.flush()  # la consola va por líneas; con stdout redirigido, vuelca el progreso antes de esperar a AWS
 
         try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, check=False)
+            response, error, error_code = self._execute(operation, params)
 
-            if result.returncode == 0:
+            if error is None:
                 logger.success(description)
-                response = json.loads(result.stdout) if result.stdout.strip() else {}
                 return {"success": True, "data": response}
-            else:
-                if ignore_conflict and "ConflictException" in result.stderr:
-                    logger.warning(f"{description} - Ya existe, continuando...")
-                    return {"success": True, "data": {}, "existed": True}
-                else:
-                    error_msg = f"Error en {description} - Comando: {command}"
-                    logger.dump_error(f"{error_msg}\nSTDERR: {result.stderr}\nSTDOUT: {result.stdout}")
-                    logger.error(f"{description} - Error: {result.stderr}")
-                    return {"success": False, "error": result.stderr}
+            # Un conflicto por modificación concurrente que agotó los reintentos no es "ya existe"
+            if ignore_conflict and error_code == "ConflictException" and not _is_concurrent_modification(error_code, error):
+                logger.warning(f"{description} - Ya existe, continuando...")
+                return {"success": True, "data": {}, "existed": True}
+
+            error_msg = f"Error en {description} - Operación: apigateway {operation}"
+            logger.dump_error(f"{error_msg}\nPARAMS: {json.dumps(params, default=str)}\nERROR: {error}")
+            logger.error(f"{description} - Error: {error}")
+            return {"success": False, "error": error}
 
         except json.JSONDecodeError as e:
-            error_msg = f"Error parseando JSON en {description} - Comando: {command}"
+            error_msg = f"Error parseando JSON en {description} - Operación: apigateway {operation}"
             logger.dump_error(error_msg, e)
             logger.error(f"Error parseando JSON en {description}")
             return {"success": False, "error": "JSON parse error"}
         except Exception as e:
-            error_msg = f"Excepción en {description} - Comando: {command}"
+            error_msg = f"Excepción en {description} - Operación: apigateway {operation}"
             logger.dump_error(error_msg, e)
             logger.error(f"Excepción en {description}: {e}")
             return {"success": False, "error": str(e)}
-    
+
+    def _execute(self, operation: str, params: Dict[str, Any]) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+        """
+        Ejecuta la operación reintentando throttling y los ConflictException por
+        modificación concurrente, que API Gateway devuelve cuando varias escrituras
+        sobre la misma API se solapan (no significan que el recurso ya exista).
+
+        Con boto3 el modo de reintentos adaptativo ya absorbe el throttling; este
+        bucle cubre los conflictos concurrentes y el fallback a AWS CLI.
+
+        Returns:
+            (respuesta, None, None) si tuvo éxito o (None, mensaje, código de error).
+        """
+        call = self._call_boto3 if self.client is not None else self._call_cli
+        for attempt in range(DEFAULT_MAX_RETRIES + 1):
+            response, error, error_code = call(operation, params)
+            retryable = error_code in _THROTTLING_ERROR_CODES or _is_concurrent_modification(error_code, error)
+            if not retryable or attempt == DEFAULT_MAX_RETRIES:
+                return response, error, error_code
+            time.sleep(0.5 * 2 ** attempt)
+        return response, error, error_code
+
+    def _call_boto3(self, operation: str, params: Dict[str, Any]) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        try:
+            if self.client.can_paginate(operation):
+                pagination = {"PageSize": _PAGE_SIZES[operation]} if operation in _PAGE_SIZES else {}
+                pages = self.client.get_paginator(operation).paginate(PaginationConfig=pagination, **params)
+                return pages.build_full_result(), None, None
+            response = getattr(self.client, operation)(**params)
+            response.pop("ResponseMetadata", None)
+            return response, None, None
+        except ClientError as e:
+            return None, str(e), e.response.get("Error", {}).get("Code")
+        except BotoCoreError as e:
+            return None, str(e), None
+
+    @staticmethod
+    def _call_cli(operation: str, params: Dict[str, Any]) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+        # communicate() drena stdout y stderr a la vez; stdout queda en bytes
+        # para que el parser JSON lo consuma sin decodificarlo a str
+        command = _cli_argv("apigateway", operation, params)
+        if operation in _PAGE_SIZES:
+            command += ["--page-size", str(_PAGE_SIZES[operation])]
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+            stdout, stderr = process.communicate()
+        if process.returncode != 0:
+            error = stderr.decode("utf-8", errors="replace")
+            # El CLI no expone el código de error salvo en el mensaje:
+            # "An error occurred (ConflictException) when calling ..."
+            match = _CLI_ERROR_CODE_RE.search(error)
+            return None, error, match.group(1) if match else None
+        return (json_loads(stdout) if stdout.strip() else {}), None, None
+
+    def _load_cached_resources(self) -> Optional[List[Dict]]:
+        """Retorna el índice de recursos en disco si existe y no ha expirado."""
+        return _read_json_cache(self._cache_path)
+
+    def _save_cached_resources(self, resources: List[Dict]) -> None:
+        """Escribe el índice de recursos en la caché local."""
+        _write_json_cache(self._cache_path, resources)
+
+    def _load_resources(self, force: bool = False, description: str = "Obteniendo recursos") -> Optional[Dict[str, str]]:
+        """
+        Retorna el índice path -> id de los recursos de la API.
+
+        Se resuelve una vez por instancia: desde memoria, desde la caché en disco
+        o con un único get-resources (paginado).
+
+        Args:
+            force: Si True, ignora las cachés y vuelve a consultar a AWS.
+            description: Texto de progreso si hay que consultar a AWS.
+        """
+        if self._resources_by_path is not None and not force:
+            return self._resources_by_path
+
+        cached = None if force else self._load_cached_resources()
+        if cached is not None:
+            logger.debug(f"{description} (caché local)")
+            resources = cached
+        else:
+            result = self.run_command("get_resources", {"restApiId": self.api_id}, description)
+            if not result["success"]:
+                return None
+            resources = [{"id": r["id"], "path": r["path"]} for r in result["data"].get("items", [])]
+            self._save_cached_resources(resources)
+
+        self._resources_by_path = {r["path"]: r["id"] for r in resources}
+        return self._resources_by_path
+
+    def invalidate_resources(self) -> None:
+        """
+        Descarta el índice de recursos en memoria y en disco.
+
+        Se usa tras crear endpoints vía Lambda, que modifica la API sin pasar por
+        este gestor: la siguiente consulta vuelve a leer get-resources.
+        """
+        self._resources_by_path = None
+        try:
+            self._cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"No se pudo borrar la caché de recursos: {e}")
+
+    def _add_resource(self, path: str, resource_id: str) -> None:
+        """Agrega un recurso recién creado al índice en memoria y en disco."""
+        self._resources_by_path[path] = resource_id
+        self._save_cached_resources([{"id": rid, "path": p} for p, rid in self._resources_by_path.items()])
+
     def get_root_resource_id(self) -> Optional[str]:
-        command = f"aws apigateway get-resources --rest-api-id {self.api_id}"
-        result = self.run_command(command, "Obteniendo recursos")
-        
-        if result["success"]:
-            resources = result["data"].get("items", [])
-            root_resource = next((r for r in resources if r["path"] == "/"), None)
-            if root_resource:
-                return root_resource["id"]
-        return None
+        resources = self._load_resources()
+        return resources.get("/") if resources else None
     
     def parse_uri_path(self, uri_path: str) -> List[Dict]:
         clean_path = uri_path.strip("/")
         segments = clean_path.split("/") if clean_path else []
         
         path_parts = []
-        current_path = ""
+        # Rutas acumuladas: /a, /a/b, /a/b/c ...
+        paths = accumulate("/" + segment for segment in segments)
         
-        for segment in segments:
-            current_path += "/" + segment
-            
-            if "{" in segment and "}" in segment:
-                param_name = re.findall(r'\{(\w+)\}', segment)[0]
+        for segment, current_path in zip(segments, paths):
+            param_match = PARAMETER_PLACEHOLDER_RE.search(segment)
+            if param_match:
                 path_parts.append({
-                    "path": current_path, "segment": segment, "is_param": True, "param_name": param_name
+                    "path": current_path, "segment": segment, "is_param": True, "param_name": param_match.group(1)
                 })
             else:
                 path_parts.append({
@@ -1373,20 +1983,15 @@ class APIGatewayManager:
         return path_parts
     
     def find_resource_by_path(self, target_path: str) -> Optional[str]:
-        command = f"aws apigateway get-resources --rest-api-id {self.api_id}"
-        result = self.run_command(command, f"Buscando recurso para path: {target_path}")
-
-        if result["success"]:
-            resources = result["data"].get("items", [])
-            resource = next((r for r in resources if r["path"] == target_path), None)
-            if resource:
-                logger.debug(f"  ✓ Recurso encontrado: {resource['id']} -> {target_path}")
-                return resource["id"]
-        return None
+        resources = self._load_resources(description=f"Buscando recurso para path: {target_path}")
+        resource_id = resources.get(target_path) if resources else None
+        if resource_id:
+            logger.debug(f"  ✓ Recurso encontrado: {resource_id} -> {target_path}")
+        return resource_id
 
     def create_resource(self, parent_id: str, path_part: str) -> Optional[str]:
-        command = f"""aws apigateway create-resource --rest-api-id {self.api_id} --parent-id {parent_id} --path-part {path_part}"""
-        result = self.run_command(command, f"Creando recurso: {path_part}")
+        params = {"restApiId": self.api_id, "parentId": parent_id, "pathPart": path_part}
+        result = self.run_command("create_resource", params, f"Creando recurso: {path_part}")
 
         if result["success"]:
             resource_id = result["data"]["id"]
@@ -1404,45 +2009,119 @@ class APIGatewayManager:
         logger.info(f"Analizando path de API Gateway: {uri_path}")
         logger.debug(f"Segmentos a crear: {[p['segment'] for p in path_parts]}")
 
-        parent_id = self.get_root_resource_id()
-        final_resource_id = parent_id
+        # Índice compartido por todos los endpoints; los recursos creados se agregan localmente
+        resource_ids = self._load_resources()
+        if resource_ids is None:
+            return None
 
-        for i, part in enumerate(path_parts):
-            existing_id = self.find_resource_by_path(part["path"])
+        # El primer segmento inexistente y todos sus descendientes deben crearse
+        first_missing = next(
+            (i for i, part in enumerate(path_parts) if part["path"] not in resource_ids), None
+        )
+        if first_missing is None:
+            return resource_ids[path_parts[-1]["path"]]
+
+        missing = path_parts[first_missing:]
+        # Una sola confirmación para todos los recursos que faltan
+        missing_paths = ", ".join(part["path"] for part in missing)
+        confirm = input(f"\nLos recursos {missing_paths} no existen. ¿Crearlos? (s/n): ").lower()
+        if confirm != 's':
+            logger.warning("Creación cancelada por el usuario")
+            return None
 
-            if existing_id:
-                final_resource_id = existing_id
-                parent_id = existing_id
-            else:
-                prompt = f"\nEl recurso '{part['segment']}' no existe. ¿Crearlo? (s/n): "
-                confirm = input(prompt).lower()
+        if len(missing) > 1 and os.environ.get(BATCH_RESOURCES_ENV_VAR) == "1":
+            return self._import_resources(missing[-1]["path"])
 
-                if confirm != 's':
-                    logger.warning("Creación cancelada por el usuario")
-                    return None
+        parent_id = resource_ids[path_parts[first_missing - 1]["path"]] if first_missing else resource_ids.get("/")
+        for part in missing:
+            new_id = self.create_resource(parent_id, part["segment"])
+            if not new_id:
+                logger.error(f"Error creando recurso para {part['segment']}")
+                return None
+            self._add_resource(part["path"], new_id)
+            parent_id = new_id
+        return parent_id
 
-                new_id = self.create_resource(parent_id, part["segment"])
-                if new_id:
-                    final_resource_id = new_id
-                    parent_id = new_id
-                else:
-                    logger.error(f"Error creando recurso para {part['segment']}")
-                    return None
-        return final_resource_id
+    def _import_resources(self, leaf_path: str) -> Optional[str]:
+        """
+        Crea en una sola llamada todos los recursos que faltan hasta `leaf_path`.
+
+        Importa en modo merge un OpenAPI mínimo con un OPTIONS MOCK en la hoja
+        (API Gateway no crea rutas sin métodos); create_options_method lo
+        reconfigura después con los headers CORS.
+
+        Returns:
+            ID del recurso hoja o None si falla.
+        """
+        api = self.run_command("get_rest_api", {"restApiId": self.api_id}, "Obteniendo definición de la API")
+        if not api["success"]:
+            return None
+
+        spec = {
+            "openapi": "3.0.1",
+            # merge conserva el resto de la API; el título debe coincidir para no renombrarla
+            "info": {"title": api["data"]["name"], "version": "1.0"},
+            "paths": {
+                leaf_path: {
+                    "options": {
+                        "parameters": [
+                            {"name": param, "in": "path", "required": True, "schema": {"type": "string"}}
+                            for param in PARAMETER_PLACEHOLDER_RE.findall(leaf_path)
+                        ],
+                        "responses": {"200": {"description": "CORS"}},
+                        "x-amazon-apigateway-integration": {
+                            "type": "mock",
+                            "requestTemplates": {"application/json": '{"statusCode": 200}'},
+                            "responses": {"default": {"statusCode": "200"}},
+                        },
+                    }
+                }
+            },
+        }
+        params = {"restApiId": self.api_id, "mode": "merge", "body": json_dumps_bytes(spec)}
+        if not self.run_command("put_rest_api", params, f"Importando recursos hasta {leaf_path}")["success"]:
+            return None
+        self.pending_changes = True
+
+        resources = self._load_resources(force=True, description="Actualizando índice de recursos")
+        return resources.get(leaf_path) if resources else None
     
     def extract_path_parameters(self, uri_path: str) -> Dict[str, bool]:
-        params = {}
-        param_matches = re.findall(r'\{(\w+)\}', uri_path)
-        for param in param_matches:
-            params[f"method.request.path.{param}"] = True
-        return params
+        return {f"method.request.path.{param}": True for param in PARAMETER_PLACEHOLDER_RE.findall(uri_path)}
     
-    def create_http_method(self, resource_id: str, http_method: str, resource_path: str, backend_path: str, backend_host: str, auth_type: str, cognito_pool: str = None, custom_headers: Dict[str, str] = None, auth_method: str = "AUTHORIZER"):
+    def build_auth_headers(self, auth_type: str, custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Construye los headers de integración de un endpoint (una vez para todos sus métodos).
+
+        Args:
+            auth_type: Tipo de autorización (COGNITO_ADMIN, COGNITO_CUSTOMER, NO_AUTH).
+            custom_headers: Headers personalizados que se agregan a los de autorización.
+
+        Returns:
+            Diccionario nuevo con los headers (sin el marcador CognitoPool, que no es un header real).
+        """
+        auth_headers = {
+            key: value for key, value in self.config.get_auth_headers(auth_type).items()
+            if key != 'CognitoPool'
+        }
+        if custom_headers:
+            auth_headers.update(custom_headers)
+        return auth_headers
+
+    def create_http_method(self, resource_id: str, http_method: str, resource_path: str, backend_path: str, backend_host: str, auth_type: str, cognito_pool: str = None, custom_headers: Dict[str, str] = None, auth_method: str = "AUTHORIZER", auth_headers: Optional[Dict[str, str]] = None) -> Optional[Dict]:
         """
         Crea un método HTTP completo usando configuraciones .ini
 
+        Los GET sin autorización ni API Key se registran como cacheables: su clave
+        de caché son los path parameters (las respuestas no dependen del usuario).
+
         Args:
             auth_method: "AUTHORIZER" o "API_KEY" - determina el método de autenticación
+            auth_headers: Headers ya construidos con build_auth_headers (se comparten
+                entre los métodos de un endpoint). Si es None se construyen aquí.
+
+        Returns:
+            La respuesta de put-integration si todo el método se configuró, o None.
         """
         method_config = self.config.get_method_config(http_method)
 
@@ -1459,98 +2138,96 @@ class APIGatewayManager:
 
         if not authorizer_id and authorization_type == "COGNITO_USER_POOLS":
             logger.error(f"No se ha especificado ID de autorizador para {http_method}")
-            return False
-
-        # Los parámetros se extraen de la RUTA DE RECURSOS
-        path_params = self.extract_path_parameters(resource_path)
-
-        # Obtener headers de autorización
-        auth_headers = {}
-        if auth_type != "NO_AUTH":
-            auth_headers = self.config.get_auth_headers(auth_type)
-            # Reemplazar el placeholder del cognito pool si existe
-            for key, value in auth_headers.items():
-                if key == "CognitoPool" and cognito_pool:
-                    auth_headers[key] = f"'{cognito_pool}'"
-        else:
-            auth_headers = self.config.get_auth_headers("NO_AUTH")
+            return None
 
-        # Remover CognitoPool si existe (no es un header real)
-        auth_headers.pop('CognitoPool', None)
+        # Los parámetros se extraen una sola vez de la RUTA DE RECURSOS
+        param_names = PARAMETER_PLACEHOLDER_RE.findall(resource_path)
+        path_params = {f"method.request.path.{param}": True for param in param_names}
 
-        # Agregar headers personalizados si existen
-        if custom_headers:
-            auth_headers.update(custom_headers)
+        if auth_headers is None:
+            auth_headers = self.build_auth_headers(auth_type, custom_headers)
         
         # Crear método
-        method_command = f"""aws apigateway put-method --rest-api-id {self.api_id} --resource-id {resource_id} --http-method {http_method} --authorization-type {authorization_type}"""
+        method_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": http_method,
+            "authorizationType": authorization_type,
+            # Configurar API Key
+            "apiKeyRequired": auth_method == "API_KEY",
+        }
 
         if authorizer_id:
-            method_command += f" --authorizer-id {authorizer_id}"
-
-        # Configurar API Key
-        if auth_method == "API_KEY":
-            method_command += " --api-key-required"
-        else:
-            method_command += " --no-api-key-required"
+            method_params["authorizerId"] = authorizer_id
         
         if path_params:
-            params_json = json.dumps(path_params).replace('"', '\\"')
-            method_command += f' --request-parameters "{params_json}"'
+            method_params["requestParameters"] = path_params
         
-        result = self.run_command(method_command, f"Creando método {http_method}", ignore_conflict=True)
+        result = self.run_command("put_method", method_params, f"Creando método {http_method}", ignore_conflict=True)
         if not result["success"]:
-            return False
-        
-        # Preparar headers de integración (solo auth headers)
-        integration_headers = auth_headers.copy()
-        
-        # Preparar path parameters para URL path parameters (no headers)
-        path_parameters = {}
-        param_matches = re.findall(r'\{(\w+)\}', resource_path)
-        for param in param_matches:
-            path_parameters[f"integration.request.path.{param}"] = f"method.request.path.{param}"
-        
-        # Agregar prefijo solo a los headers de autorización
-        prefixed_headers = {}
-        for key, value in integration_headers.items():
-            if not key.startswith('integration.request.header.'):
-                prefixed_headers[f"integration.request.header.{key}"] = value
-            else:
-                prefixed_headers[key] = value
-        
-        # Combinar headers y path parameters
-        all_request_parameters = {}
-        all_request_parameters.update(prefixed_headers)  # Headers de auth
-        all_request_parameters.update(path_parameters)   # Path parameters
+            return None
+        self.pending_changes = True
         
-        params_json = json.dumps(all_request_parameters).replace('"', '\\"')
+        # Headers de auth con prefijo de integración + path parameters de la URL
+        prefixed_headers = {
+            key if key.startswith('integration.request.header.') else f"integration.request.header.{key}": value
+            for key, value in auth_headers.items()
+        }
+        path_parameters = {
+            f"integration.request.path.{param}": f"method.request.path.{param}"
+            for param in param_names
+        }
+        all_request_parameters = {**prefixed_headers, **path_parameters}
         
         # La URI de integración se arma con la RUTA COMPLETA DEL BACKEND
         full_backend_uri = f"{backend_host}{backend_path}"
         logger.debug(f"  🔗 URI de Integración: {full_backend_uri}")
-        
-        # Usar stage variable para connection-id
-        connection_id_ref = f"${{stageVariables.{self.connection_variable}}}"
 
-        integration_command = f"""aws apigateway put-integration --rest-api-id {self.api_id} --resource-id {resource_id} --http-method {http_method} --type {method_config['integration_type']} --integration-http-method {http_method} --uri "{full_backend_uri}" --connection-type {method_config['connection_type']} --connection-id "{connection_id_ref}" --request-parameters "{params_json}" --passthrough-behavior {method_config['passthrough_behavior']} --timeout-in-millis {method_config['timeout_millis']}"""
-        
-        result = self.run_command(integration_command, f"Configurando integración {http_method}")
-        if not result["success"]:
-            return False
+        integration_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": http_method,
+            "type": method_config['integration_type'],
+            "integrationHttpMethod": http_method, "uri": full_backend_uri,
+            "connectionType": method_config['connection_type'], "connectionId": self._connection_id_ref,
+            "requestParameters": all_request_parameters,
+            "passthroughBehavior": method_config['passthrough_behavior'],
+            "timeoutInMillis": int(method_config['timeout_millis']),
+        }
+
+        # Solo respuestas públicas pueden compartirse en la caché de etapa: con
+        # autorización la clave (ruta + parámetros) mezclaría usuarios distintos
+        cacheable = http_method == "GET" and authorization_type == "NONE" and auth_method != "API_KEY"
+        if cacheable:
+            integration_params["cacheNamespace"] = resource_id
+            integration_params["cacheKeyParameters"] = list(path_params)
         
         # Configurar respuesta del método
-        models_json = json.dumps({"application/json": method_config['response_model']}).replace('"', '\\"')
-        method_response_command = f"""aws apigateway put-method-response --rest-api-id {self.api_id} --resource-id {resource_id} --http-method {http_method} --status-code {method_config['response_status_code']} --response-models "{models_json}" """
-        self.run_command(method_response_command, f"Configurando respuesta {http_method}", ignore_conflict=True)
+        method_response_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": http_method,
+            "statusCode": method_config['response_status_code'],
+            "responseModels": {"application/json": method_config['response_model']},
+        }
+
+        # En secuencia: escrituras paralelas sobre el mismo método provocan
+        # ConflictException por modificación concurrente
+        if not self.run_command("put_method_response", method_response_params, f"Configurando respuesta {http_method}", ignore_conflict=True)["success"]:
+            return None
+        result = self.run_command("put_integration", integration_params, f"Configurando integración {http_method}")
+        if not result["success"]:
+            return None
         
         # Configurar respuesta de integración
-        templates_dict = self.config.get_response_template()
-        templates_json_str = json.dumps(templates_dict).replace('"', '\\"')
-        integration_response_command = f"""aws apigateway put-integration-response --rest-api-id {self.api_id} --resource-id {resource_id} --http-method {http_method} --status-code {method_config['response_status_code']} --response-templates "{templates_json_str}" """
-        return self.run_command(integration_response_command, f"Configurando respuesta de integración {http_method}", ignore_conflict=True)["success"]
+        integration_response_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": http_method,
+            "statusCode": method_config['response_status_code'],
+            "responseTemplates": self._response_templates,
+        }
+        integration = result["data"]
+        if not self.run_command("put_integration_response", integration_response_params, f"Configurando respuesta de integración {http_method}", ignore_conflict=True)["success"]:
+            return None
+        if cacheable:
+            self.cacheable_methods.add((resource_path, http_method))
+        return integration
     
-    def create_options_method(self, resource_id: str, cors_type: str = "DEFAULT"):
+    def create_options_method(self, resource_id: str, cors_type: str = "DEFAULT") -> Optional[Dict]:
+        """Crea OPTIONS (CORS) como integración MOCK; retorna la respuesta de put-integration o None."""
         # Construir headers CORS desde configuración .ini
         cors_config = self.config.get_cors_headers(cors_type)
         cors_headers = {}
@@ -1560,49 +2237,108 @@ class APIGatewayManager:
             header_name = f"method.response.header.{key}"
             cors_headers[header_name] = value
             
-        method_command = f"""aws apigateway put-method --rest-api-id {self.api_id} --resource-id {resource_id} --http-method OPTIONS --authorization-type NONE --no-api-key-required"""
-        self.run_command(method_command, "Creando método OPTIONS", ignore_conflict=True)
-        
-        request_templates = {"application/json": '{"statusCode": 200}'}
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(request_templates, temp_file, indent=2)
-            temp_filename = temp_file.name
+        method_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": "OPTIONS",
+            "authorizationType": "NONE", "apiKeyRequired": False,
+        }
+        self.run_command("put_method", method_params, "Creando método OPTIONS", ignore_conflict=True)
+        self.pending_changes = True
         
-        try:
-            integration_command = f"""aws apigateway put-integration --rest-api-id {self.api_id} --resource-id {resource_id} --http-method OPTIONS --type MOCK --request-templates file://{temp_filename} --passthrough-behavior WHEN_NO_MATCH --timeout-in-millis {CONFIG_TIMEOUT_MS}"""
-            result = self.run_command(integration_command, "Configurando integración OPTIONS")
-            if not result["success"]: return False
-        finally:
-            if os.path.exists(temp_filename):
-                os.unlink(temp_filename)
+        integration_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": "OPTIONS", "type": "MOCK",
+            "requestTemplates": {"application/json": '{"statusCode": 200}'},
+            "passthroughBehavior": "WHEN_NO_MATCH", "timeoutInMillis": int(CONFIG_TIMEOUT_MS),
+        }
         
         # Generar response_params dinámicamente desde la configuración
         response_params = {}
         for key in cors_config.keys():
             header_name = f"method.response.header.{key}"
             response_params[header_name] = True
-        params_json = json.dumps(response_params).replace('"', '\\"')
-        method_response_command = f"""aws apigateway put-method-response --rest-api-id {self.api_id} --resource-id {resource_id} --http-method OPTIONS --status-code 200 --response-parameters "{params_json}" """
-        self.run_command(method_response_command, "Configurando respuesta OPTIONS", ignore_conflict=True)
+        method_response_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": "OPTIONS",
+            "statusCode": "200", "responseParameters": response_params,
+        }
+
+        # Respuesta del método e integración en secuencia (ver create_http_method)
+        if not self.run_command("put_method_response", method_response_params, "Configurando respuesta OPTIONS", ignore_conflict=True)["success"]:
+            return None
+        result = self.run_command("put_integration", integration_params, "Configurando integración OPTIONS")
+        if not result["success"]: return None
         
-        cors_json = json.dumps(cors_headers).replace('"', '\\"')
-        integration_response_command = f"""aws apigateway put-integration-response --rest-api-id {self.api_id} --resource-id {resource_id} --http-method OPTIONS --status-code 200 --response-parameters "{cors_json}" """
-        return self.run_command(integration_response_command, "Configurando headers CORS", ignore_conflict=True)["success"]
+        integration_response_params = {
+            "restApiId": self.api_id, "resourceId": resource_id, "httpMethod": "OPTIONS",
+            "statusCode": "200", "responseParameters": cors_headers,
+        }
+        integration = result["data"]
+        if not self.run_command("put_integration_response", integration_response_params, "Configurando headers CORS", ignore_conflict=True)["success"]:
+            return None
+        return integration
     
-    def verify_methods_integration(self, resource_id: str, http_methods: List[str]) -> bool:
-        print("🔍 Verificando integraciones de métodos...")
-        results = []
-        
-        for method in http_methods:
-            command = f"aws apigateway get-integration --rest-api-id {self.api_id} --resource-id {resource_id} --http-method {method}"
-            result = self.run_command(command, f"Verificando integración {method}")
-            results.append(result["success"])
-        
-        options_command = f"aws apigateway get-integration --rest-api-id {self.api_id} --resource-id {resource_id} --http-method OPTIONS"
-        options_result = self.run_command(options_command, "Verificando integración OPTIONS")
-        results.append(options_result["success"])
-        
-        return all(results)
+    def deploy(self, stage_name: str) -> bool:
+        """
+        Crea un único deployment con todos los cambios pendientes.
+
+        Args:
+            stage_name: Nombre de la etapa a desplegar.
+
+        Returns:
+            True si el deployment se creó correctamente.
+        """
+        params = {"restApiId": self.api_id, "stageName": stage_name}
+        result = self.run_command("create_deployment", params, f"Desplegando cambios en la etapa {stage_name}")
+        if result["success"]:
+            self.pending_changes = False
+        return result["success"]
+
+    def enable_stage_cache(self, stage_name: str, size: str = DEFAULT_STAGE_CACHE_SIZE, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        Habilita la caché de respuestas de API Gateway en una etapa.
+
+        Solo se activa en los métodos de cacheable_methods (GET públicos creados por
+        este gestor); los métodos con autorización nunca se cachean.
+
+        Args:
+            stage_name: Nombre de la etapa (ej: 'ci', 'dev').
+            size: Tamaño del cluster de caché en GB.
+            ttl_seconds: TTL aplicado a los métodos cacheables (opcional).
+
+        Returns:
+            True si la etapa se actualizó correctamente (o no había nada que cachear).
+        """
+        if not self.cacheable_methods:
+            logger.info("No hay métodos GET públicos que cachear: la caché de etapa no se habilita")
+            return True
+
+        patch_operations = [
+            {"op": "replace", "path": "/cacheClusterEnabled", "value": "true"},
+            {"op": "replace", "path": "/cacheClusterSize", "value": size},
+        ]
+        for resource_path, http_method in sorted(self.cacheable_methods):
+            # En las rutas de method settings '/' se escapa como '~1'
+            method_path = f"/{resource_path.replace('/', '~1')}/{http_method}"
+            patch_operations.append({"op": "replace", "path": f"{method_path}/caching/enabled", "value": "true"})
+            if ttl_seconds is not None:
+                patch_operations.append({"op": "replace", "path": f"{method_path}/caching/ttlInSeconds", "value": str(ttl_seconds)})
+        params = {"restApiId": self.api_id, "stageName": stage_name, "patchOperations": patch_operations}
+        return self.run_command("update_stage", params, f"Habilitando caché en la etapa {stage_name}")["success"]
+
+    @staticmethod
+    def verify_methods_integration(integrations: Dict[str, Optional[Dict]]) -> bool:
+        """
+        Verifica las integraciones con las respuestas de put-integration ya recibidas.
+
+        put-integration devuelve el mismo cuerpo que get-integration, así que no hace
+        falta volver a consultar AWS: basta con revisar cada respuesta localmente.
+        """
+        logger.info("🔍 Verificando integraciones de métodos...")
+        all_ok = True
+        for http_method, integration in integrations.items():
+            # OPTIONS es MOCK y no tiene URI
+            if not integration or not (integration.get("uri") or integration.get("type") == "MOCK"):
+                logger.error(f"Integración {http_method} no configurada")
+                all_ok = False
+        return all_ok
 
 def create_endpoint_workflow(manager: APIGatewayManager, base_config: Dict[str, Any], endpoint_config: Dict[str, Any]) -> bool:
     """Flujo completo de creación de un endpoint"""
@@ -1611,11 +2347,7 @@ def create_endpoint_workflow(manager: APIGatewayManager, base_config: Dict[str,
     CUSTOM_HEADERS = endpoint_config.get("CUSTOM_HEADERS", {})
 
     # Separación de rutas
-    path_parts = FULL_BACKEND_PATH.strip("/").split("/")
-    if len(path_parts) > 1:
-        api_resource_path = "/" + "/".join(path_parts[1:])
-    else:
-        api_resource_path = FULL_BACKEND_PATH
+    api_resource_path = api_gateway_path_for(FULL_BACKEND_PATH)
 
     logger.info(f"   → Path de API Gateway: {api_resource_path}")
     logger.info(f"   → Path de integración Backend: {FULL_BACKEND_PATH}")
@@ -1636,38 +2368,49 @@ def create_endpoint_workflow(manager: APIGatewayManager, base_config: Dict[str,
 
     logger.success(f"ID de recurso final: {final_resource_id}")
 
-    # Crear métodos HTTP seleccionados
+    # Headers de integración comunes a todos los métodos del endpoint
+    auth_headers = manager.build_auth_headers(base_config["AUTH_TYPE"], CUSTOM_HEADERS or None)
+
+    # Los métodos HTTP y OPTIONS son independientes entre sí: se configuran en paralelo
+    logger.info(f"Configurando métodos {', '.join(HTTP_METHODS)} y OPTIONS (CORS)...")
+    with ThreadPoolExecutor(max_workers=len(HTTP_METHODS) + 1) as executor:
+        method_futures = {
+            http_method: executor.submit(
+                manager.create_http_method,
+                final_resource_id,
+                http_method,
+                api_resource_path,
+                FULL_BACKEND_PATH,
+                base_config["BACKEND_HOST"],
+                base_config["AUTH_TYPE"],
+                base_config["COGNITO_POOL"],
+                CUSTOM_HEADERS if CUSTOM_HEADERS else None,
+                base_config.get("AUTH_METHOD", "AUTHORIZER"),
+                auth_headers
+            )
+            for http_method in HTTP_METHODS
+        }
+        options_future = executor.submit(manager.create_options_method, final_resource_id, base_config["CORS_TYPE"])
+
+    # Respuestas de put-integration por método: sirven para verificar sin otra llamada
+    integrations = {http_method: future.result() for http_method, future in method_futures.items()}
+    integrations["OPTIONS"] = options_future.result()
+
     success_count = 0
     for http_method in HTTP_METHODS:
-        logger.info(f"Configurando método {http_method}...")
-        method_success = manager.create_http_method(
-            final_resource_id,
-            http_method,
-            api_resource_path,
-            FULL_BACKEND_PATH,
-            base_config["BACKEND_HOST"],
-            base_config["AUTH_TYPE"],
-            base_config["COGNITO_POOL"],
-            CUSTOM_HEADERS if CUSTOM_HEADERS else None,
-            base_config.get("AUTH_METHOD", "AUTHORIZER")
-        )
-
-        if method_success:
+        if integrations[http_method] is not None:
             logger.success(f"Método {http_method} configurado exitosamente")
             success_count += 1
         else:
             logger.error(f"Error configurando método {http_method}")
 
-    # Configurar OPTIONS (CORS)
-    logger.info("Configurando método OPTIONS (CORS)...")
-    options_success = manager.create_options_method(final_resource_id, base_config["CORS_TYPE"])
-    if options_success:
+    if integrations["OPTIONS"] is not None:
         logger.success("Método OPTIONS (CORS) configurado exitosamente")
     else:
         logger.warning("Error configurando OPTIONS")
 
     logger.info("Verificando integraciones finales...")
-    if manager.verify_methods_integration(final_resource_id, HTTP_METHODS):
+    if manager.verify_methods_integration(integrations):
         logger.section("ENDPOINT CREADO EXITOSAMENTE")
         logger.success(f"{success_count}/{len(HTTP_METHODS)} métodos creados exitosamente")
         return True
@@ -1675,6 +2418,28 @@ def create_endpoint_workflow(manager: APIGatewayManager, base_config: Dict[str,
         logger.error("Error verificando integraciones del recurso")
         return False
 
+def record_cacheable_get(
+    manager: "APIGatewayManager",
+    base_config: Dict[str, Any],
+    endpoint_config: Dict[str, Any]
+) -> None:
+    """
+    Registra el GET de un endpoint creado vía Lambda como cacheable si es público.
+
+    Mismo criterio que create_http_method: sin autorización ni API Key.
+
+    Args:
+        manager: Gestor de API Gateway (acumula cacheable_methods)
+        base_config: Configuración base (AUTH_TYPE, AUTH_METHOD)
+        endpoint_config: Configuración del endpoint creado con éxito
+    """
+    if (base_config.get("AUTH_TYPE") == "NO_AUTH"
+            and base_config.get("AUTH_METHOD") != "API_KEY"
+            and "GET" in endpoint_config["HTTP_METHODS"]):
+        api_gateway_path = api_gateway_path_for(endpoint_config["FULL_BACKEND_PATH"])
+        manager.cacheable_methods.add((api_gateway_path, "GET"))
+
+
 def create_resources_loop(
     manager: "APIGatewayManager",
     base_config: Dict[str, Any],
@@ -1721,6 +2486,11 @@ def create_resources_loop(
         # NOTA: La creación ahora se delega a Lambda function para mayor seguridad
         # y configuración dinámica de headers. Ver REFACTOR_GUIDE.md
         success = create_endpoint_via_lambda(base_config, endpoint_config)
+        # La Lambda pudo crear recursos (aunque falle después): el índice local queda obsoleto
+        manager.invalidate_resources()
+        if success:
+            manager.pending_changes = True
+            record_cacheable_get(manager, base_config, endpoint_config)
 
         # Preguntar si desea crear otro endpoint
         create_another = input(
@@ -1730,13 +2500,82 @@ def create_resources_loop(
             break
 
 
-def execute_workflow(choice: str, config_manager: ConfigManager) -> None:
+def load_endpoint_configs(path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Carga una lista de endpoints desde un archivo JSON para el modo lote.
+
+    Cada elemento usa las mismas claves que get_endpoint_and_methods:
+    FULL_BACKEND_PATH, HTTP_METHODS y opcionalmente CUSTOM_HEADERS.
+
+    Returns:
+        Lista de configuraciones de endpoint, o None si el archivo no es válido.
+    """
+    try:
+        endpoint_configs = json_loads(Path(path).read_bytes())
+    except (OSError, ValueError) as e:
+        logger.error(f"No se pudo leer el archivo de endpoints {path}: {str(e)}")
+        return None
+
+    if not isinstance(endpoint_configs, list) or not endpoint_configs:
+        logger.error(f"{path} debe contener una lista no vacía de endpoints")
+        return None
+
+    for index, endpoint_config in enumerate(endpoint_configs, 1):
+        if not isinstance(endpoint_config, dict) or not isinstance(endpoint_config.get("FULL_BACKEND_PATH"), str) \
+                or not endpoint_config["FULL_BACKEND_PATH"]:
+            logger.error(f"Endpoint #{index}: falta FULL_BACKEND_PATH")
+            return None
+        methods = endpoint_config.get("HTTP_METHODS")
+        if (not isinstance(methods, list) or not methods
+                or not all(isinstance(method, str) and method in _HTTP_METHODS for method in methods)):
+            logger.error(f"Endpoint #{index}: HTTP_METHODS debe ser una lista de {', '.join(_HTTP_METHODS)}")
+            return None
+        endpoint_config["HTTP_METHODS"] = list(dict.fromkeys(methods))
+        if not isinstance(endpoint_config.setdefault("CUSTOM_HEADERS", {}), dict):
+            logger.error(f"Endpoint #{index}: CUSTOM_HEADERS debe ser un objeto nombre/valor")
+            return None
+
+    return endpoint_configs
+
+
+def finalize_stage(manager: "APIGatewayManager", base_config: Dict[str, Any]) -> None:
+    """
+    Despliega una sola vez los cambios del lote y, opcionalmente, habilita la caché de etapa.
+
+    Args:
+        manager: Gestor de API Gateway (acumula pending_changes durante el lote)
+        base_config: Configuración base (STAGE opcional como etapa por defecto)
+    """
+    deploy = manager.pending_changes and input(
+        "\n🚀 ¿Deseas desplegar los cambios en una etapa? (s/n): "
+    ).lower() == 's'
+    enable_cache = bool(manager.cacheable_methods) and input(
+        "\n⚡ ¿Deseas habilitar la caché de respuestas para los GET públicos en la etapa? (s/n): "
+    ).lower() == 's'
+    if not (deploy or enable_cache):
+        return
+
+    default_stage = base_config.get("STAGE", "ci")
+    stage_name = input(f"Nombre de la etapa [{default_stage}]: ").strip() or default_stage
+
+    if deploy:
+        manager.deploy(stage_name)
+    if enable_cache:
+        manager.enable_stage_cache(stage_name, ttl_seconds=DEFAULT_CACHE_TTL_SECONDS)
+
+
+def execute_workflow(
+    choice: str,
+    config_manager: ConfigManager,
+    endpoint_configs: Optional[List[Dict[str, Any]]] = None
+) -> None:
     """
     Ejecuta el workflow correspondiente según la opción del menú.
 
     Args:
         choice: Opción seleccionada ('load_profile' o 'create_profile_and_resources')
         config_manager: Gestor de configuraciones
+        endpoint_configs: Endpoints a crear en lote (--endpoints); None => modo interactivo
 
     Raises:
         SystemExit: En caso de error crítico
@@ -1775,13 +2614,38 @@ def execute_workflow(choice: str, config_manager: ConfigManager) -> None:
         config_manager
     )
 
-    # Ejecutar loop de creación de recursos
-    create_resources_loop(manager, base_config, config_manager)
+    if endpoint_configs:
+        # Modo lote: una sola confirmación y creación concurrente vía Lambda
+        created = create_endpoints_batch(base_config, endpoint_configs)
+        manager.invalidate_resources()
+        for endpoint_config in created:
+            record_cacheable_get(manager, base_config, endpoint_config)
+        logger.info(f"{len(created)}/{len(endpoint_configs)} endpoints creados")
+        manager.pending_changes = bool(created)
+    else:
+        # Ejecutar loop de creación de recursos
+        create_resources_loop(manager, base_config, config_manager)
+
+    finalize_stage(manager, base_config)
 
     logger.section("PROCESO COMPLETADO")
     logger.success("¡Gracias por usar API Gateway Creator!")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parsea los argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Crea recursos y métodos en API Gateway de forma interactiva.")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignora la caché local de consultas a AWS (equivale a {NO_CACHE_ENV_VAR}=1)",
+    )
+    parser.add_argument(
+        "--endpoints", metavar="ARCHIVO",
+        help="Archivo JSON con una lista de endpoints a crear en lote (FULL_BACKEND_PATH, HTTP_METHODS, CUSTOM_HEADERS)",
+    )
+    return parser.parse_args(argv)
+
+
 def main() -> None:
     """
     Punto de entrada principal del CLI.
@@ -1791,30 +2655,45 @@ def main() -> None:
     - Routing a workflows
     - Manejo de errores y excepciones
     """
+    args = parse_args()
+    if args.no_cache:
+        os.environ[NO_CACHE_ENV_VAR] = "1"
+
+    endpoint_configs = None
+    if args.endpoints:
+        endpoint_configs = load_endpoint_configs(args.endpoints)
+        if endpoint_configs is None:
+            sys.exit(1)
+
     try:
         logger.section("API GATEWAY MULTI-METHOD CREATOR by Zamma")
 
         # Inicializar gestor de configuraciones
         config_manager = ConfigManager()
 
-        # Verificar conectividad con Lambda (health check)
-        logger.info("🔍 Verificando conexión con Lambda...")
+        # Precargar opciones de Lambda (health check) mientras el usuario responde el menú
         lambda_client = get_lambda_client()
-        test_options = lambda_client.get_header_options("auth_headers")
-
-        if test_options:
-            logger.success(f"✓ Lambda conectada: {lambda_client.function_name}")
-        else:
-            logger.warning("⚠️  Lambda no disponible - usando configuraciones locales como fallback")
+        options_future = lambda_client.prefetch_options()
 
         # Mostrar menú principal
         choice = main_menu()
+        while choice == "refresh_aws_cache":
+            clear_aws_cache()
+            logger.success("Caché de AWS limpiada: los datos se consultarán de nuevo")
+            choice = main_menu()
         if not choice:
             logger.error("No se seleccionó una opción válida.")
             sys.exit(1)
 
+        # Verificar conectividad con Lambda
+        logger.info("🔍 Verificando conexión con Lambda...")
+        if options_future.result():
+            logger.success(f"✓ Lambda conectada: {lambda_client.function_name}")
+        else:
+            logger.warning("⚠️  Lambda no disponible - usando configuraciones locales como fallback")
+
         # Ejecutar workflow correspondiente
-        execute_workflow(choice, config_manager)
+        execute_workflow(choice, config_manager, endpoint_configs)
 
     except KeyboardInterrupt:
         logger.warning("Proceso interrumpido por el usuario (Ctrl+C)")
@@ -21,9 +21,23 @@ from .constants import (
     CONFIG_CONNECTION_TYPE,
     CONFIG_RESPONSE_STATUS_CODE,
     CONFIG_RESPONSE_MODEL,
+    DEFAULT_STAGE_CACHE_SIZE,
+    DEFAULT_CACHE_TTL_SECONDS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_CACHE_DIR,
+    NO_CACHE_ENV_VAR,
+    DEFAULT_PROFILES_DIR,
+    BATCH_MAX_CONCURRENCY,
+    PROFILE_VALIDATION_TTL_SECONDS,
+    BATCH_RESOURCES_ENV_VAR,
+    USE_AWS_CLI_ENV_VAR,
+    PARAMETER_PLACEHOLDER_RE,
+    STAGE_VARIABLE_REFERENCE_RE,
+    AWS_HEADER_PREFIX_RE,
     ERROR_INVALID_CHOICE,
     ERROR_INVALID_INPUT,
     ERROR_NO_PROFILES,
+    CONFIG_FILES,
     SUCCESS_CONFIG_LOADED,
     AuthType,
 )
@@ -47,6 +61,7 @@ from .models import (
     EndpointConfig,
     MethodSpec,
     AWSResource,
+    api_gateway_path_for,
 )
 
 __version__ = "2.1"
@@ -61,9 +76,23 @@ __all__ = [
     "CONFIG_CONNECTION_TYPE",
     "CONFIG_RESPONSE_STATUS_CODE",
     "CONFIG_RESPONSE_MODEL",
+    "DEFAULT_STAGE_CACHE_SIZE",
+    "DEFAULT_CACHE_TTL_SECONDS",
+    "DEFAULT_MAX_RETRIES",
+    "DEFAULT_CACHE_DIR",
+    "NO_CACHE_ENV_VAR",
+    "DEFAULT_PROFILES_DIR",
+    "BATCH_MAX_CONCURRENCY",
+    "PROFILE_VALIDATION_TTL_SECONDS",
+    "BATCH_RESOURCES_ENV_VAR",
+    "USE_AWS_CLI_ENV_VAR",
+    "PARAMETER_PLACEHOLDER_RE",
+    "STAGE_VARIABLE_REFERENCE_RE",
+    "AWS_HEADER_PREFIX_RE",
     "ERROR_INVALID_CHOICE",
     "ERROR_INVALID_INPUT",
     "ERROR_NO_PROFILES",
+    "CONFIG_FILES",
     "SUCCESS_CONFIG_LOADED",
     "AuthType",
     # exceptions
@@ -84,4 +113,5 @@ __all__ = [
     "EndpointConfig",
     "MethodSpec",
     "AWSResource",
+    "api_gateway_path_for",
 ]
@@ -5,7 +5,9 @@ Este módulo centraliza todas las constantes del proyecto para evitar
 magic numbers/strings y facilitar el mantenimiento.
 """
 
+import re
 from enum import Enum
+from typing import Dict, Pattern
 
 # ============================================================================
 # AWS API Gateway Configuration
@@ -31,6 +33,10 @@ CONFIG_RESPONSE_STATUS_CODE: str = "200"
 CONFIG_RESPONSE_MODEL: str = "Empty"
 """Default response model for API Gateway methods."""
 
+# Stage Cache
+DEFAULT_STAGE_CACHE_SIZE: str = "0.5"
+"""Default API Gateway stage cache cluster size (GB)."""
+
 # ============================================================================
 # UI Configuration
 # ============================================================================
@@ -57,9 +63,29 @@ SECTION_SEPARATOR_LENGTH: int = 70
 DEFAULT_CONFIG_DIR: str = "config"
 """Default configuration directory name."""
 
+CONFIG_FILES: Dict[str, str] = {
+    "method_configs": "method_configs.ini",
+    "auth_headers": "auth_headers.ini",
+    "cors_headers": "cors_headers.ini",
+    "response_templates": "response_templates.ini",
+}
+"""ConfigManager attribute -> INI file loaded from the configuration directory."""
+
 DEFAULT_PROFILES_DIR: str = "profiles"
 """Default profiles directory name."""
 
+DEFAULT_CACHE_DIR: str = "cache"
+"""Default directory for the local cache of AWS lookups."""
+
+NO_CACHE_ENV_VAR: str = "APIGW_NO_CACHE"
+"""Environment variable that bypasses the local cache when set to "1"."""
+
+BATCH_RESOURCES_ENV_VAR: str = "APIGW_BATCH_RESOURCES"
+"""Environment variable that creates missing resources with one OpenAPI import when set to "1"."""
+
+USE_AWS_CLI_ENV_VAR: str = "APIGW_USE_AWS_CLI"
+"""Environment variable that forces AWS CLI calls even when boto3 is installed when set to "1"."""
+
 PROFILE_EXTENSION: str = ".ini"
 """File extension for profile configuration files."""
 
@@ -198,6 +224,12 @@ DEFAULT_MAX_RETRIES: int = 3
 DEFAULT_CACHE_TTL_SECONDS: int = 300
 """Default cache time-to-live in seconds."""
 
+PROFILE_VALIDATION_TTL_SECONDS: int = 3600
+"""How long a successful profile validation is trusted if the file is unchanged."""
+
+BATCH_MAX_CONCURRENCY: int = 5
+"""Maximum endpoints created in parallel in batch mode (API Gateway write throttling)."""
+
 MAX_PROFILE_NAME_LENGTH: int = 255
 """Maximum length for profile names."""
 
@@ -219,3 +251,13 @@ REGEX_STAGE_VARIABLE_REFERENCE: str = r"\$\{stageVariables\.(\w+)\}"
 
 REGEX_AWS_HEADER_PREFIX: str = r"integration\.request\.header\."
 """Regex pattern for AWS integration header prefix."""
+
+# Compiled once at import time; prefer these over re.compile on each use
+PARAMETER_PLACEHOLDER_RE: Pattern[str] = re.compile(REGEX_PARAMETER_PLACEHOLDER)
+"""Compiled REGEX_PARAMETER_PLACEHOLDER."""
+
+STAGE_VARIABLE_REFERENCE_RE: Pattern[str] = re.compile(REGEX_STAGE_VARIABLE_REFERENCE)
+"""Compiled REGEX_STAGE_VARIABLE_REFERENCE."""
+
+AWS_HEADER_PREFIX_RE: Pattern[str] = re.compile(REGEX_AWS_HEADER_PREFIX)
+"""Compiled REGEX_AWS_HEADER_PREFIX."""
@@ -34,15 +34,19 @@ class AWSException(APIGatewayException):
         self.command = command
         self.returncode = returncode
         self.stderr = stderr
-        full_message = (
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        """Build the detailed message only when the exception is rendered."""
+        message = super().__str__()
+        if not self.command:
+            return message
+        return (
             f"{message}\n"
-            f"Command: {command}\n"
-            f"Return Code: {returncode}\n"
-            f"Error: {stderr}"
-            if command
-            else message
+            f"Command: {self.command}\n"
+            f"Return Code: {self.returncode}\n"
+            f"Error: {self.stderr}"
         )
-        super().__init__(full_message)
 
 
 class ConfigurationException(APIGatewayException):
@@ -6,10 +6,16 @@ configurable para cambiar estilos, niveles y formatos.
 """
 
 from enum import Enum
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Any, ClassVar, Optional, Dict, Tuple
+import time
+import traceback
 from pathlib import Path
-from .constants import TIMESTAMP_FORMAT, DATETIME_FORMAT
+from .constants import (
+    TIMESTAMP_FORMAT,
+    DATETIME_FORMAT,
+    SECTION_SEPARATOR_CHAR,
+    SECTION_SEPARATOR_LENGTH,
+)
 
 
 class LogLevel(str, Enum):
@@ -22,6 +28,20 @@ class LogLevel(str, Enum):
     ERROR = "ERROR"
 
 
+# Orden de severidad para filtrar por min_level (SUCCESS equivale a INFO)
+_LEVEL_ORDER: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.SUCCESS: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+}
+
+
+def _discard(message: str, *args: Any) -> None:
+    """Sustituye a los métodos de niveles por debajo de min_level."""
+
+
 class ANSIColors:
     """ANSI color codes for terminal output."""
 
@@ -32,6 +52,14 @@ class ANSIColors:
     RED = '\033[0;31m'       # Error
     GRAY = '\033[0;90m'      # Debug
 
+    _COLOR_MAP: ClassVar[Dict[LogLevel, str]] = {
+        LogLevel.DEBUG: GRAY,
+        LogLevel.INFO: CYAN,
+        LogLevel.SUCCESS: GREEN,
+        LogLevel.WARNING: YELLOW,
+        LogLevel.ERROR: RED,
+    }
+
     @classmethod
     def get_color(cls, level: LogLevel) -> str:
         """
@@ -43,14 +71,11 @@ class ANSIColors:
         Returns:
             ANSI color code string.
         """
-        color_map: Dict[LogLevel, str] = {
-            LogLevel.DEBUG: cls.GRAY,
-            LogLevel.INFO: cls.CYAN,
-            LogLevel.SUCCESS: cls.GREEN,
-            LogLevel.WARNING: cls.YELLOW,
-            LogLevel.ERROR: cls.RED,
-        }
-        return color_map.get(level, cls.CYAN)
+        return cls._COLOR_MAP.get(level, cls.CYAN)
+
+
+_SECTION_SEPARATOR = SECTION_SEPARATOR_CHAR * SECTION_SEPARATOR_LENGTH
+_SECTION_SEPARATOR_CYAN = f"{ANSIColors.CYAN}{_SECTION_SEPARATOR}{ANSIColors.RESET}"
 
 
 class Logger:
@@ -69,13 +94,43 @@ class Logger:
         """
         Initialize the logger.
 
+        Args:
+            use_colors: Whether to use ANSI colors in output.
+            min_level: Minimum log level to display.
+        """
+        self._error_dump_dir: Optional[Path] = None
+        self.configure(use_colors=use_colors, min_level=min_level)
+
+    def configure(
+        self,
+        use_colors: bool = True,
+        min_level: LogLevel = LogLevel.DEBUG,
+    ) -> None:
+        """
+        (Re)configure colors and minimum level in place.
+
         Args:
             use_colors: Whether to use ANSI colors in output.
             min_level: Minimum log level to display.
         """
         self.use_colors = use_colors
         self.min_level = min_level
-        self._error_dump_dir: Optional[Path] = None
+        self._min_level_rank = _LEVEL_ORDER.get(min_level, 1)
+        # Prefijo "[LEVEL] " ya coloreado: el formateo de cada línea es una concatenación
+        self._prefixes: Dict[LogLevel, str] = {
+            level: (
+                f"{ANSIColors.get_color(level)}[{level.value}]{ANSIColors.RESET} "
+                if use_colors else f"[{level.value}] "
+            )
+            for level in LogLevel
+        }
+        # Niveles filtrados: el método queda como no-op y la llamada no hace nada
+        for level in LogLevel:
+            method_name = level.value.lower()
+            if _LEVEL_ORDER[level] < self._min_level_rank:
+                setattr(self, method_name, _discard)
+            else:
+                self.__dict__.pop(method_name, None)
 
     def set_error_dump_dir(self, directory: Path) -> None:
         """
@@ -90,6 +145,7 @@ class Logger:
         self,
         level: LogLevel,
         message: str,
+        args: Tuple[Any, ...] = (),
     ) -> str:
         """
         Format a log message with level and timestamp.
@@ -97,16 +153,14 @@ class Logger:
         Args:
             level: The log level.
             message: The message to format.
+            args: Optional %-style arguments for message (logging-style).
 
         Returns:
             Formatted message string.
         """
-        if self.use_colors:
-            color = ANSIColors.get_color(level)
-            reset = ANSIColors.RESET
-            return f"{color}[{level.value}]{reset} {message}"
-        else:
-            return f"[{level.value}] {message}"
+        if args:
+            message = message % args
+        return self._prefixes[level] + message
 
     def _should_log(self, level: LogLevel) -> bool:
         """
@@ -118,39 +172,32 @@ class Logger:
         Returns:
             True if the message should be logged.
         """
-        level_order = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.SUCCESS: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3,
-        }
-        return level_order.get(level, 1) >= level_order.get(self.min_level, 1)
+        return _LEVEL_ORDER[level] >= self._min_level_rank
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any) -> None:
         """Log a debug message."""
         if self._should_log(LogLevel.DEBUG):
-            print(self._format_message(LogLevel.DEBUG, message))
+            print(self._format_message(LogLevel.DEBUG, message, args))
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log an info message."""
         if self._should_log(LogLevel.INFO):
-            print(self._format_message(LogLevel.INFO, message))
+            print(self._format_message(LogLevel.INFO, message, args))
 
-    def success(self, message: str) -> None:
+    def success(self, message: str, *args: Any) -> None:
         """Log a success message."""
         if self._should_log(LogLevel.SUCCESS):
-            print(self._format_message(LogLevel.SUCCESS, message))
+            print(self._format_message(LogLevel.SUCCESS, message, args))
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log a warning message."""
         if self._should_log(LogLevel.WARNING):
-            print(self._format_message(LogLevel.WARNING, message))
+            print(self._format_message(LogLevel.WARNING, message, args))
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log an error message."""
         if self._should_log(LogLevel.ERROR):
-            print(self._format_message(LogLevel.ERROR, message))
+            print(self._format_message(LogLevel.ERROR, message, args))
 
     def section(self, title: str) -> None:
         """
@@ -159,18 +206,11 @@ class Logger:
         Args:
             title: The section title.
         """
-        print()
-        separator = "═" * 70
+        # Una sola escritura por sección en lugar de un print por línea
         if self.use_colors:
-            color = ANSIColors.CYAN
-            reset = ANSIColors.RESET
-            print(f"{color}{separator}{reset}")
-            print(f"{color}  {title}{reset}")
-            print(f"{color}{separator}{reset}")
+            print(f"\n{_SECTION_SEPARATOR_CYAN}\n{ANSIColors.CYAN}  {title}{ANSIColors.RESET}\n{_SECTION_SEPARATOR_CYAN}")
         else:
-            print(separator)
-            print(f"  {title}")
-            print(separator)
+            print(f"\n{_SECTION_SEPARATOR}\n  {title}\n{_SECTION_SEPARATOR}")
 
     def dump_error(
         self,
@@ -193,26 +233,27 @@ class Logger:
         if not self._error_dump_dir:
             raise RuntimeError("Error dump directory not configured")
 
-        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        now = time.localtime()
+        timestamp = time.strftime(TIMESTAMP_FORMAT, now)
         error_file = self._error_dump_dir / f"error_dump_{timestamp}.log"
 
+        lines = [
+            f"=== ERROR DUMP - {time.strftime(DATETIME_FORMAT, now)} ===\n\n",
+            f"Error Message: {error_message}\n\n",
+        ]
+        if exception:
+            lines += [
+                f"Exception Type: {type(exception).__name__}\n",
+                f"Exception Message: {str(exception)}\n\n",
+                "Full Traceback:\n",
+                traceback.format_exc(),
+                "\n",
+            ]
+        lines.append("=== END ERROR DUMP ===\n")
+
         try:
             with open(error_file, 'w', encoding='utf-8') as f:
-                f.write(
-                    f"=== ERROR DUMP - "
-                    f"{datetime.now().isoformat()} ===\n\n"
-                )
-                f.write(f"Error Message: {error_message}\n\n")
-
-                if exception:
-                    import traceback
-                    f.write(f"Exception Type: {type(exception).__name__}\n")
-                    f.write(f"Exception Message: {str(exception)}\n\n")
-                    f.write("Full Traceback:\n")
-                    f.write(traceback.format_exc())
-                    f.write("\n")
-
-                f.write("=== END ERROR DUMP ===\n")
+                f.write("".join(lines))
 
             self.debug(f"Error dump guardado en: {error_file}")
             return error_file
@@ -225,20 +266,23 @@ class Logger:
             raise
 
 
-# Global logger instance
-_logger: Optional[Logger] = None
+# Global logger instance: se crea al importar el módulo y initialize_logger
+# la reconfigura en sitio, así los módulos que la obtuvieron antes comparten
+# la misma configuración (incluido el directorio de dumps)
+_logger: Logger = Logger(use_colors=True)
 
 
-def get_logger() -> Logger:
+def get_logger(name: Optional[str] = None) -> Logger:
     """
     Get the global logger instance.
 
+    Args:
+        name: Module name (accepted for logging.getLogger-style callers;
+            all modules share the same logger).
+
     Returns:
         The global Logger instance.
     """
-    global _logger
-    if _logger is None:
-        _logger = Logger(use_colors=True)
     return _logger
 
 
@@ -258,8 +302,7 @@ def initialize_logger(
     Returns:
         The initialized Logger instance.
     """
-    global _logger
-    _logger = Logger(use_colors=use_colors, min_level=min_level)
+    _logger.configure(use_colors=use_colors, min_level=min_level)
     if error_dump_dir:
         _logger.set_error_dump_dir(error_dump_dir)
     return _logger
@@ -6,9 +6,34 @@ tipadas, inmutables y bien documentadas.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import cached_property, lru_cache
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple
 from .constants import AuthType
 
+# (atributo, mensaje de error) de los campos que no pueden estar vacíos
+RequiredFields = Tuple[Tuple[str, str], ...]
+
+_VALID_METHODS: FrozenSet[str] = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"})
+
+
+@lru_cache(maxsize=256)
+def api_gateway_path_for(full_backend_path: str) -> str:
+    """
+    Derive the API Gateway path by removing the first (service) segment.
+
+    Example:
+        "/discounts/v1/items" -> "/v1/items"
+    """
+    _, separator, rest = full_backend_path.strip("/").partition("/")
+    return "/" + rest if separator else full_backend_path
+
+
+def _ensure_nonempty(instance: object, required: RequiredFields) -> None:
+    """Raise ValueError for the first empty field in `required`."""
+    for attr, message in required:
+        if not getattr(instance, attr):
+            raise ValueError(message)
+
 
 @dataclass(frozen=True)
 class APIConfig:
@@ -33,18 +58,17 @@ class APIConfig:
     auth_type: AuthType
     cors_type: str = "DEFAULT"
 
+    _REQUIRED: ClassVar[RequiredFields] = (
+        ("api_id", "api_id cannot be empty"),
+        ("authorizer_id", "authorizer_id cannot be empty"),
+        ("connection_variable", "connection_variable cannot be empty"),
+        ("cognito_pool", "cognito_pool cannot be empty"),
+        ("backend_host", "backend_host cannot be empty"),
+    )
+
     def __post_init__(self) -> None:
         """Validate configuration values."""
-        if not self.api_id:
-            raise ValueError("api_id cannot be empty")
-        if not self.authorizer_id:
-            raise ValueError("authorizer_id cannot be empty")
-        if not self.connection_variable:
-            raise ValueError("connection_variable cannot be empty")
-        if not self.cognito_pool:
-            raise ValueError("cognito_pool cannot be empty")
-        if not self.backend_host:
-            raise ValueError("backend_host cannot be empty")
+        _ensure_nonempty(self, self._REQUIRED)
 
 
 @dataclass
@@ -62,14 +86,16 @@ class EndpointConfig:
     full_backend_path: str
     custom_headers: Dict[str, str] = field(default_factory=dict)
 
+    _REQUIRED: ClassVar[RequiredFields] = (
+        ("http_methods", "At least one HTTP method must be specified"),
+        ("full_backend_path", "full_backend_path cannot be empty"),
+    )
+
     def __post_init__(self) -> None:
         """Validate endpoint configuration."""
-        if not self.http_methods:
-            raise ValueError("At least one HTTP method must be specified")
-        if not self.full_backend_path:
-            raise ValueError("full_backend_path cannot be empty")
+        _ensure_nonempty(self, self._REQUIRED)
 
-    @property
+    @cached_property
     def api_gateway_path(self) -> str:
         """
         Derive API Gateway path by removing first segment.
@@ -80,10 +106,7 @@ class EndpointConfig:
         Example:
             full_backend_path="/discounts/v1/items" -> "/v1/items"
         """
-        parts = self.full_backend_path.strip("/").split("/")
-        if len(parts) > 1:
-            return "/" + "/".join(parts[1:])
-        return self.full_backend_path
+        return api_gateway_path_for(self.full_backend_path)
 
 
 @dataclass(frozen=True)
@@ -109,8 +132,7 @@ class MethodSpec:
 
     def __post_init__(self) -> None:
         """Validate method specification."""
-        valid_methods = {"GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"}
-        if self.method not in valid_methods:
+        if self.method not in _VALID_METHODS:
             raise ValueError(f"Invalid method: {self.method}")
         if self.timeout_ms <= 0:
             raise ValueError("timeout_ms must be positive")
@@ -131,12 +153,14 @@ class AWSResource:
     path: str
     parent_id: Optional[str] = None
 
+    _REQUIRED: ClassVar[RequiredFields] = (
+        ("id", "Resource id cannot be empty"),
+        ("path", "Resource path cannot be empty"),
+    )
+
     def __post_init__(self) -> None:
         """Validate resource data."""
-        if not self.id:
-            raise ValueError("Resource id cannot be empty")
-        if not self.path:
-            raise ValueError("Resource path cannot be empty")
+        _ensure_nonempty(self, self._REQUIRED)
 
 
 @dataclass(frozen=True)
@@ -201,12 +225,16 @@ class HeaderSpec:
     value: str
     required: bool = False
 
+    _REQUIRED: ClassVar[RequiredFields] = (
+        ("name", "Header name cannot be empty"),
+        ("value", "Header value cannot be empty"),
+    )
+
     def __post_init__(self) -> None:
         """Validate header specification."""
-        if not self.name:
-            raise ValueError("Header name cannot be empty")
-        if not self.value:
-            raise ValueError("Header value cannot be empty")
+        _ensure_nonempty(self, self._REQUIRED)
+        # Frozen: se asigna con object.__setattr__; no es un campo (no afecta a eq/repr)
+        object.__setattr__(self, "_aws_header", (f"integration.request.header.{self.name}", self.value))
 
     def to_aws_integration_header(self) -> tuple[str, str]:
         """
@@ -215,5 +243,4 @@ class HeaderSpec:
         Returns:
             Tuple of (integration.request.header.NAME, value).
         """
-        aws_name = f"integration.request.header.{self.name}"
-        return (aws_name, self.value)
+        return self._aws_header
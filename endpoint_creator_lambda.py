@@ -3,14 +3,46 @@ Endpoint Creator using Lambda.
 
 Replaces write operations with Lambda invocations.
 """
-from typing import Dict, Any, Optional
-
-from common import get_logger, ANSIColors
+from typing import Dict, Any, List, Optional
+
+from common import (
+    get_logger,
+    ANSIColors,
+    BATCH_MAX_CONCURRENCY,
+    CONFIG_TIMEOUT_MS,
+    CONFIG_PASSTHROUGH_BEHAVIOR,
+    CONFIG_INTEGRATION_TYPE,
+    CONFIG_CONNECTION_TYPE,
+    api_gateway_path_for,
+)
 from lambda_client import get_lambda_client
 from header_selector import select_headers_for_auth_type, display_integration_options
 
 logger = get_logger(__name__)
 
+# Payload defaults, shared by every request (only serialized, never mutated)
+_DEFAULT_INTEGRATION_OPTIONS = {
+    "timeout_ms": CONFIG_TIMEOUT_MS,
+    "passthrough_behavior": CONFIG_PASSTHROUGH_BEHAVIOR,
+    "integration_type": CONFIG_INTEGRATION_TYPE,
+    "connection_type": CONFIG_CONNECTION_TYPE,
+}
+_DEFAULT_CORS_HEADERS = {
+    "Access-Control-Allow-Headers": "'Content-Type,Authorization,X-Amz-Date,X-Api-Key,X-Amz-Security-Token,X-Api-Version'",
+    "Access-Control-Allow-Methods": "'DELETE,GET,HEAD,OPTIONS,PATCH,POST,PUT'",
+    "Access-Control-Allow-Origin": "'*'"
+}
+
+# Step status -> icon shown by _display_steps
+_STEP_ICONS = {
+    "ok": f"{ANSIColors.GREEN}✓{ANSIColors.RESET}",
+    "failed": f"{ANSIColors.RED}✗{ANSIColors.RESET}",
+}
+_DEFAULT_STEP_ICON = f"{ANSIColors.YELLOW}○{ANSIColors.RESET}"
+
+# Optional step counters, in display order
+_STEP_INFO_KEYS = ("count", "created", "skipped")
+
 
 def create_endpoint_via_lambda(
     base_config: Dict[str, Any],
@@ -55,9 +87,65 @@ def create_endpoint_via_lambda(
     return _display_lambda_response(response)
 
 
+def create_endpoints_batch(
+    base_config: Dict[str, Any],
+    endpoint_configs: List[Dict[str, Any]],
+    max_workers: int = BATCH_MAX_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """
+    Create several endpoints via Lambda with a single confirmation.
+
+    Invocations run concurrently (bounded by max_workers to stay under the
+    API Gateway write throttling); results are displayed in input order.
+
+    Args:
+        base_config: Base configuration (API, auth, etc.)
+        endpoint_configs: Endpoint configurations (path, methods, headers)
+        max_workers: Maximum concurrent Lambda invocations
+
+    Returns:
+        Endpoint configurations created successfully (input order)
+    """
+    logger.section(f"CREANDO {len(endpoint_configs)} ENDPOINTS VÍA LAMBDA")
+
+    # Auth headers and integration options are shared by every endpoint:
+    # asked once; each endpoint's CUSTOM_HEADERS still override them
+    auth_headers = select_headers_for_auth_type(base_config.get("AUTH_TYPE", "NO_AUTH"))
+    integration_options = display_integration_options()
+    payloads = [
+        _build_lambda_payload(base_config, endpoint_config, integration_options, auth_headers)
+        for endpoint_config in endpoint_configs
+    ]
+
+    for payload in payloads:
+        _display_creation_summary(payload)
+
+    confirm = input(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿Proceder con la creación de {len(payloads)} endpoints? (s/n): ").strip().lower()
+
+    if confirm != 's':
+        logger.warning("Creación cancelada por el usuario")
+        return []
+
+    logger.info(f"\n📤 Enviando {len(payloads)} requests a Lambda...")
+
+    responses = get_lambda_client().create_endpoints(payloads, max_workers)
+
+    created = []
+    for endpoint_config, payload, response in zip(endpoint_configs, payloads, responses):
+        logger.info(f"\n📍 {payload['endpoint']['full_backend_path']}")
+        if not response:
+            logger.error("❌ Error comunicándose con Lambda")
+        elif _display_lambda_response(response):
+            created.append(endpoint_config)
+
+    return created
+
+
 def _build_lambda_payload(
     base_config: Dict[str, Any],
-    endpoint_config: Dict[str, Any]
+    endpoint_config: Dict[str, Any],
+    integration_options: Optional[Dict[str, Any]] = None,
+    auth_headers: Optional[Dict[str, str]] = None
 ) -> Dict[str, Any]:
     """
     Build Lambda payload from configurations.
@@ -65,6 +153,8 @@ def _build_lambda_payload(
     Args:
         base_config: Base configuration
         endpoint_config: Endpoint configuration
+        integration_options: Integration config already fetched (fetched here if None)
+        auth_headers: Auth headers already selected (asked here if None)
 
     Returns:
         Lambda payload dictionary
@@ -74,29 +164,21 @@ def _build_lambda_payload(
     custom_headers = endpoint_config.get("CUSTOM_HEADERS", {})
 
     # Calculate API Gateway path (strip first segment)
-    path_parts = full_backend_path.strip("/").split("/")
-    if len(path_parts) > 1:
-        api_gateway_path = "/" + "/".join(path_parts[1:])
-    else:
-        api_gateway_path = full_backend_path
+    api_gateway_path = api_gateway_path_for(full_backend_path)
 
     # Get auth headers based on auth type
     auth_type = base_config.get("AUTH_TYPE", "NO_AUTH")
 
-    # Combine default auth headers with custom headers
-    auth_headers = select_headers_for_auth_type(auth_type)
-    all_headers = {**auth_headers, **custom_headers}
+    # Custom headers take precedence over auth headers (merged by the Lambda)
+    if auth_headers is None:
+        auth_headers = select_headers_for_auth_type(auth_type)
 
     # Get integration options
-    integration_options = display_integration_options()
+    if integration_options is None:
+        integration_options = display_integration_options()
 
     if not integration_options:
-        integration_options = {
-            "timeout_ms": 29000,
-            "passthrough_behavior": "WHEN_NO_MATCH",
-            "integration_type": "HTTP_PROXY",
-            "connection_type": "VPC_LINK"
-        }
+        integration_options = _DEFAULT_INTEGRATION_OPTIONS
 
     # Build payload
     payload = {
@@ -128,11 +210,7 @@ def _build_lambda_payload(
         "cors": {
             "enabled": True,
             "type": base_config.get("CORS_TYPE", "DEFAULT"),
-            "headers": {
-                "Access-Control-Allow-Headers": "'Content-Type,Authorization,X-Amz-Date,X-Api-Key,X-Amz-Security-Token,X-Api-Version'",
-                "Access-Control-Allow-Methods": "'DELETE,GET,HEAD,OPTIONS,PATCH,POST,PUT'",
-                "Access-Control-Allow-Origin": "'*'"
-            }
+            "headers": _DEFAULT_CORS_HEADERS
         }
     }
 
@@ -153,29 +231,35 @@ def _display_creation_summary(payload: Dict[str, Any]) -> None:
     auth = payload["authentication"]
     integration = payload["integration"]
 
-    print(f"\n{ANSIColors.CYAN}🌐 API Gateway:{ANSIColors.RESET}")
-    print(f"  {ANSIColors.GRAY}API ID:{ANSIColors.RESET} {config['api_id']}")
-    print(f"  {ANSIColors.GRAY}Stage:{ANSIColors.RESET} {config['stage']}")
+    # Summary lines are collected and written at once
+    lines = [
+        f"\n{ANSIColors.CYAN}🌐 API Gateway:{ANSIColors.RESET}",
+        f"  {ANSIColors.GRAY}API ID:{ANSIColors.RESET} {config['api_id']}",
+        f"  {ANSIColors.GRAY}Stage:{ANSIColors.RESET} {config['stage']}",
 
-    print(f"\n{ANSIColors.CYAN}📍 Endpoint:{ANSIColors.RESET}")
-    print(f"  {ANSIColors.GRAY}Path Backend:{ANSIColors.RESET} {endpoint['full_backend_path']}")
-    print(f"  {ANSIColors.GRAY}Path API GW:{ANSIColors.RESET} {endpoint['api_gateway_path']}")
-    print(f"  {ANSIColors.GRAY}Métodos:{ANSIColors.RESET} {', '.join(endpoint['http_methods'])}")
+        f"\n{ANSIColors.CYAN}📍 Endpoint:{ANSIColors.RESET}",
+        f"  {ANSIColors.GRAY}Path Backend:{ANSIColors.RESET} {endpoint['full_backend_path']}",
+        f"  {ANSIColors.GRAY}Path API GW:{ANSIColors.RESET} {endpoint['api_gateway_path']}",
+        f"  {ANSIColors.GRAY}Métodos:{ANSIColors.RESET} {', '.join(endpoint['http_methods'])}",
 
-    print(f"\n{ANSIColors.CYAN}🔐 Autenticación:{ANSIColors.RESET}")
-    print(f"  {ANSIColors.GRAY}Método:{ANSIColors.RESET} {auth['method']}")
-    print(f"  {ANSIColors.GRAY}Tipo:{ANSIColors.RESET} {auth['auth_type']}")
+        f"\n{ANSIColors.CYAN}🔐 Autenticación:{ANSIColors.RESET}",
+        f"  {ANSIColors.GRAY}Método:{ANSIColors.RESET} {auth['method']}",
+        f"  {ANSIColors.GRAY}Tipo:{ANSIColors.RESET} {auth['auth_type']}",
+    ]
 
     if auth.get('authorizer_id'):
-        print(f"  {ANSIColors.GRAY}Authorizer ID:{ANSIColors.RESET} {auth['authorizer_id']}")
-
-    print(f"\n{ANSIColors.CYAN}🔗 Integración:{ANSIColors.RESET}")
-    print(f"  {ANSIColors.GRAY}Backend Host:{ANSIColors.RESET} {integration['backend_host']}")
-    print(f"  {ANSIColors.GRAY}VPC Link Variable:{ANSIColors.RESET} {integration['connection_variable']}")
-    print(f"  {ANSIColors.GRAY}Timeout:{ANSIColors.RESET} {integration['timeout_ms']}ms")
+        lines.append(f"  {ANSIColors.GRAY}Authorizer ID:{ANSIColors.RESET} {auth['authorizer_id']}")
 
     headers_count = len(payload["headers"]["auth_headers"]) + len(payload["headers"]["custom_headers"])
-    print(f"\n{ANSIColors.CYAN}📋 Headers:{ANSIColors.RESET} {headers_count} configurados")
+    lines += [
+        f"\n{ANSIColors.CYAN}🔗 Integración:{ANSIColors.RESET}",
+        f"  {ANSIColors.GRAY}Backend Host:{ANSIColors.RESET} {integration['backend_host']}",
+        f"  {ANSIColors.GRAY}VPC Link Variable:{ANSIColors.RESET} {integration['connection_variable']}",
+        f"  {ANSIColors.GRAY}Timeout:{ANSIColors.RESET} {integration['timeout_ms']}ms",
+
+        f"\n{ANSIColors.CYAN}📋 Headers:{ANSIColors.RESET} {headers_count} configurados",
+    ]
+    print("\n".join(lines))
 
 
 def _display_lambda_response(response: Dict[str, Any]) -> bool:
@@ -236,29 +320,18 @@ def _display_steps(steps: list) -> None:
     Args:
         steps: List of step dictionaries
     """
+    lines = []
     for step in steps:
-        name = step.get("name", "unknown")
-        status = step.get("status", "unknown")
-
-        if status == "ok":
-            icon = f"{ANSIColors.GREEN}✓{ANSIColors.RESET}"
-        elif status == "failed":
-            icon = f"{ANSIColors.RED}✗{ANSIColors.RESET}"
-        else:
-            icon = f"{ANSIColors.YELLOW}○{ANSIColors.RESET}"
+        get = step.get
+        icon = _STEP_ICONS.get(get("status"), _DEFAULT_STEP_ICON)
 
         # Format step name
-        step_display = name.replace("_", " ").title()
+        step_display = get("name", "unknown").replace("_", " ").title()
 
         # Additional info
-        info = []
-        if "count" in step:
-            info.append(f"count={step['count']}")
-        if "created" in step:
-            info.append(f"created={step['created']}")
-        if "skipped" in step:
-            info.append(f"skipped={step['skipped']}")
-
+        info = [f"{key}={step[key]}" for key in _STEP_INFO_KEYS if key in step]
         info_str = f" ({', '.join(info)})" if info else ""
 
-        print(f"  {icon} {step_display}{info_str}")
+        lines.append(f"  {icon} {step_display}{info_str}")
+
+    print("\n".join(lines))
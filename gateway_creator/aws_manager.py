@@ -13,7 +13,7 @@ Para una refactorización completa, se debe:
 3. Actualizar apiGatewayCreator.py para importar desde gateway_creator
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 from .config_manager import ConfigManager
 from common import get_logger
 
@@ -105,7 +105,7 @@ class APIGatewayManager:
         auth_type: str,
         cognito_pool: str = None,
         custom_headers: Dict[str, str] = None
-    ) -> bool:
+    ) -> Optional[Dict]:
         """
         Crea un método HTTP con integración y autenticación.
 
@@ -120,7 +120,7 @@ class APIGatewayManager:
             custom_headers: Headers personalizados (opcional).
 
         Returns:
-            True si se creó exitosamente, False en caso contrario.
+            Respuesta de put-integration si se creó exitosamente, None en caso contrario.
         """
         # Implementación completa en apiGatewayCreator.py
         raise NotImplementedError(
@@ -144,17 +144,15 @@ class APIGatewayManager:
             "Implementación en apiGatewayCreator.py"
         )
 
+    @staticmethod
     def verify_methods_integration(
-        self,
-        resource_id: str,
-        http_methods: List[str]
+        integrations: Dict[str, Optional[Dict]]
     ) -> bool:
         """
         Verifica que todos los métodos tienen integración configurada.
 
         Args:
-            resource_id: ID del recurso.
-            http_methods: Lista de métodos a verificar.
+            integrations: Respuestas de put-integration por método HTTP.
 
         Returns:
             True si todos tienen integración, False en caso contrario.
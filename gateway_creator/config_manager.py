@@ -8,13 +8,58 @@ headers de autorización, CORS y templates de respuesta.
 import configparser
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from common import SUCCESS_CONFIG_LOADED, get_logger
+from common import CONFIG_FILES, SUCCESS_CONFIG_LOADED, get_logger
 
 logger = get_logger(__name__)
 
 
+# Configuraciones ya parseadas por carpeta, junto con los mtimes de sus archivos:
+# los ConfigManager posteriores las reutilizan mientras los mtimes coincidan y
+# un cambio reemplaza la entrada (no se acumulan versiones viejas)
+_CONFIG_CACHE: Dict[
+    Path,
+    Tuple[
+        Tuple[int, ...],
+        Tuple[Dict[str, configparser.ConfigParser], Dict[str, Dict[str, Dict[str, str]]]],
+    ],
+] = {}
+
+
+def _config_mtimes(config_dir: Path) -> Tuple[int, ...]:
+    """Retorna el mtime de cada archivo de CONFIG_FILES (-1 si no existe)."""
+    mtimes = []
+    for filename in CONFIG_FILES.values():
+        try:
+            mtimes.append((config_dir / filename).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(-1)
+    return tuple(mtimes)
+
+
+def _parse_configs(
+    config_dir: Path,
+) -> Tuple[Dict[str, configparser.ConfigParser], Dict[str, Dict[str, Dict[str, str]]]]:
+    """Parsea los INI de CONFIG_FILES y materializa sus secciones como dicts."""
+    # Un parser por archivo: varios usan [DEFAULT] y al fusionarlos
+    # sus valores se heredarían en todas las secciones
+    parsers = {attr: configparser.ConfigParser() for attr in CONFIG_FILES}
+    missing = [
+        filename
+        for attr, filename in CONFIG_FILES.items()
+        if not parsers[attr].read(config_dir / filename, encoding="utf-8")
+    ]
+    if missing:
+        logger.warning(f"Archivos de configuración no encontrados: {', '.join(missing)}")
+    sections = {
+        attr: {name: dict(section) for name, section in parser.items()}
+        for attr, parser in parsers.items()
+    }
+    logger.debug(SUCCESS_CONFIG_LOADED)
+    return parsers, sections
+
+
 class ConfigManager:
     """
     Gestor de configuración que carga archivos INI de la carpeta 'config/'.
@@ -42,10 +87,14 @@ class ConfigManager:
             >>> auth_headers = manager.get_auth_headers('COGNITO_ADMIN')
         """
         self.config_dir = Path(__file__).parent.parent / config_dir
-        self.method_configs = configparser.ConfigParser()
-        self.auth_headers = configparser.ConfigParser()
-        self.cors_headers = configparser.ConfigParser()
-        self.response_templates = configparser.ConfigParser()
+        # Parsers por archivo (method_configs, auth_headers, cors_headers,
+        # response_templates) y secciones materializadas: {archivo: {sección: dict}}.
+        # Se asignan en _load_configs desde la caché de módulo
+        self.method_configs: configparser.ConfigParser
+        self.auth_headers: configparser.ConfigParser
+        self.cors_headers: configparser.ConfigParser
+        self.response_templates: configparser.ConfigParser
+        self._sections: Dict[str, Dict[str, Dict[str, str]]] = {}
 
         self._load_configs()
 
@@ -57,15 +106,15 @@ class ConfigManager:
             SystemExit: Si hay error cargando las configuraciones.
         """
         try:
-            self.method_configs.read(
-                self.config_dir / "method_configs.ini"
-            )
-            self.auth_headers.read(self.config_dir / "auth_headers.ini")
-            self.cors_headers.read(self.config_dir / "cors_headers.ini")
-            self.response_templates.read(
-                self.config_dir / "response_templates.ini"
-            )
-            logger.debug(SUCCESS_CONFIG_LOADED)
+            # Los archivos solo se vuelven a parsear si cambió alguno (mtime)
+            mtimes = _config_mtimes(self.config_dir)
+            cached_mtimes, cached = _CONFIG_CACHE.get(self.config_dir, (None, None))
+            if cached_mtimes != mtimes:
+                cached = _parse_configs(self.config_dir)
+                _CONFIG_CACHE[self.config_dir] = (mtimes, cached)
+            parsers, self._sections = cached
+            for attr, parser in parsers.items():
+                setattr(self, attr, parser)
         except Exception as e:
             error_msg = (
                 f"Error cargando configuraciones desde {self.config_dir}"
@@ -82,14 +131,14 @@ class ConfigManager:
             http_method: Método HTTP (GET, POST, etc.).
 
         Returns:
-            Diccionario con la configuración del método.
+            Diccionario con la configuración del método (compartido, no mutar).
 
         Example:
             >>> config = manager.get_method_config('GET')
             >>> config['timeout_ms']
             '29000'
         """
-        return dict(self.method_configs.get('DEFAULT', {}))
+        return self._sections["method_configs"].get('DEFAULT', {})
 
     def get_auth_headers(self, auth_type: str) -> Dict[str, str]:
         """
@@ -99,15 +148,16 @@ class ConfigManager:
             auth_type: Tipo de autorización (COGNITO_ADMIN, COGNITO_CUSTOMER, etc.).
 
         Returns:
-            Diccionario con los headers de autorización.
+            Diccionario con los headers de autorización (compartido, no mutar).
             Si el tipo no existe, retorna headers de NO_AUTH.
 
         Example:
             >>> headers = manager.get_auth_headers('COGNITO_ADMIN')
         """
-        if auth_type not in self.auth_headers:
-            return dict(self.auth_headers.get('NO_AUTH', {}))
-        return dict(self.auth_headers[auth_type])
+        auth_headers = self._sections["auth_headers"]
+        if auth_type not in auth_headers:
+            return auth_headers.get('NO_AUTH', {})
+        return auth_headers[auth_type]
 
     def get_cors_headers(self, cors_type: str = "DEFAULT") -> Dict[str, str]:
         """
@@ -117,12 +167,12 @@ class ConfigManager:
             cors_type: Tipo de configuración CORS (default: "DEFAULT").
 
         Returns:
-            Diccionario con los headers CORS.
+            Diccionario con los headers CORS (compartido, no mutar).
 
         Example:
             >>> cors = manager.get_cors_headers()
         """
-        return dict(self.cors_headers.get(cors_type, {}))
+        return self._sections["cors_headers"].get(cors_type, {})
 
     def get_response_template(
         self,
@@ -135,12 +185,12 @@ class ConfigManager:
             template_type: Tipo de template (default: "DEFAULT").
 
         Returns:
-            Diccionario con los templates de respuesta.
+            Diccionario con los templates de respuesta (compartido, no mutar).
 
         Example:
             >>> templates = manager.get_response_template()
         """
-        return dict(self.response_templates.get(template_type, {}))
+        return self._sections["response_templates"].get(template_type, {})
 
 
 class ProfileConfigManager:
@@ -164,9 +214,9 @@ class ProfileConfigManager:
             >>> manager = ProfileConfigManager(config)
         """
         self.profile_config = profile_config
-        self.method_configs = configparser.ConfigParser()
-        self.auth_headers = configparser.ConfigParser()
-        self.cors_headers = configparser.ConfigParser()
+        self.method_configs: Dict[str, Dict[str, str]] = {}
+        self.auth_headers: Dict[str, Dict[str, str]] = {}
+        self.cors_headers: Dict[str, Dict[str, str]] = {}
 
         self._load_from_profile()
 
@@ -174,12 +224,13 @@ class ProfileConfigManager:
         """
         Carga configuraciones desde el perfil INI.
 
-        Procesa secciones como METHOD_CONFIG, AUTH_HEADERS_*, CORS_HEADERS_*.
+        Procesa secciones como METHOD_CONFIG, AUTH_HEADERS_*, CORS_HEADERS_*
+        y las materializa como dicts en una sola pasada.
         """
         try:
             # Cargar configuración de métodos si existe
             if 'METHOD_CONFIG' in self.profile_config:
-                self.method_configs['DEFAULT'] = (
+                self.method_configs['DEFAULT'] = dict(
                     self.profile_config['METHOD_CONFIG']
                 )
             else:
@@ -191,19 +242,16 @@ class ProfileConfigManager:
                     'connection_type': 'VPC_LINK'
                 }
 
-            # Cargar headers de autorización
+            # Cargar headers de autorización y CORS
             for section in self.profile_config.sections():
                 if section.startswith('AUTH_HEADERS_'):
-                    auth_type = section.replace('AUTH_HEADERS_', '')
-                    self.auth_headers[auth_type] = (
+                    auth_type = section[len('AUTH_HEADERS_'):]
+                    self.auth_headers[auth_type] = dict(
                         self.profile_config[section]
                     )
-
-            # Cargar headers CORS
-            for section in self.profile_config.sections():
-                if section.startswith('CORS_HEADERS_'):
-                    cors_type = section.replace('CORS_HEADERS_', '')
-                    self.cors_headers[cors_type] = (
+                elif section.startswith('CORS_HEADERS_'):
+                    cors_type = section[len('CORS_HEADERS_'):]
+                    self.cors_headers[cors_type] = dict(
                         self.profile_config[section]
                     )
 
@@ -221,9 +269,9 @@ class ProfileConfigManager:
             http_method: Método HTTP (GET, POST, etc.).
 
         Returns:
-            Diccionario con la configuración del método.
+            Diccionario con la configuración del método (compartido, no mutar).
         """
-        return dict(self.method_configs.get('DEFAULT', {}))
+        return self.method_configs['DEFAULT']
 
     def get_auth_headers(self, auth_type: str) -> Dict[str, str]:
         """
@@ -233,11 +281,12 @@ class ProfileConfigManager:
             auth_type: Tipo de autorización (COGNITO_ADMIN, etc.).
 
         Returns:
-            Diccionario con los headers de autorización.
+            Diccionario con los headers de autorización (compartido, no mutar).
         """
-        if auth_type not in self.auth_headers:
-            return dict(self.auth_headers.get('NO_AUTH', {}))
-        return dict(self.auth_headers[auth_type])
+        auth_headers = self.auth_headers.get(auth_type)
+        if auth_headers is None:
+            return self.auth_headers.get('NO_AUTH', {})
+        return auth_headers
 
     def get_cors_headers(self, cors_type: str = "DEFAULT") -> Dict[str, str]:
         """
@@ -247,6 +296,6 @@ class ProfileConfigManager:
             cors_type: Tipo de configuración CORS (default: "DEFAULT").
 
         Returns:
-            Diccionario con los headers CORS.
+            Diccionario con los headers CORS (compartido, no mutar).
         """
-        return dict(self.cors_headers.get(cors_type, {}))
+        return self.cors_headers.get(cors_type, {})
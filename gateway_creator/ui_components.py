@@ -6,9 +6,43 @@ como encabezados de menú, opciones, mensajes en cajas, etc.
 """
 
 import os
+import sys
+from functools import lru_cache
+from typing import Tuple
+
 from common import ANSIColors, MENU_BORDER_WIDTH
 
 
+# Fragmentos de UI con colores, formateados una sola vez al importar
+_MENU_HEADER_TOP = f"\n{ANSIColors.CYAN}┌{'─' * MENU_BORDER_WIDTH}┐{ANSIColors.RESET}"
+_MENU_HEADER_BOTTOM = f"{ANSIColors.CYAN}└{'─' * MENU_BORDER_WIDTH}┘{ANSIColors.RESET}"
+_MENU_HEADER_ROW_START = f"{ANSIColors.CYAN}│ "
+_MENU_HEADER_ROW_END = f"│{ANSIColors.RESET}"
+_MENU_OPTION_START = f"  {ANSIColors.GREEN}"
+_MENU_OPTION_END = f"{ANSIColors.RESET} - "
+_SUMMARY_BULLET = f"  {ANSIColors.CYAN}▸{ANSIColors.RESET} "
+_SUMMARY_LABEL_HIGHLIGHT = ANSIColors.YELLOW
+_SUMMARY_VALUE_HIGHLIGHT = ANSIColors.GREEN
+_SUMMARY_VALUE = ANSIColors.GRAY
+_BOX_COLORS = {
+    "info": ANSIColors.CYAN,
+    "success": ANSIColors.GREEN,
+    "warning": ANSIColors.YELLOW,
+    "error": ANSIColors.RED,
+}
+
+
+# Cursor al inicio, borrar pantalla y scrollback (lo mismo que emite `clear`)
+_CLEAR_SCREEN_SEQUENCE = "\033[H\033[2J\033[3J"
+
+
+@lru_cache(maxsize=None)
+def _box_borders(color: str, width: int) -> Tuple[str, str]:
+    """Bordes superior e inferior de una caja de print_box_message para un ancho dado."""
+    edge = '═' * (width + 2)
+    return f"\n{color}╔{edge}╗{ANSIColors.RESET}", f"{color}╚{edge}╝{ANSIColors.RESET}"
+
+
 def print_menu_header(title: str) -> None:
     """
     Imprime un encabezado de menú con bordes estilizados.
@@ -22,13 +56,11 @@ def print_menu_header(title: str) -> None:
         │ CONFIGURACIÓN              │
         └────────────────────────────┘
     """
-    color = ANSIColors.CYAN
-    reset = ANSIColors.RESET
     print(
-        f"\n{color}┌{'─' * MENU_BORDER_WIDTH}┐{reset}"
+        f"{_MENU_HEADER_TOP}\n"
+        f"{_MENU_HEADER_ROW_START}{title:<{MENU_BORDER_WIDTH - 1}}{_MENU_HEADER_ROW_END}\n"
+        f"{_MENU_HEADER_BOTTOM}"
     )
-    print(f"{color}│ {title:<{MENU_BORDER_WIDTH - 1}}│{reset}")
-    print(f"{color}└{'─' * MENU_BORDER_WIDTH}┘{reset}")
 
 
 def print_menu_option(
@@ -48,9 +80,7 @@ def print_menu_option(
         >>> print_menu_option(1, "Crear endpoint")
         ▸ 1 - Crear endpoint
     """
-    color = ANSIColors.GREEN
-    reset = ANSIColors.RESET
-    print(f"  {color}{emoji} {number}{reset} - {text}")
+    print(f"{_MENU_OPTION_START}{emoji} {number}{_MENU_OPTION_END}{text}")
 
 
 def print_summary_item(
@@ -73,23 +103,15 @@ def print_summary_item(
         >>> print_summary_item("Status", "CREADO", highlight=True)
         ▸ Status: CREADO (con colores destacados)
     """
-    info_color = ANSIColors.CYAN
-    highlight_color = ANSIColors.YELLOW
-    value_color = ANSIColors.GREEN
-    debug_color = ANSIColors.GRAY
     reset = ANSIColors.RESET
 
     if highlight:
         print(
-            f"  {info_color}▸{reset} "
-            f"{highlight_color}{label}:{reset} "
-            f"{value_color}{value}{reset}"
+            f"{_SUMMARY_BULLET}{_SUMMARY_LABEL_HIGHLIGHT}{label}:{reset} "
+            f"{_SUMMARY_VALUE_HIGHLIGHT}{value}{reset}"
         )
     else:
-        print(
-            f"  {info_color}▸{reset} "
-            f"{label}: {debug_color}{value}{reset}"
-        )
+        print(f"{_SUMMARY_BULLET}{label}: {_SUMMARY_VALUE}{value}{reset}")
 
 
 def print_box_message(message: str, style: str = "info") -> None:
@@ -106,34 +128,31 @@ def print_box_message(message: str, style: str = "info") -> None:
         ║ Operación completada         ║
         ╚══════════════════════════════╝
     """
-    color_map = {
-        "info": ANSIColors.CYAN,
-        "success": ANSIColors.GREEN,
-        "warning": ANSIColors.YELLOW,
-        "error": ANSIColors.RED,
-    }
-    color = color_map.get(style, ANSIColors.CYAN)
+    color = _BOX_COLORS.get(style, ANSIColors.CYAN)
     reset = ANSIColors.RESET
 
     lines = message.split('\n')
-    max_len = max(len(line) for line in lines) if lines else 0
+    max_len = max(map(len, lines), default=0)
+    top, bottom = _box_borders(color, max_len)
 
-    print(f"\n{color}╔{'═' * (max_len + 2)}╗{reset}")
-    for line in lines:
-        print(f"{color}║ {line:<{max_len}} ║{reset}")
-    print(f"{color}╚{'═' * (max_len + 2)}╝{reset}")
+    body = "".join(f"{color}║ {line:<{max_len}} ║{reset}\n" for line in lines)
+    print(f"{top}\n{body}{bottom}")
 
 
 def clear_screen() -> None:
     """
     Limpia la pantalla de forma segura en Windows y sistemas Unix.
 
-    Ejecuta el comando apropiado según el sistema operativo:
-    - Windows: 'cls'
-    - Unix/Linux/Mac: 'clear'
+    En terminales Unix/Linux/Mac escribe la secuencia de escape ANSI
+    directamente; en Windows o si stdout no es una terminal ejecuta el
+    comando apropiado ('cls' o 'clear').
 
     Example:
         >>> clear_screen()
         # La pantalla se limpia
     """
+    if os.name != 'nt' and sys.stdout.isatty():
+        sys.stdout.write(_CLEAR_SCREEN_SEQUENCE)
+        return
+    sys.stdout.flush()
     os.system('cls' if os.name == 'nt' else 'clear')
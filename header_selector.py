@@ -3,6 +3,7 @@ Header Selector - Interactive header selection from Lambda options.
 
 Allows users to select headers dynamically from Lambda configuration.
 """
+import re
 from typing import Dict, List, Any, Optional
 
 from common import get_logger, ANSIColors
@@ -10,6 +11,32 @@ from lambda_client import get_lambda_client
 
 logger = get_logger(__name__)
 
+# "Name=Value" entry; header names cannot contain "=" so the first one splits
+_HEADER_ASSIGNMENT_RE = re.compile(r'^([^=\s]+)\s*=\s*(.+)$')
+
+# Fallback headers per auth type when Lambda is unavailable
+_DEFAULT_HEADERS: Dict[str, Dict[str, str]] = {
+    "COGNITO_ADMIN": {
+        "Claim-Email": "context.authorizer.claims.email",
+        "Claim-User-Id": "context.authorizer.claims.custom:admin_id",
+        "KNOWN-TOKEN-KEY": "stageVariables.knownTokenKey",
+        "X-Amzn-Request-Id": "context.requestId"
+    },
+    "COGNITO_CUSTOMER": {
+        "Claim-Email": "context.authorizer.claims.email",
+        "Claim-User-Id": "context.authorizer.claims.custom:customer_id",
+        "KNOWN-TOKEN-KEY": "stageVariables.knownTokenKey",
+        "X-Amzn-Request-Id": "context.requestId"
+    },
+    "NO_AUTH": {
+        "KNOWN-TOKEN-KEY": "stageVariables.knownTokenKey",
+        "X-Amzn-Request-Id": "context.requestId"
+    },
+    "API_KEY": {
+        "X-Amzn-Request-Id": "context.requestId"
+    }
+}
+
 
 def select_headers_for_auth_type(auth_type: str) -> Dict[str, str]:
     """
@@ -46,7 +73,8 @@ def select_headers_for_auth_type(auth_type: str) -> Dict[str, str]:
     # Display available headers
     selected_headers = {}
 
-    print(f"{ANSIColors.CYAN}Headers configurados:{ANSIColors.RESET}")
+    # The whole list is written at once instead of three prints per header
+    lines = [f"{ANSIColors.CYAN}Headers configurados:{ANSIColors.RESET}"]
     for i, (header_name, header_info) in enumerate(headers_config.items(), 1):
         is_required = header_info.get("required", False)
         default_value = header_info.get("default", "")
@@ -54,14 +82,16 @@ def select_headers_for_auth_type(auth_type: str) -> Dict[str, str]:
 
         required_label = f"{ANSIColors.RED}*{ANSIColors.RESET}" if is_required else " "
 
-        print(f"  {ANSIColors.GREEN}{i}{ANSIColors.RESET}{required_label} {header_name}")
-        print(f"     {ANSIColors.GRAY}→ {description}{ANSIColors.RESET}")
-        print(f"     {ANSIColors.GRAY}Default: {default_value}{ANSIColors.RESET}\n")
+        lines.append(f"  {ANSIColors.GREEN}{i}{ANSIColors.RESET}{required_label} {header_name}")
+        lines.append(f"     {ANSIColors.GRAY}→ {description}{ANSIColors.RESET}")
+        lines.append(f"     {ANSIColors.GRAY}Default: {default_value}{ANSIColors.RESET}\n")
 
         # Auto-select required headers
         if is_required:
             selected_headers[header_name] = default_value
 
+    print("\n".join(lines))
+
     # Ask if user wants to add custom headers
     print(f"\n{ANSIColors.YELLOW}→{ANSIColors.RESET} ¿Deseas agregar headers personalizados? (s/n): ", end="")
     add_custom = input().strip().lower()
@@ -82,6 +112,9 @@ def _add_custom_headers() -> Dict[str, str]:
     """
     Interactive loop to add custom headers.
 
+    Each entry is either a header name (the value is asked next) or a
+    "Name=Value" line, so several headers can be pasted at once, one per line.
+
     Returns:
         Dictionary of custom headers
     """
@@ -89,12 +122,17 @@ def _add_custom_headers() -> Dict[str, str]:
 
     while True:
         print(f"\n{ANSIColors.CYAN}Agregar header personalizado:{ANSIColors.RESET}")
-        header_name = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Nombre del header (Enter para terminar): ").strip()
+        entry = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Nombre del header o Nombre=valor (Enter para terminar): ").strip()
 
-        if not header_name:
+        if not entry:
             break
 
-        header_value = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Valor del header: ").strip()
+        assignment = _HEADER_ASSIGNMENT_RE.match(entry)
+        if assignment:
+            header_name, header_value = assignment.group(1), assignment.group(2).strip()
+        else:
+            header_name = entry
+            header_value = input(f"{ANSIColors.YELLOW}→{ANSIColors.RESET} Valor del header: ").strip()
 
         if not header_value:
             logger.warning("Valor vacío, header ignorado")
@@ -116,29 +154,8 @@ def _get_default_headers(auth_type: str) -> Dict[str, str]:
     Returns:
         Default headers dictionary
     """
-    defaults = {
-        "COGNITO_ADMIN": {
-            "Claim-Email": "context.authorizer.claims.email",
-            "Claim-User-Id": "context.authorizer.claims.custom:admin_id",
-            "KNOWN-TOKEN-KEY": "stageVariables.knownTokenKey",
-            "X-Amzn-Request-Id": "context.requestId"
-        },
-        "COGNITO_CUSTOMER": {
-            "Claim-Email": "context.authorizer.claims.email",
-            "Claim-User-Id": "context.authorizer.claims.custom:customer_id",
-            "KNOWN-TOKEN-KEY": "stageVariables.knownTokenKey",
-            "X-Amzn-Request-Id": "context.requestId"
-        },
-        "NO_AUTH": {
-            "KNOWN-TOKEN-KEY": "stageVariables.knownTokenKey",
-            "X-Amzn-Request-Id": "context.requestId"
-        },
-        "API_KEY": {
-            "X-Amzn-Request-Id": "context.requestId"
-        }
-    }
-
-    return defaults.get(auth_type, {})
+    # Copy so callers can modify the result without touching the shared defaults
+    return dict(_DEFAULT_HEADERS.get(auth_type, {}))
 
 
 def display_integration_options() -> Optional[Dict[str, Any]]:
@@ -159,21 +176,23 @@ def display_integration_options() -> Optional[Dict[str, Any]]:
 
     config_options = options["integration_config"]
 
-    print(f"{ANSIColors.CYAN}Opciones disponibles:{ANSIColors.RESET}\n")
+    lines = [f"{ANSIColors.CYAN}Opciones disponibles:{ANSIColors.RESET}\n"]
 
     for key, value_info in config_options.items():
         default = value_info.get("default")
         description = value_info.get("description", "")
 
-        print(f"  {ANSIColors.GREEN}▸{ANSIColors.RESET} {key}")
-        print(f"     {ANSIColors.GRAY}{description}{ANSIColors.RESET}")
-        print(f"     {ANSIColors.GRAY}Default: {default}{ANSIColors.RESET}")
+        lines.append(f"  {ANSIColors.GREEN}▸{ANSIColors.RESET} {key}")
+        lines.append(f"     {ANSIColors.GRAY}{description}{ANSIColors.RESET}")
+        lines.append(f"     {ANSIColors.GRAY}Default: {default}{ANSIColors.RESET}")
 
         if "options" in value_info:
             options_list = value_info["options"]
-            print(f"     {ANSIColors.GRAY}Opciones: {', '.join(options_list)}{ANSIColors.RESET}")
+            lines.append(f"     {ANSIColors.GRAY}Opciones: {', '.join(options_list)}{ANSIColors.RESET}")
+
+        lines.append("")
 
-        print()
+    print("\n".join(lines))
 
     logger.info("ℹ️  Usando valores por defecto para la integración")
 
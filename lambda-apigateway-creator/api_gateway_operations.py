@@ -3,13 +3,50 @@ API Gateway operations using boto3.
 
 All AWS API Gateway interactions happen through this module.
 """
-import re
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from path_parser import PATH_PARAMETER_RE
+
+
+logger = logging.getLogger(__name__)
+
+
+# Initialize boto3 client, reused across warm invocations: a sized connection
+# pool with keep-alive avoids new TLS handshakes between the put_* calls, and
+# adaptive retries absorb API Gateway write throttling
+apigateway = boto3.client(
+    'apigateway',
+    config=Config(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        connect_timeout=3,
+        read_timeout=15
+    )
+)
 
-# Initialize boto3 client
-apigateway = boto3.client('apigateway')
+# get_resources returns 25 items per call by default; always read every page
+_resources_paginator = apigateway.get_paginator('get_resources')
+
+# Concurrent per-method calls (kept below max_pool_connections)
+_MAX_METHOD_WORKERS = 8
+
+# Parallel writes on the same API can fail with a ConflictException for
+# "concurrent modification"; those are retried instead of read as "exists"
+_CONCURRENT_MODIFICATION_RETRIES = 5
+
+# Resource maps of recently listed APIs, reused by back-to-back invocations in
+# a warm container: api_id -> (expiry on the monotonic clock, {path: id})
+_RESOURCE_CACHE = {}
+_RESOURCE_CACHE_TTL_SECONDS = 5.0
 
 
 def create_resource_hierarchy(api_id, segments, full_path):
@@ -25,8 +62,11 @@ def create_resource_hierarchy(api_id, segments, full_path):
         Dict with success status and resource_id or error
     """
     try:
+        # Single listing of the API's resources, updated as new ones are created
+        resources_by_path = _get_resource_map(api_id)
+
         # Get root resource
-        root_id = _get_root_resource_id(api_id)
+        root_id = resources_by_path.get("/")
         if not root_id:
             return {
                 "success": False,
@@ -34,29 +74,30 @@ def create_resource_hierarchy(api_id, segments, full_path):
             }
 
         parent_id = root_id
-        current_path = ""
         created_count = 0
         skipped_count = 0
 
-        for segment in segments:
-            current_path += "/" + segment
+        # Cumulative paths: /a, /a/b, /a/b/c ...
+        paths = accumulate("/" + segment for segment in segments)
 
+        for segment, current_path in zip(segments, paths):
             # Check if resource exists
-            existing_id = _find_resource_by_path(api_id, current_path)
+            existing_id = resources_by_path.get(current_path)
 
             if existing_id:
-                print(f"  Resource {current_path} already exists: {existing_id}")
+                logger.info("  Resource %s already exists: %s", current_path, existing_id)
                 parent_id = existing_id
                 skipped_count += 1
             else:
                 # Create new resource
-                new_id = _create_resource(api_id, parent_id, segment)
+                new_id = _create_resource(api_id, parent_id, segment, current_path)
                 if not new_id:
                     return {
                         "success": False,
                         "error": f"Failed to create resource: {segment}"
                     }
-                print(f"  Created resource {current_path}: {new_id}")
+                logger.info("  Created resource %s: %s", current_path, new_id)
+                resources_by_path[current_path] = new_id
                 parent_id = new_id
                 created_count += 1
 
@@ -79,155 +120,73 @@ def create_resource_hierarchy(api_id, segments, full_path):
         }
 
 
-def create_http_methods(api_id, resource_id, http_methods, payload):
+def invalidate_resource_cache(api_id):
     """
-    Create HTTP methods for a resource.
+    Forget the cached resource map of an API.
+
+    Called after any failed endpoint creation: a resource deleted elsewhere
+    or a half-finished creation must not be served from the cache.
 
     Args:
         api_id: REST API ID
-        resource_id: Resource ID
-        http_methods: List of HTTP methods
-        payload: Full payload with auth config
-
-    Returns:
-        Dict with success status
     """
-    try:
-        auth_config = payload.get("authentication", {})
-        auth_method = auth_config.get("method", "AUTHORIZER")
-        authorizer_id = auth_config.get("authorizer_id")
-
-        # Determine authorization type
-        if auth_method == "API_KEY":
-            authorization_type = "NONE"
-            api_key_required = True
-            authorizer_id = None
-        elif auth_config.get("auth_type") == "NO_AUTH":
-            authorization_type = "NONE"
-            api_key_required = False
-            authorizer_id = None
-        else:
-            authorization_type = "COGNITO_USER_POOLS"
-            api_key_required = False
-
-        # Extract path parameters from path
-        path = payload["endpoint"]["api_gateway_path"]
-        request_parameters = _extract_path_parameters(path)
-
-        for method in http_methods:
-            try:
-                params = {
-                    'restApiId': api_id,
-                    'resourceId': resource_id,
-                    'httpMethod': method,
-                    'authorizationType': authorization_type,
-                    'apiKeyRequired': api_key_required
-                }
-
-                if authorizer_id and authorization_type == "COGNITO_USER_POOLS":
-                    params['authorizerId'] = authorizer_id
-
-                if request_parameters:
-                    params['requestParameters'] = request_parameters
-
-                apigateway.put_method(**params)
-                print(f"    ✓ Created method: {method}")
-
-            except ClientError as e:
-                error_code = e.response['Error']['Code']
-                if error_code == 'ConflictException':
-                    print(f"    ⚠ Method {method} already exists")
-                else:
-                    raise
-
-        return {"success": True}
-
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    _RESOURCE_CACHE.pop(api_id, None)
 
 
-def configure_integrations(api_id, resource_id, http_methods, payload):
+def configure_methods(api_id, resource_id, http_methods, payload):
     """
-    Configure VPC Link integrations for HTTP methods.
+    Create HTTP methods and configure their integrations.
+
+    Each method goes through put_method and its integration calls in the
+    same worker, so methods don't wait on each other between both steps.
 
     Args:
         api_id: REST API ID
         resource_id: Resource ID
         http_methods: List of HTTP methods
-        payload: Full payload with integration config
+        payload: Full payload with auth and integration config
 
     Returns:
-        Dict with success status
+        Dict with success status; on failure, "step" is the failed step
+        ("create_methods" or "configure_integrations")
     """
+    step = "create_methods"
     try:
-        integration_config = payload.get("integration", {})
-        backend_host = integration_config.get("backend_host")
-        backend_path = payload["endpoint"]["full_backend_path"]
-        connection_variable = integration_config.get("connection_variable")
-        timeout_ms = integration_config.get("timeout_ms", 29000)
-        passthrough = integration_config.get("passthrough_behavior", "WHEN_NO_MATCH")
-        integration_type = integration_config.get("integration_type", "HTTP_PROXY")
+        existing_methods = _get_resource_methods(api_id, resource_id)
+        create_method = _method_creator(api_id, resource_id, payload)
 
-        # Build integration URI
-        integration_uri = f"{backend_host}{backend_path}"
-
-        # Build request parameters (headers + path params)
-        request_parameters = _build_integration_request_parameters(payload)
+        step = "configure_integrations"
+        configure_integration = _integration_configurer(
+            api_id, resource_id, payload, existing_methods
+        )
 
-        for method in http_methods:
+        def configure_method(method):
+            if method in existing_methods:
+                logger.warning("    ⚠ Method %s already exists", method)
+            else:
+                try:
+                    create_method(method)
+                except Exception as e:
+                    raise _MethodStepError("create_methods", e) from e
             try:
-                # Connection ID reference using stage variable
-                connection_id = f"${{stageVariables.{connection_variable}}}"
-
-                apigateway.put_integration(
-                    restApiId=api_id,
-                    resourceId=resource_id,
-                    httpMethod=method,
-                    type=integration_type,
-                    integrationHttpMethod=method,
-                    uri=integration_uri,
-                    connectionType='VPC_LINK',
-                    connectionId=connection_id,
-                    requestParameters=request_parameters,
-                    passthroughBehavior=passthrough,
-                    timeoutInMillis=timeout_ms
-                )
+                configure_integration(method)
+            except Exception as e:
+                raise _MethodStepError("configure_integrations", e) from e
 
-                # Configure method response
-                apigateway.put_method_response(
-                    restApiId=api_id,
-                    resourceId=resource_id,
-                    httpMethod=method,
-                    statusCode='200',
-                    responseModels={'application/json': 'Empty'}
-                )
-
-                # Configure integration response
-                apigateway.put_integration_response(
-                    restApiId=api_id,
-                    resourceId=resource_id,
-                    httpMethod=method,
-                    statusCode='200',
-                    responseTemplates={'application/json': ''}
-                )
-
-                print(f"    ✓ Configured integration: {method}")
-
-            except ClientError as e:
-                error_code = e.response['Error']['Code']
-                if error_code == 'ConflictException':
-                    print(f"    ⚠ Integration {method} already exists")
-                else:
-                    raise
+        _for_each_method(configure_method, http_methods)
 
         return {"success": True}
 
+    except _MethodStepError as e:
+        return {
+            "success": False,
+            "step": e.step,
+            "error": str(e.error)
+        }
     except Exception as e:
         return {
             "success": False,
+            "step": step,
             "error": str(e)
         }
 
@@ -256,7 +215,8 @@ def create_cors_method(api_id, resource_id, cors_config):
 
         # Create OPTIONS method
         try:
-            apigateway.put_method(
+            _call(
+                'put_method',
                 restApiId=api_id,
                 resourceId=resource_id,
                 httpMethod='OPTIONS',
@@ -264,11 +224,12 @@ def create_cors_method(api_id, resource_id, cors_config):
                 apiKeyRequired=False
             )
         except ClientError as e:
-            if e.response['Error']['Code'] != 'ConflictException':
+            if not _is_already_exists(e):
                 raise
 
         # Create MOCK integration
-        apigateway.put_integration(
+        _call(
+            'put_integration',
             restApiId=api_id,
             resourceId=resource_id,
             httpMethod='OPTIONS',
@@ -286,7 +247,8 @@ def create_cors_method(api_id, resource_id, cors_config):
             response_params[f"method.response.header.{header_name}"] = True
 
         # Create method response
-        apigateway.put_method_response(
+        _call(
+            'put_method_response',
             restApiId=api_id,
             resourceId=resource_id,
             httpMethod='OPTIONS',
@@ -300,7 +262,8 @@ def create_cors_method(api_id, resource_id, cors_config):
             integration_params[f"method.response.header.{header_name}"] = header_value
 
         # Create integration response
-        apigateway.put_integration_response(
+        _call(
+            'put_integration_response',
             restApiId=api_id,
             resourceId=resource_id,
             httpMethod='OPTIONS',
@@ -308,7 +271,7 @@ def create_cors_method(api_id, resource_id, cors_config):
             responseParameters=integration_params
         )
 
-        print(f"    ✓ CORS configured")
+        logger.info("    ✓ CORS configured")
         return {"success": True}
 
     except Exception as e:
@@ -331,13 +294,15 @@ def verify_integrations(api_id, resource_id, methods):
         Dict with success status
     """
     try:
-        for method in methods:
+        def verify_integration(method):
             apigateway.get_integration(
                 restApiId=api_id,
                 resourceId=resource_id,
                 httpMethod=method
             )
-            print(f"    ✓ Verified: {method}")
+            logger.info("    ✓ Verified: %s", method)
+
+        _for_each_method(verify_integration, methods)
 
         return {"success": True}
 
@@ -352,70 +317,300 @@ def verify_integrations(api_id, resource_id, methods):
 # PRIVATE HELPER FUNCTIONS
 # ===================================================================
 
-def _get_root_resource_id(api_id):
-    """Get the root resource ID (/) of an API."""
-    try:
-        response = apigateway.get_resources(restApiId=api_id)
-        for resource in response.get('items', []):
-            if resource.get('path') == '/':
-                return resource['id']
-        return None
-    except ClientError:
-        return None
+class _MethodStepError(Exception):
+    """Failure of one step of configure_methods for a method."""
 
+    def __init__(self, step, error):
+        super().__init__(step, error)
+        self.step = step
+        self.error = error
 
-def _find_resource_by_path(api_id, path):
-    """Find a resource by its path."""
-    try:
-        response = apigateway.get_resources(restApiId=api_id)
-        for resource in response.get('items', []):
-            if resource.get('path') == path:
-                return resource['id']
-        return None
-    except ClientError:
-        return None
 
+def _method_creator(api_id, resource_id, payload):
+    """
+    Build the put_method call for a single HTTP method.
+
+    Auth settings and path parameters are resolved once for all methods.
+    """
+    auth_config = payload.get("authentication", {})
+    auth_method = auth_config.get("method", "AUTHORIZER")
+    authorizer_id = auth_config.get("authorizer_id")
+
+    # Determine authorization type
+    if auth_method == "API_KEY":
+        authorization_type = "NONE"
+        api_key_required = True
+        authorizer_id = None
+    elif auth_config.get("auth_type") == "NO_AUTH":
+        authorization_type = "NONE"
+        api_key_required = False
+        authorizer_id = None
+    else:
+        authorization_type = "COGNITO_USER_POOLS"
+        api_key_required = False
+
+    # Extract path parameters from path
+    path = payload["endpoint"]["api_gateway_path"]
+    request_parameters = _extract_path_parameters(path)
+
+    def create_method(method):
+        try:
+            params = {
+                'restApiId': api_id,
+                'resourceId': resource_id,
+                'httpMethod': method,
+                'authorizationType': authorization_type,
+                'apiKeyRequired': api_key_required
+            }
+
+            if authorizer_id and authorization_type == "COGNITO_USER_POOLS":
+                params['authorizerId'] = authorizer_id
+
+            if request_parameters:
+                params['requestParameters'] = request_parameters
+
+            _call('put_method', **params)
+            logger.info("    ✓ Created method: %s", method)
+
+        except ClientError as e:
+            # Concurrent-modification conflicts left after _call's retries are errors
+            if _is_already_exists(e):
+                logger.warning("    ⚠ Method %s already exists", method)
+            else:
+                raise
+
+    return create_method
+
+
+def _integration_configurer(api_id, resource_id, payload, existing_methods):
+    """
+    Build the integration calls for a single HTTP method.
+
+    The integration settings are resolved once for all methods. 200 responses
+    already present in existing_methods (from get_resource) are not put again.
+    """
+    integration_config = payload.get("integration", {})
+    backend_host = integration_config.get("backend_host")
+    backend_path = payload["endpoint"]["full_backend_path"]
+    connection_variable = integration_config.get("connection_variable")
+    timeout_ms = integration_config.get("timeout_ms", 29000)
+    passthrough = integration_config.get("passthrough_behavior", "WHEN_NO_MATCH")
+    integration_type = integration_config.get("integration_type", "HTTP_PROXY")
+
+    # Build integration URI
+    integration_uri = f"{backend_host}{backend_path}"
+
+    # Build request parameters (headers + path params)
+    request_parameters = _build_integration_request_parameters(payload)
+
+    # Connection ID reference using stage variable
+    connection_id = f"${{stageVariables.{connection_variable}}}"
+
+    # Public GETs may be cached at stage level: key them by path parameters
+    # so different resources never share a cached response
+    auth_config = payload.get("authentication", {})
+    cache_settings = {}
+    if auth_config.get("auth_type") == "NO_AUTH" and auth_config.get("method") != "API_KEY":
+        cache_settings = {
+            'cacheNamespace': resource_id,
+            'cacheKeyParameters': list(_extract_path_parameters(payload["endpoint"]["api_gateway_path"])),
+        }
+
+    def configure_integration(method):
+        existing = existing_methods.get(method, {})
+        existing_integration = existing.get('methodIntegration') or {}
+        try:
+            _call(
+                'put_integration',
+                restApiId=api_id,
+                resourceId=resource_id,
+                httpMethod=method,
+                type=integration_type,
+                integrationHttpMethod=method,
+                uri=integration_uri,
+                connectionType='VPC_LINK',
+                connectionId=connection_id,
+                requestParameters=request_parameters,
+                passthroughBehavior=passthrough,
+                timeoutInMillis=timeout_ms,
+                **(cache_settings if method == 'GET' else {})
+            )
+
+            if '200' in (existing.get('methodResponses') or {}):
+                logger.warning("    ⚠ Integration %s already exists", method)
+                return
+
+            # Configure method response
+            _call(
+                'put_method_response',
+                restApiId=api_id,
+                resourceId=resource_id,
+                httpMethod=method,
+                statusCode='200',
+                responseModels={'application/json': 'Empty'}
+            )
+
+            # Configure integration response
+            if '200' not in (existing_integration.get('integrationResponses') or {}):
+                _call(
+                    'put_integration_response',
+                    restApiId=api_id,
+                    resourceId=resource_id,
+                    httpMethod=method,
+                    statusCode='200',
+                    responseTemplates={'application/json': ''}
+                )
+
+            logger.info("    ✓ Configured integration: %s", method)
+
+        except ClientError as e:
+            # Concurrent-modification conflicts left after _call's retries are errors
+            if _is_already_exists(e):
+                logger.warning("    ⚠ Integration %s already exists", method)
+            else:
+                raise
+
+    return configure_integration
 
-def _create_resource(api_id, parent_id, path_part):
-    """Create a single resource."""
+
+def _call(operation, **params):
+    """Call an API Gateway operation, retrying concurrent-modification conflicts."""
+    for attempt in range(_CONCURRENT_MODIFICATION_RETRIES + 1):
+        try:
+            return getattr(apigateway, operation)(**params)
+        except ClientError as e:
+            if not _is_concurrent_modification(e) or attempt == _CONCURRENT_MODIFICATION_RETRIES:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+
+
+def _is_concurrent_modification(error):
+    """ConflictException caused by a parallel write on the same API (retryable)."""
+    details = error.response['Error']
+    return (
+        details.get('Code') == 'ConflictException'
+        and 'concurrent modification' in details.get('Message', '')
+    )
+
+
+def _is_already_exists(error):
+    """ConflictException caused by the entity already existing."""
+    return (
+        error.response['Error'].get('Code') == 'ConflictException'
+        and not _is_concurrent_modification(error)
+    )
+
+
+def _for_each_method(action, methods):
+    """
+    Run action(method) for every method concurrently.
+
+    The per-method calls are independent, so they share the client's
+    connection pool instead of waiting on each other. All calls finish
+    before the first failure (in method order) is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(_MAX_METHOD_WORKERS, len(methods)))) as executor:
+        futures = [executor.submit(action, method) for method in methods]
+
+    for future in futures:
+        future.result()
+
+
+def _get_resource_methods(api_id, resource_id):
+    """
+    Methods already defined on a resource, keyed by HTTP method.
+
+    Embedding the methods also returns their responses and integrations.
+    """
+    response = apigateway.get_resource(
+        restApiId=api_id,
+        resourceId=resource_id,
+        embed=['methods']
+    )
+    return response.get('resourceMethods', {})
+
+
+def _get_resource_map(api_id):
+    """
+    Map of path -> resource ID for an API, listed at most once per TTL.
+
+    The returned dict is the cached one: resources added to it by the caller
+    stay visible to the next invocations until the entry expires.
+    """
+    now = time.monotonic()
+    cached = _RESOURCE_CACHE.get(api_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    resources_by_path = _list_all_resources(api_id)
+    _RESOURCE_CACHE[api_id] = (now + _RESOURCE_CACHE_TTL_SECONDS, resources_by_path)
+    return resources_by_path
+
+
+def _list_all_resources(api_id):
+    """Map every resource path of an API to its ID (all pages, 500 per request)."""
+    pages = _resources_paginator.paginate(
+        restApiId=api_id,
+        PaginationConfig={'PageSize': 500}
+    )
+    return {
+        resource['path']: resource['id']
+        for page in pages
+        for resource in page.get('items', [])
+    }
+
+
+def _create_resource(api_id, parent_id, path_part, path):
+    """
+    Create a single resource.
+
+    If another invocation created the same resource first (concurrent batch
+    creations share parents), the API is listed again and the existing ID
+    is returned instead.
+    """
     try:
-        response = apigateway.create_resource(
+        response = _call(
+            'create_resource',
             restApiId=api_id,
             parentId=parent_id,
             pathPart=path_part
         )
         return response['id']
-    except ClientError:
-        return None
+    except ClientError as e:
+        if not _is_already_exists(e):
+            return None
+
+    resources_by_path = _list_all_resources(api_id)
+    _RESOURCE_CACHE[api_id] = (time.monotonic() + _RESOURCE_CACHE_TTL_SECONDS, resources_by_path)
+    return resources_by_path.get(path)
+
+
+@lru_cache(maxsize=128)
+def _path_parameter_names(path):
+    """Parameter names in a path like /users/{id}, shared by the method and integration setup."""
+    return tuple(PATH_PARAMETER_RE.findall(path))
 
 
 def _extract_path_parameters(path):
     """Extract path parameters from path like /users/{id}."""
-    params = {}
-    param_matches = re.findall(r'\{(\w+)\}', path)
-    for param in param_matches:
-        params[f"method.request.path.{param}"] = True
-    return params
+    return {f"method.request.path.{param}": True for param in _path_parameter_names(path)}
 
 
 def _build_integration_request_parameters(payload):
     """Build integration request parameters (headers + path params)."""
-    params = {}
-
-    # Add authorization headers
-    auth_headers = payload.get("headers", {}).get("auth_headers", {})
-    for header_name, header_value in auth_headers.items():
-        params[f"integration.request.header.{header_name}"] = header_value
+    headers = payload.get("headers", {})
 
-    # Add custom headers
-    custom_headers = payload.get("headers", {}).get("custom_headers", {})
-    for header_name, header_value in custom_headers.items():
-        params[f"integration.request.header.{header_name}"] = header_value
+    # Authorization headers, then custom headers (which override them), then path parameters
+    params = {
+        f"integration.request.header.{header_name}": header_value
+        for header_group in (headers.get("auth_headers", {}), headers.get("custom_headers", {}))
+        for header_name, header_value in header_group.items()
+    }
 
-    # Add path parameters mapping
     path = payload["endpoint"]["api_gateway_path"]
-    param_matches = re.findall(r'\{(\w+)\}', path)
-    for param in param_matches:
-        params[f"integration.request.path.{param}"] = f"method.request.path.{param}"
+    params.update(
+        (f"integration.request.path.{param}", f"method.request.path.{param}")
+        for param in _path_parameter_names(path)
+    )
 
     return params
@@ -2,9 +2,14 @@
 Header options provider.
 
 Returns available header configurations for different auth types.
+
+The options are static, so each getter builds its dict once per container
+and returns the same object afterwards: callers must treat it as read-only.
 """
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_auth_headers_options():
     """
     Get available authentication header options.
@@ -101,6 +106,7 @@ def get_auth_headers_options():
     }
 
 
+@lru_cache(maxsize=1)
 def get_cors_headers_options():
     """
     Get available CORS header configurations.
@@ -146,6 +152,7 @@ def get_cors_headers_options():
     }
 
 
+@lru_cache(maxsize=1)
 def get_integration_config_options():
     """
     Get available integration configuration options.
@@ -178,6 +185,7 @@ def get_integration_config_options():
     }
 
 
+@lru_cache(maxsize=1)
 def get_all_options():
     """
     Get all available configuration options.
@@ -4,8 +4,10 @@ Lambda Handler for API Gateway Resource Creator.
 Receives JSON payload from client terminal and creates resources in AWS API Gateway.
 """
 import json
-import traceback
-from datetime import datetime
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import api_gateway_operations
 import header_options
@@ -14,6 +16,12 @@ import validators
 from path_parser import PathParser
 
 
+# The Lambda runtime attaches its handler to the root logger; LOG_LEVEL comes
+# from template.yml. %-style arguments are only formatted if the level is on.
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+
 def handler(event, context):
     """
     Main Lambda handler for creating API Gateway resources.
@@ -25,19 +33,18 @@ def handler(event, context):
     Returns:
         Response with status and execution steps
     """
-    print("=" * 70)
-    print(f"[{datetime.now().isoformat()}] Start handler")
-    print(f"Event body: {event.get('body', 'NO BODY')}")
+    logger.info("Start handler")
+    logger.debug("Event body: %s", event.get('body', 'NO BODY'))
 
     try:
         # Parse and validate request
         payload = _parse_request(event)
-        print(f"Parsed payload for operation: {payload.get('operation')}")
+        logger.info("Parsed payload for operation: %s", payload.get('operation'))
 
         # Validate payload structure
         validation_result = validators.validate_payload(payload)
         if not validation_result["valid"]:
-            print(f"Validation failed: {validation_result['error']}")
+            logger.warning("Validation failed: %s", validation_result['error'])
             return response_builder.error_response(
                 validation_result["error"],
                 "INVALID_PAYLOAD"
@@ -48,6 +55,8 @@ def handler(event, context):
 
         if operation == "create_endpoint":
             result = _create_endpoint(payload)
+        elif operation == "create_endpoints":
+            result = _create_endpoints(payload)
         elif operation == "get_header_options":
             result = _get_header_options(payload)
         else:
@@ -56,13 +65,11 @@ def handler(event, context):
                 "UNKNOWN_OPERATION"
             )
 
-        print(f"[{datetime.now().isoformat()}] End handler - Success")
+        logger.info("End handler - Success")
         return result
 
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"ERROR: {str(e)}")
-        print(f"Traceback:\n{error_trace}")
+        logger.exception("ERROR: %s", e)
 
         return response_builder.error_response(
             str(e),
@@ -92,6 +99,25 @@ def _create_endpoint(payload):
     """
     Create API Gateway endpoint with all configurations.
 
+    Args:
+        payload: Validated JSON payload
+
+    Returns:
+        Response with execution steps
+    """
+    response = _run_create_endpoint(payload)
+
+    if response["statusCode"] != 200:
+        # Don't let the next invocations trust resource IDs from a failed run
+        api_gateway_operations.invalidate_resource_cache(payload["config"]["api_id"])
+
+    return response
+
+
+def _run_create_endpoint(payload):
+    """
+    Run the creation steps of an endpoint.
+
     Args:
         payload: Validated JSON payload
 
@@ -102,7 +128,7 @@ def _create_endpoint(payload):
 
     try:
         # Step 1: Parse path
-        print("\n[STEP 1] Parsing path...")
+        logger.info("[STEP 1] Parsing path...")
         parser = PathParser(payload["endpoint"]["api_gateway_path"])
         segments = parser.get_segments()
 
@@ -110,10 +136,10 @@ def _create_endpoint(payload):
             "name": "parse_path",
             "status": "ok"
         })
-        print(f"  ✓ Path parsed: {len(segments)} segments")
+        logger.info("  ✓ Path parsed: %d segments", len(segments))
 
         # Step 2: Create resource hierarchy
-        print("\n[STEP 2] Creating resource hierarchy...")
+        logger.info("[STEP 2] Creating resource hierarchy...")
         api_id = payload["config"]["api_id"]
 
         resource_result = api_gateway_operations.create_resource_hierarchy(
@@ -143,70 +169,70 @@ def _create_endpoint(payload):
             "created": created_count,
             "skipped": skipped_count
         })
-        print(f"  ✓ Resources created: {created_count}, skipped: {skipped_count}")
+        logger.info("  ✓ Resources created: %d, skipped: %d", created_count, skipped_count)
 
-        # Step 3: Create HTTP methods
-        print("\n[STEP 3] Creating HTTP methods...")
         http_methods = payload["endpoint"]["http_methods"]
 
-        methods_result = api_gateway_operations.create_http_methods(
-            api_id,
-            final_resource_id,
-            http_methods,
-            payload
-        )
-
-        if not methods_result["success"]:
-            steps.append({
-                "name": "create_methods",
-                "status": "failed"
-            })
-            return response_builder.error_response(
-                methods_result["error"],
-                "METHOD_CREATION_FAILED",
-                steps
+        # The OPTIONS method (CORS) doesn't depend on the user methods, so it is
+        # set up in the background meanwhile; leaving the block waits for it
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cors_future = executor.submit(
+                api_gateway_operations.create_cors_method,
+                api_id,
+                final_resource_id,
+                payload.get("cors", {})
             )
 
-        steps.append({
-            "name": "create_methods",
-            "status": "ok",
-            "count": len(http_methods)
-        })
-        print(f"  ✓ Methods created: {len(http_methods)}")
+            # Steps 3 and 4: Create HTTP methods and configure their integrations,
+            # both calls of each method in the same worker
+            logger.info("[STEP 3] Creating HTTP methods...")
+            logger.info("[STEP 4] Configuring integrations...")
+            methods_result = api_gateway_operations.configure_methods(
+                api_id,
+                final_resource_id,
+                http_methods,
+                payload
+            )
 
-        # Step 4: Configure integrations
-        print("\n[STEP 4] Configuring integrations...")
-        integration_result = api_gateway_operations.configure_integrations(
-            api_id,
-            final_resource_id,
-            http_methods,
-            payload
-        )
+            if not methods_result["success"]:
+                if methods_result["step"] == "create_methods":
+                    steps.append({
+                        "name": "create_methods",
+                        "status": "failed"
+                    })
+                    error_code = "METHOD_CREATION_FAILED"
+                else:
+                    steps.append({
+                        "name": "create_methods",
+                        "status": "ok",
+                        "count": len(http_methods)
+                    })
+                    steps.append({
+                        "name": "configure_integrations",
+                        "status": "failed"
+                    })
+                    error_code = "INTEGRATION_FAILED"
+                return response_builder.error_response(
+                    methods_result["error"],
+                    error_code,
+                    steps
+                )
 
-        if not integration_result["success"]:
+            steps.append({
+                "name": "create_methods",
+                "status": "ok",
+                "count": len(http_methods)
+            })
             steps.append({
                 "name": "configure_integrations",
-                "status": "failed"
+                "status": "ok"
             })
-            return response_builder.error_response(
-                integration_result["error"],
-                "INTEGRATION_FAILED",
-                steps
-            )
-
-        steps.append({
-            "name": "configure_integrations",
-            "status": "ok"
-        })
-        print(f"  ✓ Integrations configured")
+            logger.info("  ✓ Methods created: %d", len(http_methods))
+            logger.info("  ✓ Integrations configured")
 
-        # Step 5: Create CORS (OPTIONS method)
-        print("\n[STEP 5] Creating CORS configuration...")
-        cors_result = api_gateway_operations.create_cors_method(
-            api_id,
-            final_resource_id,
-            payload.get("cors", {})
-        )
+            # Step 5: Create CORS (OPTIONS method)
+            logger.info("[STEP 5] Creating CORS configuration...")
+            cors_result = cors_future.result()
 
         if not cors_result["success"]:
             steps.append({
@@ -214,38 +240,40 @@ def _create_endpoint(payload):
                 "status": "failed"
             })
             # CORS failure is not critical, continue
-            print(f"  ⚠ CORS creation failed (non-critical): {cors_result.get('error')}")
+            logger.warning("  ⚠ CORS creation failed (non-critical): %s", cors_result.get('error'))
         else:
             steps.append({
                 "name": "create_cors",
                 "status": "ok"
             })
-            print(f"  ✓ CORS configured")
+            logger.info("  ✓ CORS configured")
+
+        # Step 6: Verify integrations (opt-in: the put_* calls above already
+        # failed the request if an integration couldn't be configured)
+        if payload.get("verify", False):
+            logger.info("[STEP 6] Verifying integrations...")
+            verify_result = api_gateway_operations.verify_integrations(
+                api_id,
+                final_resource_id,
+                http_methods + ["OPTIONS"]
+            )
 
-        # Step 6: Verify integrations
-        print("\n[STEP 6] Verifying integrations...")
-        verify_result = api_gateway_operations.verify_integrations(
-            api_id,
-            final_resource_id,
-            http_methods + ["OPTIONS"]
-        )
+            if not verify_result["success"]:
+                steps.append({
+                    "name": "verify",
+                    "status": "failed"
+                })
+                return response_builder.error_response(
+                    "Integration verification failed",
+                    "VERIFICATION_FAILED",
+                    steps
+                )
 
-        if not verify_result["success"]:
             steps.append({
                 "name": "verify",
-                "status": "failed"
+                "status": "ok"
             })
-            return response_builder.error_response(
-                "Integration verification failed",
-                "VERIFICATION_FAILED",
-                steps
-            )
-
-        steps.append({
-            "name": "verify",
-            "status": "ok"
-        })
-        print(f"  ✓ All integrations verified")
+            logger.info("  ✓ All integrations verified")
 
         # Success response
         warnings = []
@@ -259,9 +287,7 @@ def _create_endpoint(payload):
         )
 
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"ERROR in _create_endpoint: {str(e)}")
-        print(f"Traceback:\n{error_trace}")
+        logger.exception("ERROR in _create_endpoint: %s", e)
 
         steps.append({
             "name": "error",
@@ -275,6 +301,61 @@ def _create_endpoint(payload):
         )
 
 
+def _create_endpoints(payload):
+    """
+    Create several API Gateway endpoints in a single invocation.
+
+    Endpoints are created one after another: they usually share parent
+    resources on the same API, and the resource map cached by
+    api_gateway_operations is reused between them.
+
+    Args:
+        payload: Validated JSON payload with an "endpoints" list
+
+    Returns:
+        Response with the result of each endpoint, in order
+    """
+    endpoints = payload["endpoints"]
+    logger.info("[CREATE ENDPOINTS] Processing %d endpoints...", len(endpoints))
+
+    results = [
+        json.loads(_create_endpoint(endpoint_payload)["body"])
+        for endpoint_payload in endpoints
+    ]
+
+    return response_builder.batch_response(results)
+
+
+@lru_cache(maxsize=None)
+def _serialized_header_options(filter_param):
+    """
+    Serialize the options for a filter once per container.
+
+    The options are static, so the JSON body is reused by warm invocations.
+    filter_param is one of the values accepted by the validator.
+
+    Args:
+        filter_param: Options filter (all, auth_headers, cors_headers, integration_config)
+
+    Returns:
+        Tuple of (JSON body, number of option categories)
+    """
+    if filter_param == "auth_headers":
+        options = {"auth_headers": header_options.get_auth_headers_options()}
+    elif filter_param == "cors_headers":
+        options = {"cors_headers": header_options.get_cors_headers_options()}
+    elif filter_param == "integration_config":
+        options = {"integration_config": header_options.get_integration_config_options()}
+    else:
+        options = header_options.get_all_options()
+
+    body = response_builder.to_json({
+        "success": True,
+        "options": options
+    })
+    return body, len(options)
+
+
 def _get_header_options(payload):
     """
     Get available header and configuration options.
@@ -285,37 +366,21 @@ def _get_header_options(payload):
     Returns:
         Response with available options
     """
-    print("\n[GET HEADER OPTIONS] Processing request...")
+    logger.info("[GET HEADER OPTIONS] Processing request...")
 
     try:
-        filter_param = payload.get("filter", "all")
-
-        if filter_param == "auth_headers":
-            options = {"auth_headers": header_options.get_auth_headers_options()}
-        elif filter_param == "cors_headers":
-            options = {"cors_headers": header_options.get_cors_headers_options()}
-        elif filter_param == "integration_config":
-            options = {"integration_config": header_options.get_integration_config_options()}
-        else:
-            options = header_options.get_all_options()
+        body, category_count = _serialized_header_options(payload.get("filter", "all"))
 
-        print(f"  ✓ Returned {len(options)} option categories")
+        logger.info("  ✓ Returned %d option categories", category_count)
 
         return {
             "statusCode": 200,
-            "body": json.dumps({
-                "success": True,
-                "options": options
-            }),
-            "headers": {
-                "Content-Type": "application/json"
-            }
+            "body": body,
+            "headers": response_builder.JSON_HEADERS
         }
 
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"ERROR in _get_header_options: {str(e)}")
-        print(f"Traceback:\n{error_trace}")
+        logger.exception("ERROR in _get_header_options: %s", e)
 
         return response_builder.error_response(
             str(e),
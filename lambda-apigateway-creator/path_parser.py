@@ -6,9 +6,19 @@ Handles parsing and validation of URI paths.
 import re
 
 
+# {param} placeholder in a path; group 1 is the parameter name
+PATH_PARAMETER_RE = re.compile(r'\{(\w+)\}')
+
+# Punctuation allowed in a path besides word characters; deleting it with
+# str.translate leaves only what str.isalnum (the \w class) has to accept
+_PATH_PUNCTUATION_TABLE = str.maketrans('', '', '_-/{}')
+
+
 class PathParser:
     """Parse and validate API Gateway resource paths."""
 
+    __slots__ = ('path', 'segments', '_parameters', '_valid')
+
     def __init__(self, path):
         """
         Initialize path parser.
@@ -18,6 +28,9 @@ class PathParser:
         """
         self.path = path
         self.segments = self._parse_segments()
+        # The path doesn't change after __init__, so it is scanned only once
+        self._parameters = PATH_PARAMETER_RE.findall(path)
+        self._valid = self._check_valid()
 
     def _parse_segments(self):
         """
@@ -48,7 +61,7 @@ class PathParser:
         Returns:
             True if path has {param} placeholders
         """
-        return bool(re.search(r'\{\w+\}', self.path))
+        return bool(self._parameters)
 
     def get_parameters(self):
         """
@@ -57,12 +70,21 @@ class PathParser:
         Returns:
             List of parameter names
         """
-        return re.findall(r'\{(\w+)\}', self.path)
+        return self._parameters
 
     def is_valid(self):
         """
         Validate path format.
 
+        Returns:
+            True if path is valid
+        """
+        return self._valid
+
+    def _check_valid(self):
+        """
+        Validate path format.
+
         Returns:
             True if path is valid
         """
@@ -72,8 +94,12 @@ class PathParser:
         if not self.path.startswith('/'):
             return False
 
-        # Check for invalid characters
-        if not re.match(r'^/[\w\-/{}]+$', self.path):
+        # Check for invalid characters: word characters, '-', '/', '{' and '}'
+        if len(self.path) < 2:
+            return False
+
+        rest = self.path.translate(_PATH_PUNCTUATION_TABLE)
+        if rest and not rest.isalnum():
             return False
 
         return True
@@ -5,6 +5,33 @@ Constructs standardized JSON responses.
 """
 import json
 
+try:
+    # orjson is optional (not in requirements.txt); used when bundled
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Headers of every response, shared instead of rebuilt per call. A plain dict
+# (not a MappingProxyType) because the Lambda runtime serializes the response
+# with json; it must not be modified.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def to_json(body):
+    """
+    Serialize a response body as compact UTF-8 JSON.
+
+    Args:
+        body: JSON-serializable response body
+
+    Returns:
+        JSON string without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(body).decode("utf-8")
+    return json.dumps(body, separators=(',', ':'), ensure_ascii=False)
+
 
 def success_response(resource_id, steps, warnings=None):
     """
@@ -30,10 +57,31 @@ def success_response(resource_id, steps, warnings=None):
 
     return {
         "statusCode": 200,
-        "body": json.dumps(body),
-        "headers": {
-            "Content-Type": "application/json"
-        }
+        "body": to_json(body),
+        "headers": JSON_HEADERS
+    }
+
+
+def batch_response(results):
+    """
+    Build the response of a batch of endpoint creations.
+
+    Args:
+        results: Response body of each endpoint, in request order
+
+    Returns:
+        Lambda response dict (200 only if every endpoint succeeded)
+    """
+    success = all(result.get("success") for result in results)
+    body = {
+        "success": success,
+        "results": results
+    }
+
+    return {
+        "statusCode": 200 if success else 400,
+        "body": to_json(body),
+        "headers": JSON_HEADERS
     }
 
 
@@ -57,12 +105,10 @@ def error_response(error_message, error_code, steps=None):
 
     if steps:
         body["steps"] = steps
-        body["failed_step"] = steps[-1]["name"] if steps else None
+        body["failed_step"] = steps[-1].get("name")
 
     return {
         "statusCode": 400,
-        "body": json.dumps(body),
-        "headers": {
-            "Content-Type": "application/json"
-        }
+        "body": to_json(body),
+        "headers": JSON_HEADERS
     }
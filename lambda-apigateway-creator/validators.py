@@ -3,6 +3,26 @@ Input validators for Lambda payload.
 
 Validates JSON payload structure and required fields.
 """
+from types import MappingProxyType
+
+
+# Result of every successful validation: shared (and read-only) instead of a
+# new dict per request
+_VALID = MappingProxyType({"valid": True})
+
+
+# create_endpoint sections and their required fields, checked in this order
+_CREATE_ENDPOINT_SCHEMA = (
+    ("config", ("api_id",)),
+    ("endpoint", ("full_backend_path", "api_gateway_path", "http_methods")),
+    ("integration", ("connection_variable", "backend_host")),
+)
+
+_VALID_HTTP_METHODS = frozenset(["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD"])
+
+_VALID_AUTH_METHODS = frozenset(["AUTHORIZER", "API_KEY"])
+
+_VALID_FILTERS = frozenset(["auth_headers", "cors_headers", "integration_config", "all"])
 
 
 def validate_payload(payload):
@@ -20,17 +40,12 @@ def validate_payload(payload):
         return {"valid": False, "error": "Missing 'operation' field"}
 
     operation = payload["operation"]
-    valid_operations = ["create_endpoint", "get_header_options"]
-    if operation not in valid_operations:
+    validator = _OPERATION_VALIDATORS.get(operation) if isinstance(operation, str) else None
+    if validator is None:
         return {"valid": False, "error": f"Invalid operation: {operation}"}
 
     # Validate based on operation
-    if operation == "create_endpoint":
-        return _validate_create_endpoint(payload)
-    elif operation == "get_header_options":
-        return _validate_get_header_options(payload)
-
-    return {"valid": True}
+    return validator(payload)
 
 
 def _validate_create_endpoint(payload):
@@ -44,33 +59,26 @@ def _validate_create_endpoint(payload):
         Validation result
     """
     # Required sections
-    required_sections = ["config", "endpoint", "integration"]
-
-    for section in required_sections:
+    for section, _ in _CREATE_ENDPOINT_SCHEMA:
         if section not in payload:
             return {"valid": False, "error": f"Missing '{section}' section"}
 
-    # Validate config section
-    config = payload["config"]
-    if "api_id" not in config:
-        return {"valid": False, "error": "Missing 'config.api_id'"}
+    # Required fields of each section
+    for section, fields in _CREATE_ENDPOINT_SCHEMA:
+        values = payload[section]
+        for field in fields:
+            if field not in values:
+                return {"valid": False, "error": f"Missing '{section}.{field}'"}
 
-    # Validate endpoint section
     endpoint = payload["endpoint"]
-    required_endpoint_fields = ["full_backend_path", "api_gateway_path", "http_methods"]
-
-    for field in required_endpoint_fields:
-        if field not in endpoint:
-            return {"valid": False, "error": f"Missing 'endpoint.{field}'"}
 
     # Validate HTTP methods
     http_methods = endpoint["http_methods"]
     if not isinstance(http_methods, list) or len(http_methods) == 0:
         return {"valid": False, "error": "http_methods must be a non-empty list"}
 
-    valid_methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD"]
     for method in http_methods:
-        if method not in valid_methods:
+        if not _is_one_of(method, _VALID_HTTP_METHODS):
             return {"valid": False, "error": f"Invalid HTTP method: {method}"}
 
     # Validate paths
@@ -80,26 +88,21 @@ def _validate_create_endpoint(payload):
     if not endpoint["api_gateway_path"].startswith("/"):
         return {"valid": False, "error": "api_gateway_path must start with /"}
 
-    # Validate integration section
-    integration = payload["integration"]
-    required_integration_fields = ["connection_variable", "backend_host"]
-
-    for field in required_integration_fields:
-        if field not in integration:
-            return {"valid": False, "error": f"Missing 'integration.{field}'"}
+    # Optional post-creation verification flag
+    if "verify" in payload and not isinstance(payload["verify"], bool):
+        return {"valid": False, "error": "verify must be a boolean"}
 
     # Validate authentication section (optional but if present, validate)
     if "authentication" in payload:
         auth = payload["authentication"]
         if "method" in auth:
-            valid_auth_methods = ["AUTHORIZER", "API_KEY"]
-            if auth["method"] not in valid_auth_methods:
+            if not _is_one_of(auth["method"], _VALID_AUTH_METHODS):
                 return {"valid": False, "error": f"Invalid auth method: {auth['method']}"}
 
             if auth["method"] == "AUTHORIZER" and "authorizer_id" not in auth:
                 return {"valid": False, "error": "authorizer_id required for AUTHORIZER method"}
 
-    return {"valid": True}
+    return _VALID
 
 
 def _validate_get_header_options(payload):
@@ -115,9 +118,55 @@ def _validate_get_header_options(payload):
     # Optional filter parameter
     if "filter" in payload:
         filter_param = payload["filter"]
-        valid_filters = ["auth_headers", "cors_headers", "integration_config", "all"]
-
-        if filter_param not in valid_filters:
+        if not _is_one_of(filter_param, _VALID_FILTERS):
             return {"valid": False, "error": f"Invalid filter: {filter_param}"}
 
-    return {"valid": True}
+    return _VALID
+
+
+def _validate_create_endpoints(payload):
+    """
+    Validate create_endpoints payload (several create_endpoint payloads).
+
+    Args:
+        payload: JSON payload
+
+    Returns:
+        Validation result
+    """
+    endpoints = payload.get("endpoints")
+    if not isinstance(endpoints, list) or len(endpoints) == 0:
+        return {"valid": False, "error": "endpoints must be a non-empty list"}
+
+    for index, endpoint_payload in enumerate(endpoints):
+        if not isinstance(endpoint_payload, dict):
+            return {"valid": False, "error": f"endpoints[{index}] must be an object"}
+
+        result = _validate_create_endpoint(endpoint_payload)
+        if not result["valid"]:
+            return {"valid": False, "error": f"endpoints[{index}]: {result['error']}"}
+
+    return _VALID
+
+
+# Validator of each supported operation, resolved with a single lookup
+_OPERATION_VALIDATORS = {
+    "create_endpoint": _validate_create_endpoint,
+    "create_endpoints": _validate_create_endpoints,
+    "get_header_options": _validate_get_header_options,
+}
+
+
+def _is_one_of(value, allowed):
+    """
+    Check a value against a set of allowed strings.
+
+    Args:
+        value: Value from the payload (any JSON type)
+        allowed: frozenset of allowed strings
+
+    Returns:
+        True if value is one of the allowed strings
+    """
+    # Lists or objects from the JSON can't be hashed for the set lookup
+    return isinstance(value, str) and value in allowed
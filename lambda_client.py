@@ -3,14 +3,73 @@ Lambda Client for API Gateway Creator.
 
 Handles communication with the Lambda function for write operations.
 """
+import importlib.util
 import json
+import math
+import os
 import subprocess
-from typing import Dict, Any, Optional
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import Callable, Dict, Any, List, Optional
 
-from common import get_logger
+from common import get_logger, DEFAULT_CACHE_TTL_SECONDS, USE_AWS_CLI_ENV_VAR
+
+try:
+    # orjson is optional: faster (de)serialization of payloads and responses
+    from orjson import dumps as json_dumps_bytes, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 logger = get_logger(__name__)
 
+# Without boto3 (or with APIGW_USE_AWS_CLI=1) the AWS CLI is used instead,
+# one process per invocation
+_USE_BOTO3 = (
+    importlib.util.find_spec("boto3") is not None
+    and os.environ.get(USE_AWS_CLI_ENV_VAR) != "1"
+)
+
+# Fail fast on unreachable endpoints; the read timeout stays above the
+# function's own 120 s timeout (template.yml) so slow creations aren't cut off
+_CONNECT_TIMEOUT_SECONDS = 5
+_READ_TIMEOUT_SECONDS = 125
+
+# boto3 Lambda clients by region, shared by every LambdaClient in the process
+_boto3_clients: Dict[str, Any] = {}
+_boto3_clients_lock = threading.Lock()
+
+# Upper bound for concurrent invocations: one pooled connection per worker
+_MAX_POOL_CONNECTIONS = 32
+
+# Endpoints per create_endpoints invocation: the function creates them one
+# after another and has to finish within its 120 s timeout (template.yml)
+_MAX_ENDPOINTS_PER_INVOCATION = 8
+
+
+def _quiet(message: str, *args: Any) -> None:
+    """Log sink for background calls whose failure is reported by the caller."""
+
+
+def _map_concurrently(
+    function: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    items: List[Dict[str, Any]],
+    max_workers: int
+) -> List[Optional[Dict[str, Any]]]:
+    """Apply function to every item on a thread pool, keeping item order."""
+    if not items:
+        return []
+
+    sys.stdout.flush()  # console is line-buffered; flushes progress when stdout is redirected
+    workers = max(1, min(max_workers, _MAX_POOL_CONNECTIONS, len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
 
 class LambdaClient:
     """Client for invoking Lambda function."""
@@ -25,87 +84,233 @@ class LambdaClient:
         """
         self.function_name = function_name
         self.region = region
+        # All option categories, fetched by get_header_options and reused
+        # until _options_expires_at (monotonic clock)
+        self._options: Optional[Dict[str, Any]] = None
+        self._options_expires_at = 0.0
+        self._options_lock = threading.Lock()
+
+    @cached_property
+    def _boto3_client(self) -> Any:
+        """
+        boto3 Lambda client shared by every invocation in the region.
 
-    def invoke(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        Reusing it keeps credentials and HTTPS connections alive between calls
+        (including concurrent batch invocations and other LambdaClient
+        instances) instead of paying a process start and TLS handshake each time.
+        """
+        with _boto3_clients_lock:
+            client = _boto3_clients.get(self.region)
+            if client is None:
+                import boto3
+                from botocore.config import Config
+
+                client = boto3.client(
+                    "lambda",
+                    region_name=self.region,
+                    config=Config(
+                        max_pool_connections=_MAX_POOL_CONNECTIONS,
+                        tcp_keepalive=True,
+                        connect_timeout=_CONNECT_TIMEOUT_SECONDS,
+                        read_timeout=_READ_TIMEOUT_SECONDS,
+                        retries={"max_attempts": 3},
+                    ),
+                )
+                _boto3_clients[self.region] = client
+            return client
+
+    def invoke(self, payload: Dict[str, Any], log_errors: bool = True) -> Optional[Dict[str, Any]]:
         """
         Invoke Lambda function with payload.
 
         Args:
             payload: JSON payload to send
+            log_errors: If False, nothing is logged (the caller reports failures)
 
         Returns:
             Response from Lambda or None if error
         """
+        log_debug, log_error = (logger.debug, logger.error) if log_errors else (_quiet, _quiet)
         try:
-            payload_json = json.dumps(payload)
+            payload_json = json_dumps_bytes(payload)
+
+            log_debug("Invoking Lambda: %s", self.function_name)
+            sys.stdout.flush()  # console is line-buffered; flushes progress when stdout is redirected
+
+            if _USE_BOTO3:
+                raw_response = self._invoke_boto3(payload_json)
+            else:
+                raw_response = self._invoke_cli(payload_json, log_error)
+
+            if raw_response is None:
+                return None
+
+            response = json_loads(raw_response)
+
+            # Parse body if it's a string
+            if "body" in response and isinstance(response["body"], str):
+                response["body"] = json_loads(response["body"])
+
+            return response
+
+        except json.JSONDecodeError as e:
+            log_error("Error parsing Lambda response: %s", e)
+            return None
+        except Exception as e:
+            log_error("Error invoking Lambda: %s", e)
+            return None
+
+    def invoke_many(
+        self,
+        payloads: List[Dict[str, Any]],
+        max_workers: int = _MAX_POOL_CONNECTIONS
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Invoke Lambda function once per payload, concurrently.
+
+        Args:
+            payloads: JSON payloads to send
+            max_workers: Maximum concurrent invocations (capped to the pool size)
+
+        Returns:
+            Responses in payload order (None for failed invocations)
+        """
+        return _map_concurrently(self.invoke, payloads, max_workers)
+
+    def _invoke_boto3(self, payload_json: bytes) -> bytes:
+        """
+        Invoke the function through the shared boto3 client.
 
-            # Use AWS CLI to invoke Lambda
+        Args:
+            payload_json: Serialized payload
+
+        Returns:
+            Raw response payload
+        """
+        result = self._boto3_client.invoke(
+            FunctionName=self.function_name,
+            Payload=payload_json
+        )
+        return result["Payload"].read()
+
+    def _invoke_cli(
+        self,
+        payload_json: bytes,
+        log_error: Callable[..., None] = logger.error
+    ) -> Optional[bytes]:
+        """
+        Invoke the function through the AWS CLI (fallback without boto3).
+
+        Args:
+            payload_json: Serialized payload
+            log_error: Where CLI failures are reported
+
+        Returns:
+            Raw response payload or None if the CLI failed
+        """
+        import tempfile  # only needed once a Lambda call is actually made
+
+        # One response file per invocation so concurrent calls don't clobber each other
+        fd, response_path = tempfile.mkstemp(prefix="lambda_response_", suffix=".json")
+        os.close(fd)
+        try:
             command = [
                 "aws", "lambda", "invoke",
                 "--function-name", self.function_name,
                 "--region", self.region,
-                "--payload", payload_json,
+                "--payload", payload_json.decode("utf-8"),
                 "--cli-binary-format", "raw-in-base64-out",
-                "/tmp/lambda_response.json"
+                "--cli-connect-timeout", str(_CONNECT_TIMEOUT_SECONDS),
+                "--cli-read-timeout", str(_READ_TIMEOUT_SECONDS),
+                response_path
             ]
 
-            logger.debug(f"Invoking Lambda: {self.function_name}")
-
+            # Only stderr is used (on failure): the CLI's stdout metadata is discarded
             result = subprocess.run(
                 command,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=False
             )
 
             if result.returncode != 0:
-                logger.error(f"Lambda invocation failed: {result.stderr}")
+                log_error("Lambda invocation failed: %s", result.stderr.decode("utf-8", "replace"))
                 return None
 
             # Read response from temp file
-            with open("/tmp/lambda_response.json", 'r') as f:
-                response = json.load(f)
-
-            # Parse body if it's a string
-            if "body" in response and isinstance(response["body"], str):
-                response["body"] = json.loads(response["body"])
+            with open(response_path, 'rb') as f:
+                return f.read()
+        finally:
+            os.unlink(response_path)
 
-            return response
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing Lambda response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error invoking Lambda: {e}")
-            return None
-
-    def get_header_options(self, filter_type: str = "all") -> Optional[Dict[str, Any]]:
+    def get_header_options(self, filter_type: str = "all", log_errors: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get available header options from Lambda.
 
+        Every category is requested in a single invocation and cached on the
+        client for DEFAULT_CACHE_TTL_SECONDS; calls within that time are
+        served without invoking Lambda. Failed invocations are not cached.
+
         Args:
             filter_type: Type of options to get (all, auth_headers, cors_headers, integration_config)
+            log_errors: If False, failures are only reported through the None result
 
         Returns:
             Dictionary with available options or None
         """
-        payload = {
-            "operation": "get_header_options",
-            "filter": filter_type
-        }
+        # The lock makes callers wait for an in-flight prefetch instead of re-invoking
+        with self._options_lock:
+            if self._options is None or time.monotonic() >= self._options_expires_at:
+                payload = {
+                    "operation": "get_header_options",
+                    "filter": "all"
+                }
 
-        response = self.invoke(payload)
+                response = self.invoke(payload, log_errors)
 
-        if not response:
-            return None
+                if not response:
+                    return None
 
-        body = response.get("body", {})
+                body = response.get("body", {})
 
-        if not body.get("success"):
-            logger.error(f"Lambda returned error: {body.get('error')}")
-            return None
+                if not body.get("success"):
+                    if log_errors:
+                        logger.error("Lambda returned error: %s", body.get('error'))
+                    return None
 
-        return body.get("options", {})
+                self._options = body.get("options", {})
+                self._options_expires_at = time.monotonic() + DEFAULT_CACHE_TTL_SECONDS
+
+            options = self._options
+
+        if filter_type == "all":
+            return options
+
+        if filter_type not in options:
+            return {}
+
+        return {filter_type: options[filter_type]}
+
+    def invalidate_options_cache(self) -> None:
+        """Discard cached header options so the next call invokes Lambda again."""
+        with self._options_lock:
+            self._options = None
+
+    def prefetch_options(self) -> "Future[Optional[Dict[str, Any]]]":
+        """
+        Start fetching header options in the background.
+
+        Lets the Lambda round-trip overlap with interactive menus; later
+        get_header_options calls reuse the cached result. Nothing is logged
+        meanwhile so the menus stay clean: failures surface as a None result.
+
+        Returns:
+            Future resolving to all option categories (None if the call failed)
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.get_header_options, "all", log_errors=False)
+        executor.shutdown(wait=False)
+        return future
 
     def create_endpoint(self, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -131,6 +336,60 @@ class LambdaClient:
 
         return body
 
+    def create_endpoints(
+        self,
+        configs: List[Dict[str, Any]],
+        max_workers: int = _MAX_POOL_CONNECTIONS
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several API Gateway endpoints via concurrent Lambda invocations.
+
+        Args:
+            configs: Complete endpoint configurations
+            max_workers: Maximum concurrent invocations (capped to the pool size)
+
+        Returns:
+            Response bodies in config order (None for failed invocations)
+        """
+        return _map_concurrently(self.create_endpoint, configs, max_workers)
+
+    def fanout_create_endpoints(
+        self,
+        configs: List[Dict[str, Any]],
+        max_workers: int = _MAX_POOL_CONNECTIONS
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several API Gateway endpoints grouped into fewer invocations.
+
+        The configs are split into about sqrt(N) groups (at most
+        _MAX_ENDPOINTS_PER_INVOCATION endpoints each); every group is sent
+        as one create_endpoints invocation and the groups run concurrently.
+
+        Args:
+            configs: Complete endpoint configurations
+            max_workers: Maximum concurrent invocations (capped to the pool size)
+
+        Returns:
+            Response bodies in config order (None for failed invocations)
+        """
+        if not configs:
+            return []
+
+        group_size = min(math.isqrt(len(configs) - 1) + 1, _MAX_ENDPOINTS_PER_INVOCATION)
+        groups = [configs[i:i + group_size] for i in range(0, len(configs), group_size)]
+        payloads = [{"operation": "create_endpoints", "endpoints": group} for group in groups]
+
+        bodies = []
+        for group, response in zip(groups, self.invoke_many(payloads, max_workers)):
+            body = response.get("body") if response else None
+            if isinstance(body, dict) and isinstance(body.get("results"), list):
+                bodies += body["results"]
+            else:
+                # The whole invocation failed: same outcome for every endpoint
+                bodies += [body or None] * len(group)
+
+        return bodies
+
 
 def get_lambda_function_name() -> str:
     """
@@ -139,8 +398,6 @@ def get_lambda_function_name() -> str:
     Returns:
         Lambda function name
     """
-    import os
-
     # Check environment variable first
     function_name = os.environ.get("LAMBDA_FUNCTION_NAME")
 
@@ -152,8 +409,9 @@ def get_lambda_function_name() -> str:
     return "apigateway-resource-creator-ci"
 
 
-# Global instance
+# Global instance (the options prefetch may ask for it from another thread)
 _lambda_client: Optional[LambdaClient] = None
+_lambda_client_lock = threading.Lock()
 
 
 def get_lambda_client() -> LambdaClient:
@@ -165,9 +423,10 @@ def get_lambda_client() -> LambdaClient:
     """
     global _lambda_client
 
-    if _lambda_client is None:
-        function_name = get_lambda_function_name()
-        _lambda_client = LambdaClient(function_name)
-        logger.debug(f"Lambda client initialized: {function_name}")
+    with _lambda_client_lock:
+        if _lambda_client is None:
+            function_name = get_lambda_function_name()
+            _lambda_client = LambdaClient(function_name)
+            logger.debug("Lambda client initialized: %s", function_name)
 
     return _lambda_client